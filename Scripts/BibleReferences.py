@@ -0,0 +1,568 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# BibleReferences.py
+#
+# Module handling conversion of Bible book codes and references to our BOS forms
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+GitHub@gmail.com>
+#
+# License: CC0 1.0 Universal (CC0 1.0) Public Domain Dedication
+#
+#   This is a human-readable summary of the Legal Code
+#
+#   No Copyright
+#
+#   The person who associated a work with this deed has dedicated the work to the public domain
+#       by waiving all of his or her rights to the work worldwide under copyright law,
+#       including all related and neighboring rights, to the extent allowed by law.
+#
+#   You can copy, modify, distribute and perform the work, even for commercial purposes,
+#       all without asking permission. See Other Information below.
+#
+#   Other Information
+#
+#   In no way are the patent or trademark rights of any person affected by CC0,
+#       nor are the rights that other persons may have in the work or in how the work is used,
+#       such as publicity or privacy rights.
+#    Unless expressly stated otherwise, the person who associated a work with this deed makes no
+#       warranties about the work, and disclaims liability for all uses of the work,
+#       to the fullest extent permitted by applicable law.
+#    When using or citing the work, you should not imply endorsement by the author or the affirmer.
+#
+#   You should have received a copy of the formal licence text
+#   along with this program.  If not, see <https://CreativeCommons.org/publicdomain/zero/1.0/>.
+#
+"""
+Module to convert the various Bible book codes and verse references
+    used in our source datasets to our own BOS forms.
+
+The Tyndale (TIPNR) data uses Title-case forms of USFM bookcodes, e.g., '1Co.1.14',
+the Glyssen data uses UPPERCASE USFM bookcodes, e.g., '1CO',
+and the Theographic data uses OSIS, e.g., '1Cor.1.14'.
+We convert them all to our own BOS books codes (always three characters, always UPPERCASE,
+    always start with a letter) and BBB_C:V references, e.g., 'CO1_1:14'.
+
+The book code lookups are all precomputed dicts,
+    and converted references are remembered (because the same references
+    occur many times across the entries), so converting a reference is usually just one dict hit.
+
+References can also be packed into a single (32-bit) integer verse key:
+    bits 24-31 book number (1..66), bits 16-23 chapter, bits 8-15 verse,
+    bits 2-6 any (TIPNR) partial verse suffix letter (0=none, 1=a, 2=b, …),
+    bits 0-1 any enclosing brackets (0=none, 1=[], 2=()).
+So sorting the keys puts the references into Biblical order,
+    and lists of them can be stored compactly in array('I')
+    and only rendered back to BBB_C:V strings when we export.
+
+We also have a built-in versification table (the number of verses in each chapter)
+    so that we can warn about out-of-range references as we convert them,
+    and so that each verse has a dense ordinal number (0..31,101)
+    which can be used to index arrays (or bitmaps) of verse data.
+
+Contains functions:
+    convert_book_code( bookCode:str, referenceFormat:str ) -> str
+    convert_reference( ref:str, referenceFormat:str ) -> str
+    convert_references( ref_list:List[str], referenceFormat:str, packed:bool=False ) -> List[str] or array
+    encode_verse_key( BBB:str, C:int, V:int, suffix:str='', brackets:str='' ) -> int
+    decode_verse_key( verseKey:int ) -> Tuple[str,int,int,str,str]
+    pack_reference( BOSref:str ) -> int
+    render_verse_key( verseKey:int ) -> str
+    render_references( refs ) -> List[str]
+    render_packed_references_for_JSON( obj ) -> List[str]
+    is_valid_verse( BBB:str, C:int, V:int ) -> bool
+    verse_ordinal( BBB:str, C:int, V:int ) -> int
+    ordinal_verse( ordinal:int ) -> Tuple[str,int,int]
+    verse_key_ordinal( verseKey:int ) -> int
+    ordinal_verse_key( ordinal:int ) -> int
+"""
+from gettext import gettext as _
+from typing import Dict, List, Tuple, Union, Optional
+from array import array
+from collections.abc import Set
+import re
+import logging
+
+import BibleOrgSysGlobals
+from BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+
+
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
+SHORT_PROGRAM_NAME = "BibleReferences"
+PROGRAM_NAME = "Bible book code and reference conversions"
+PROGRAM_VERSION = '0.15'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+# NOTE: USFM books codes at https://ubsicap.github.io/usfm/master/identification/books.html
+#           are all UPPERCASE but TIPNR uses a Title-case form
+Uuu_BOOK_ID_MAP = {
+            1: 'Gen', 2: 'Exo', 3: 'Lev', 4: 'Num', 5: 'Deu',
+            6: 'Jos', 7: 'Jdg', 8: 'Rut', 9: '1Sa', 10: '2Sa',
+            11: '1Ki', 12: '2Ki', 13: '1Ch', 14: '2Ch', 15: 'Ezr', 16: 'Neh', 17: 'Est', 18: 'Job',
+            19: 'Psa', 20: 'Pro', 21: 'Ecc', 22: 'Sng', 23: 'Isa', 24: 'Jer', 25: 'Lam',
+            26: 'Ezk', 27: 'Dan', 28: 'Hos', 29: 'Jol', 30: 'Amo', 31: 'Oba',
+            32: 'Jon', 33: 'Mic', 34: 'Nam', 35: 'Hab', 36: 'Zep', 37: 'Hag', 38: 'Zec', 39: 'Mal',
+            40: 'Mat', 41: 'Mrk', 42: 'Luk', 43: 'Jhn', 44: 'Act',
+            45: 'Rom', 46: '1Co', 47: '2Co', 48: 'Gal', 49: 'Eph', 50: 'Php', 51: 'Col', 52: '1Th', 53: '2Th', 54: '1Ti', 55: '2Ti', 56: 'Tit', 57: 'Phm',
+            58: 'Heb', 59: 'Jas', 60: '1Pe', 61: '2Pe', 62: '1Jn', 63: '2Jn', 64: '3Jn', 65: 'Jud', 66: 'Rev'}
+assert len(Uuu_BOOK_ID_MAP) == 66
+UUU_BOOK_ID_MAP = {
+             1: 'GEN',  2: 'EXO',  3: 'LEV',  4: 'NUM',  5: 'DEU',
+             6: 'JOS',  7: 'JDG',  8: 'RUT',  9: '1SA', 10: '2SA',
+            11: '1KI', 12: '2KI', 13: '1CH', 14: '2CH', 15: 'EZR', 16: 'NEH', 17: 'EST', 18: 'JOB',
+            19: 'PSA', 20: 'PRO', 21: 'ECC', 22: 'SNG', 23: 'ISA', 24: 'JER', 25: 'LAM',
+            26: 'EZK', 27: 'DAN', 28: 'HOS', 29: 'JOL', 30: 'AMO', 31: 'OBA',
+            32: 'JON', 33: 'MIC', 34: 'NAM', 35: 'HAB', 36: 'ZEP', 37: 'HAG', 38: 'ZEC', 39: 'MAL',
+            40: 'MAT', 41: 'MRK', 42: 'LUK', 43: 'JHN', 44: 'ACT',
+            45: 'ROM', 46: '1CO', 47: '2CO', 48: 'GAL', 49: 'EPH', 50: 'PHP', 51: 'COL',
+            52: '1TH', 53: '2TH', 54: '1TI', 55: '2TI', 56: 'TIT', 57: 'PHM',
+            58: 'HEB', 59: 'JAS', 60: '1PE', 61: '2PE', 62: '1JN', 63: '2JN', 64: '3JN', 65: 'JUD', 66: 'REV'}
+assert len(UUU_BOOK_ID_MAP) == 66
+OSIS_BOOK_ID_MAP = {
+            1: 'Gen', 2: 'Exod', 3: 'Lev', 4: 'Num', 5: 'Deut',
+            6: 'Josh', 7: 'Judg', 8: 'Ruth', 9: '1Sam', 10: '2Sam',
+            11: '1Kgs', 12: '2Kgs', 13: '1Chr', 14: '2Chr', 15: 'Ezra', 16: 'Neh', 17: 'Esth', 18: 'Job',
+            19: 'Ps', 20: 'Prov', 21: 'Eccl', 22: 'Song', 23: 'Isa', 24: 'Jer', 25: 'Lam',
+            26: 'Ezek', 27: 'Dan', 28: 'Hos', 29: 'Joel', 30: 'Amos', 31: 'Obad',
+            32: 'Jonah', 33: 'Mic', 34: 'Nah', 35: 'Hab', 36: 'Zeph', 37: 'Hag', 38: 'Zech', 39: 'Mal',
+            40: 'Matt', 41: 'Mark', 42: 'Luke', 43: 'John', 44: 'Acts',
+            45: 'Rom', 46: '1Cor', 47: '2Cor', 48: 'Gal', 49: 'Eph', 50: 'Phil', 51: 'Col',
+            52: '1Thess', 53: '2Thess', 54: '1Tim', 55: '2Tim', 56: 'Titus', 57: 'Phlm',
+            58: 'Heb', 59: 'Jas', 60: '1Pet', 61: '2Pet', 62: '1John', 63: '2John', 64: '3John', 65: 'Jude', 66: 'Rev'}
+assert len(OSIS_BOOK_ID_MAP) == 66
+BOS_BOOK_ID_MAP = {
+            1: 'GEN', 2: 'EXO', 3: 'LEV', 4: 'NUM', 5: 'DEU',
+            6: 'JOS', 7: 'JDG', 8: 'RUT', 9: 'SA1', 10: 'SA2',
+            11: 'KI1', 12: 'KI2', 13: 'CH1', 14: 'CH2', 15: 'EZR', 16: 'NEH', 17: 'EST', 18: 'JOB',
+            19: 'PSA', 20: 'PRO', 21: 'ECC', 22: 'SNG', 23: 'ISA', 24: 'JER', 25: 'LAM',
+            26: 'EZK', 27: 'DAN', 28: 'HOS', 29: 'JOL', 30: 'AMO', 31: 'OBA',
+            32: 'JNA', 33: 'MIC', 34: 'NAH', 35: 'HAB', 36: 'ZEP', 37: 'HAG', 38: 'ZEC', 39: 'MAL',
+            40: 'MAT', 41: 'MRK', 42: 'LUK', 43: 'JHN', 44: 'ACT',
+            45: 'ROM', 46: 'CO1', 47: 'CO2', 48: 'GAL', 49: 'EPH', 50: 'PHP', 51: 'COL', 52: 'TH1', 53: 'TH2', 54: '1TI', 55: '2TI', 56: 'TIT', 57: 'PHM',
+            58: 'HEB', 59: 'JAS', 60: 'PE1', 61: 'PE2', 62: 'JN1', 63: 'JN2', 64: 'JN3', 65: 'JDE', 66: 'REV'}
+assert len(BOS_BOOK_ID_MAP) == 66
+
+# Precomputed translation tables from each of the above to our BOS book codes
+BOOK_CODE_TO_BOS_MAPS = {
+    'Uuu': { Uuu_BOOK_ID_MAP[ix]:BOS_BOOK_ID_MAP[ix] for ix in BOS_BOOK_ID_MAP }, # TIPNR
+    'UUU': { UUU_BOOK_ID_MAP[ix]:BOS_BOOK_ID_MAP[ix] for ix in BOS_BOOK_ID_MAP }, # Glyssen
+    'OSIS': { OSIS_BOOK_ID_MAP[ix]:BOS_BOOK_ID_MAP[ix] for ix in BOS_BOOK_ID_MAP }, # Theographic
+    }
+for _map in BOOK_CODE_TO_BOS_MAPS.values(): assert len(_map) == 66
+BOS_BOOK_NUMBER_MAP = { BBB:ix for ix,BBB in BOS_BOOK_ID_MAP.items() }
+assert len(BOS_BOOK_NUMBER_MAP) == 66
+
+# For packing references into integer verse keys
+VERSE_SUFFIXES = ' abcdefghijklmnopqrstuvwxyz' # Index 0 is no suffix
+VERSE_BRACKETS = ( '', '[]', '()' ) # Index 0 is no brackets
+BOS_REFERENCE_RE = re.compile( r'([\[(]?)([A-Z0-9]{3})_(\d{1,3}):(\d{1,3})([a-z]?)([\])]?)$' )
+assert array('I').itemsize >= 4 # We need 32-bit unsigned ints for our verse keys
+
+# The number of verses in each chapter of each book (KJV versification)
+#   derived from the verse lists in the Theographic normalised_Chapters.json
+VERSE_COUNTS:Dict[str,Tuple[int,...]] = {
+    'GEN': (31, 25, 24, 26, 32, 22, 24, 22, 29, 32, 32, 20, 18, 24, 21, 16, 27, 33, 38, 18, 34, 24, 20, 67, 34,
+            35, 46, 22, 35, 43, 55, 32, 20, 31, 29, 43, 36, 30, 23, 23, 57, 38, 34, 34, 28, 34, 31, 22, 33, 26),
+    'EXO': (22, 25, 22, 31, 23, 30, 25, 32, 35, 29, 10, 51, 22, 31, 27, 36, 16, 27, 25, 26, 36, 31, 33, 18, 40,
+            37, 21, 43, 46, 38, 18, 35, 23, 35, 35, 38, 29, 31, 43, 38),
+    'LEV': (17, 16, 17, 35, 19, 30, 38, 36, 24, 20, 47, 8, 59, 57, 33, 34, 16, 30, 37, 27, 24, 33, 44, 23, 55,
+            46, 34),
+    'NUM': (54, 34, 51, 49, 31, 27, 89, 26, 23, 36, 35, 16, 33, 45, 41, 50, 13, 32, 22, 29, 35, 41, 30, 25, 18,
+            65, 23, 31, 40, 16, 54, 42, 56, 29, 34, 13),
+    'DEU': (46, 37, 29, 49, 33, 25, 26, 20, 29, 22, 32, 32, 18, 29, 23, 22, 20, 22, 21, 20, 23, 30, 25, 22, 19,
+            19, 26, 68, 29, 20, 30, 52, 29, 12),
+    'JOS': (18, 24, 17, 24, 15, 27, 26, 35, 27, 43, 23, 24, 33, 15, 63, 10, 18, 28, 51, 9, 45, 34, 16, 33),
+    'JDG': (36, 23, 31, 24, 31, 40, 25, 35, 57, 18, 40, 15, 25, 20, 20, 31, 13, 31, 30, 48, 25),
+    'RUT': (22, 23, 18, 22),
+    'SA1': (28, 36, 21, 22, 12, 21, 17, 22, 27, 27, 15, 25, 23, 52, 35, 23, 58, 30, 24, 42, 15, 23, 29, 22, 44,
+            25, 12, 25, 11, 31, 13),
+    'SA2': (27, 32, 39, 12, 25, 23, 29, 18, 13, 19, 27, 31, 39, 33, 37, 23, 29, 33, 43, 26, 22, 51, 39, 25),
+    'KI1': (53, 46, 28, 34, 18, 38, 51, 66, 28, 29, 43, 33, 34, 31, 34, 34, 24, 46, 21, 43, 29, 53),
+    'KI2': (18, 25, 27, 44, 27, 33, 20, 29, 37, 36, 21, 21, 25, 29, 38, 20, 41, 37, 37, 21, 26, 20, 37, 20, 30),
+    'CH1': (54, 55, 24, 43, 26, 81, 40, 40, 44, 14, 47, 40, 14, 17, 29, 43, 27, 17, 19, 8, 30, 19, 32, 31, 31,
+            32, 34, 21, 30),
+    'CH2': (17, 18, 17, 22, 14, 42, 22, 18, 31, 19, 23, 16, 22, 15, 19, 14, 19, 34, 11, 37, 20, 12, 21, 27, 28,
+            23, 9, 27, 36, 27, 21, 33, 25, 33, 27, 23),
+    'EZR': (11, 70, 13, 24, 17, 22, 28, 36, 15, 44),
+    'NEH': (11, 20, 32, 23, 19, 19, 73, 18, 38, 39, 36, 47, 31),
+    'EST': (22, 23, 15, 17, 14, 14, 10, 17, 32, 3),
+    'JOB': (22, 13, 26, 21, 27, 30, 21, 22, 35, 22, 20, 25, 28, 22, 35, 22, 16, 21, 29, 29, 34, 30, 17, 25, 6,
+            14, 23, 28, 25, 31, 40, 22, 33, 37, 16, 33, 24, 41, 30, 24, 34, 17),
+    'PSA': (6, 12, 8, 8, 12, 10, 17, 9, 20, 18, 7, 8, 6, 7, 5, 11, 15, 50, 14, 9, 13, 31, 6, 10, 22,
+            12, 14, 9, 11, 12, 24, 11, 22, 22, 28, 12, 40, 22, 13, 17, 13, 11, 5, 26, 17, 11, 9, 14, 20, 23,
+            19, 9, 6, 7, 23, 13, 11, 11, 17, 12, 8, 12, 11, 10, 13, 20, 7, 35, 36, 5, 24, 20, 28, 23, 10,
+            12, 20, 72, 13, 19, 16, 8, 18, 12, 13, 17, 7, 18, 52, 17, 16, 15, 5, 23, 11, 13, 12, 9, 9, 5,
+            8, 28, 22, 35, 45, 48, 43, 13, 31, 7, 10, 10, 9, 8, 18, 19, 2, 29, 176, 7, 8, 9, 4, 8, 5,
+            6, 5, 6, 8, 8, 3, 18, 3, 3, 21, 26, 9, 8, 24, 13, 10, 7, 12, 15, 21, 10, 20, 14, 9, 6),
+    'PRO': (33, 22, 35, 27, 23, 35, 27, 36, 18, 32, 31, 28, 25, 35, 33, 33, 28, 24, 29, 30, 31, 29, 35, 34, 28,
+            28, 27, 28, 27, 33, 31),
+    'ECC': (18, 26, 22, 16, 20, 12, 29, 17, 18, 20, 10, 14),
+    'SNG': (17, 17, 11, 16, 16, 13, 13, 14),
+    'ISA': (31, 22, 26, 6, 30, 13, 25, 22, 21, 34, 16, 6, 22, 32, 9, 14, 14, 7, 25, 6, 17, 25, 18, 23, 12,
+            21, 13, 29, 24, 33, 9, 20, 24, 17, 10, 22, 38, 22, 8, 31, 29, 25, 28, 28, 25, 13, 15, 22, 26, 11,
+            23, 15, 12, 17, 13, 12, 21, 14, 21, 22, 11, 12, 19, 12, 25, 24),
+    'JER': (19, 37, 25, 31, 31, 30, 34, 22, 26, 25, 23, 17, 27, 22, 21, 21, 27, 23, 15, 18, 14, 30, 40, 10, 38,
+            24, 22, 17, 32, 24, 40, 44, 26, 22, 19, 32, 21, 28, 18, 16, 18, 22, 13, 30, 5, 28, 7, 47, 39, 46,
+            64, 34),
+    'LAM': (22, 22, 66, 22, 22),
+    'EZK': (28, 10, 27, 17, 17, 14, 27, 18, 11, 22, 25, 28, 23, 23, 8, 63, 24, 32, 14, 49, 32, 31, 49, 27, 17,
+            21, 36, 26, 21, 26, 18, 32, 33, 31, 15, 38, 28, 23, 29, 49, 26, 20, 27, 31, 25, 24, 23, 35),
+    'DAN': (21, 49, 30, 37, 31, 28, 28, 27, 27, 21, 45, 13),
+    'HOS': (11, 23, 5, 19, 15, 11, 16, 14, 17, 15, 12, 14, 16, 9),
+    'JOL': (20, 32, 21),
+    'AMO': (15, 16, 15, 13, 27, 14, 17, 14, 15),
+    'OBA': (21,),
+    'JNA': (17, 10, 10, 11),
+    'MIC': (16, 13, 12, 13, 15, 16, 20),
+    'NAH': (15, 13, 19),
+    'HAB': (17, 20, 19),
+    'ZEP': (18, 15, 20),
+    'HAG': (15, 23),
+    'ZEC': (21, 13, 10, 14, 11, 15, 14, 23, 17, 12, 17, 14, 9, 21),
+    'MAL': (14, 17, 18, 6),
+    'MAT': (25, 23, 17, 25, 48, 34, 29, 34, 38, 42, 30, 50, 58, 36, 39, 28, 27, 35, 30, 34, 46, 46, 39, 51, 46,
+            75, 66, 20),
+    'MRK': (45, 28, 35, 41, 43, 56, 37, 38, 50, 52, 33, 44, 37, 72, 47, 20),
+    'LUK': (80, 52, 38, 44, 39, 49, 50, 56, 62, 42, 54, 59, 35, 35, 32, 31, 37, 43, 48, 47, 38, 71, 56, 53),
+    'JHN': (51, 25, 36, 54, 47, 71, 53, 59, 41, 42, 57, 50, 38, 31, 27, 33, 26, 40, 42, 31, 25),
+    'ACT': (26, 47, 26, 37, 42, 15, 60, 40, 43, 48, 30, 25, 52, 28, 41, 40, 34, 28, 41, 38, 40, 30, 35, 27, 27,
+            32, 44, 31),
+    'ROM': (32, 29, 31, 25, 21, 23, 25, 39, 33, 21, 36, 21, 14, 23, 33, 27),
+    'CO1': (31, 16, 23, 21, 13, 20, 40, 13, 27, 33, 34, 31, 13, 40, 58, 24),
+    'CO2': (24, 17, 18, 18, 21, 18, 16, 24, 15, 18, 33, 21, 14),
+    'GAL': (24, 21, 29, 31, 26, 18),
+    'EPH': (23, 22, 21, 32, 33, 24),
+    'PHP': (30, 30, 21, 23),
+    'COL': (29, 23, 25, 18),
+    'TH1': (10, 20, 13, 18, 28),
+    'TH2': (12, 17, 18),
+    '1TI': (20, 15, 16, 16, 25, 21),
+    '2TI': (18, 26, 17, 22),
+    'TIT': (16, 15, 15),
+    'PHM': (25,),
+    'HEB': (14, 18, 19, 16, 14, 20, 28, 13, 28, 39, 40, 29, 25),
+    'JAS': (27, 26, 18, 17, 20),
+    'PE1': (25, 25, 22, 19, 14),
+    'PE2': (21, 22, 18),
+    'JN1': (10, 29, 24, 21, 21),
+    'JN2': (13,),
+    'JN3': (14,),
+    'JDE': (25,),
+    'REV': (20, 29, 22, 11, 14, 17, 17, 13, 21, 11, 19, 17, 18, 20, 8, 21, 18, 24, 21, 15, 27, 21),
+    }
+assert len(VERSE_COUNTS) == 66
+assert sum( len(chapterVerseCounts) for chapterVerseCounts in VERSE_COUNTS.values() ) == 1_189
+TOTAL_VERSE_COUNT = sum( sum(chapterVerseCounts) for chapterVerseCounts in VERSE_COUNTS.values() )
+assert TOTAL_VERSE_COUNT == 31_102
+
+# Precomputed tables for converting between (book, chapter, verse) and our dense verse ordinals
+CHAPTER_FIRST_ORDINALS:Dict[str,Tuple[int,...]] = {} # Ordinal of verse 1 of each chapter
+ORDINAL_VERSE_KEYS = array( 'I' ) # Packed verse key of each ordinal
+for _BBB, _chapterVerseCounts in VERSE_COUNTS.items():
+    _firstOrdinals = []
+    for _C, _verseCount in enumerate( _chapterVerseCounts, start=1 ):
+        _firstOrdinals.append( len(ORDINAL_VERSE_KEYS) )
+        ORDINAL_VERSE_KEYS.extend( (BOS_BOOK_NUMBER_MAP[_BBB] << 24) | (_C << 16) | (_V << 8) for _V in range(1, _verseCount+1) )
+    CHAPTER_FIRST_ORDINALS[_BBB] = tuple( _firstOrdinals )
+assert len(ORDINAL_VERSE_KEYS) == TOTAL_VERSE_COUNT
+
+
+def convert_book_code( bookCode:str, referenceFormat:str ) -> str:
+    """
+    Change a book code like '1Co' (Uuu) or '1CO' (UUU) or '1Cor' (OSIS) to our BOS 'CO1'.
+
+    Raises a KeyError if the book code isn't known.
+    """
+    return BOOK_CODE_TO_BOS_MAPS[referenceFormat][bookCode]
+# end of BibleReferences.convert_book_code
+
+
+def _convert_Uuu_reference( ref:str ) -> str:
+    """
+    Change a (TIPNR) Bible reference like '1Co.1.14' to 'CO1_1:14'
+
+    There might be a's or b's at the end of the verse number,
+        and there might be brackets or parentheses around the reference.
+    """
+    assert len(ref) >= 7 # Uuu.c.v
+    assert ';' not in ref
+    assert ':' not in ref
+    assert ' ' not in ref
+    assert ref.count('.') == 2
+
+    pre = post = ''
+    if ref[0] in '([' and ref[-1] in '])':
+        pre, ref, post = ref[0], ref[1:-1], ref[-1]
+
+    assert ref[3] == '.'
+    BBB = BOOK_CODE_TO_BOS_MAPS['Uuu'][ref[:3]]
+    c, v = ref[4:].split('.')
+    _check_verse_range( BBB, c, v.rstrip(VERSE_SUFFIXES), ref )
+    return f"{pre}{BBB}_{c}:{v}{post}"
+# end of BibleReferences._convert_Uuu_reference
+
+def _convert_OSIS_reference( ref:str ) -> str:
+    """
+    Change an OSIS Bible reference like '2Chr.1.14' to 'CH2_1:14'
+    """
+    assert len(ref) >= 6 # Uu.c.v
+    assert ';' not in ref
+    assert ':' not in ref
+    assert ' ' not in ref
+    assert ref.count('.') == 2
+
+    osisBookCode, c, v = ref.split('.')
+    assert c.isdigit()
+    assert v.isdigit()
+    BBB = BOOK_CODE_TO_BOS_MAPS['OSIS'][osisBookCode]
+    _check_verse_range( BBB, c, v, ref )
+    return f"{BBB}_{c}:{v}"
+# end of BibleReferences._convert_OSIS_reference
+
+def _check_verse_range( BBB:str, c:str, v:str, ref:str ) -> None:
+    """
+    Check the converted reference against our versification table.
+
+    The sources don't all use exactly the same versification,
+        so we only warn (and keep the reference) if it's out of range.
+    """
+    if not c.isdigit() or not v.isdigit() or not is_valid_verse( BBB, int(c), int(v) ):
+        logging.warning( f"Bible reference {ref!r} is outside the {BBB} versification" )
+# end of BibleReferences._check_verse_range
+
+REFERENCE_CONVERTERS = { 'Uuu':_convert_Uuu_reference, 'OSIS':_convert_OSIS_reference }
+converted_reference_caches:Dict[str,Dict[str,str]] = { referenceFormat:{} for referenceFormat in REFERENCE_CONVERTERS }
+packed_reference_caches:Dict[str,Dict[str,int]] = { referenceFormat:{} for referenceFormat in REFERENCE_CONVERTERS }
+
+
+def convert_reference( ref:str, referenceFormat:str ) -> str:
+    """
+    Change a single Bible reference in the given format ('Uuu' or 'OSIS')
+        to our BOS form, e.g., 'CH2_1:14'.
+    """
+    cache = converted_reference_caches[referenceFormat]
+    try: return cache[ref]
+    except KeyError:
+        cache[ref] = adjRef = REFERENCE_CONVERTERS[referenceFormat](ref)
+        return adjRef
+# end of BibleReferences.convert_reference
+
+
+def convert_references( ref_list:List[str], referenceFormat:str, packed:bool=False ) -> Union[List[str],array]:
+    """
+    Change a list of Bible references in the given format ('Uuu' or 'OSIS')
+        to our BOS form, e.g., 'CH2_1:14'.
+
+    Returns a new list,
+        or if packed is set, a new array('I') of our integer verse keys.
+    """
+    if packed:
+        packedCache = packed_reference_caches[referenceFormat]
+        results = array( 'I' )
+        for ref in ref_list:
+            try: verseKey = packedCache[ref]
+            except KeyError:
+                packedCache[ref] = verseKey = pack_reference( convert_reference( ref, referenceFormat ) )
+            results.append( verseKey )
+        return results
+
+    cache = converted_reference_caches[referenceFormat]
+    converter = REFERENCE_CONVERTERS[referenceFormat]
+    results = []
+    for ref in ref_list:
+        try: adjRef = cache[ref]
+        except KeyError:
+            cache[ref] = adjRef = converter(ref)
+        results.append( adjRef )
+    return results
+# end of BibleReferences.convert_references
+
+
+def encode_verse_key( BBB:str, C:int, V:int, suffix:str='', brackets:str='' ) -> int:
+    """
+    Pack a BOS book code, chapter and verse numbers,
+        and any partial verse suffix (e.g., 'a') and enclosing brackets (e.g., '[]')
+        into our integer verse key.
+    """
+    assert 0 <= C <= 255 and 0 <= V <= 255, f"{BBB=} {C=} {V=}"
+    return (BOS_BOOK_NUMBER_MAP[BBB] << 24) | (C << 16) | (V << 8) \
+            | (VERSE_SUFFIXES.index(suffix if suffix else ' ') << 2) | VERSE_BRACKETS.index(brackets)
+# end of BibleReferences.encode_verse_key
+
+def decode_verse_key( verseKey:int ) -> Tuple[str,int,int,str,str]:
+    """
+    Unpack our integer verse key
+        and return a 5-tuple of BBB, C, V, suffix, brackets.
+    """
+    suffix = VERSE_SUFFIXES[(verseKey >> 2) & 0x1F]
+    return BOS_BOOK_ID_MAP[verseKey >> 24], (verseKey >> 16) & 0xFF, (verseKey >> 8) & 0xFF, \
+            '' if suffix == ' ' else suffix, VERSE_BRACKETS[verseKey & 0x03]
+# end of BibleReferences.decode_verse_key
+
+
+def pack_reference( BOSref:str ) -> int:
+    """
+    Pack a BOS reference like 'CO1_1:14' or '[GEN_1:1a]' into our integer verse key.
+
+    Raises a ValueError if the reference isn't in that form.
+    """
+    match = BOS_REFERENCE_RE.match( BOSref )
+    if match:
+        opening, BBB, C, V, suffix, closing = match.groups()
+        if BBB in BOS_BOOK_NUMBER_MAP and f'{opening}{closing}' in VERSE_BRACKETS \
+        and int(C) <= 255 and int(V) <= 255:
+            return encode_verse_key( BBB, int(C), int(V), suffix, f'{opening}{closing}' )
+    raise ValueError( f"Unable to pack Bible reference {BOSref!r}" )
+# end of BibleReferences.pack_reference
+
+def render_verse_key( verseKey:int ) -> str:
+    """
+    Convert our integer verse key back to a BOS reference string like 'CO1_1:14' or '[GEN_1:1a]'.
+    """
+    BBB, C, V, suffix, brackets = decode_verse_key( verseKey )
+    return f'{brackets[:1]}{BBB}_{C}:{V}{suffix}{brackets[1:]}'
+# end of BibleReferences.render_verse_key
+
+
+def render_references( refs:Union[List[str],array,Set] ) -> List[str]:
+    """
+    Given an array or VerseSet of our integer verse keys (or a list of reference strings),
+        return a list of BOS reference strings.
+    """
+    if isinstance( refs, (array,Set) ):
+        return [render_verse_key(verseKey) for verseKey in refs]
+    return refs
+# end of BibleReferences.render_references
+
+def render_packed_references_for_JSON( obj ) -> List[str]:
+    """
+    Can be used as the 'default' function for json.dump
+        so that arrays (or VerseSets) of our packed verse keys are only rendered to strings as we export.
+    """
+    if isinstance( obj, (array,Set) ):
+        return render_references( obj )
+    raise TypeError( f"Object of type {obj.__class__.__name__} is not JSON serializable" )
+# end of BibleReferences.render_packed_references_for_JSON
+
+
+def is_valid_verse( BBB:str, C:int, V:int ) -> bool:
+    """
+    Returns True if the chapter and verse numbers are within our versification for the BOS book.
+    """
+    try: return C >= 1 and 1 <= V <= VERSE_COUNTS[BBB][C-1]
+    except (KeyError, IndexError): return False
+# end of BibleReferences.is_valid_verse
+
+def verse_ordinal( BBB:str, C:int, V:int ) -> int:
+    """
+    Returns the dense (zero-based) ordinal number of the verse, e.g., GEN_1:1 is 0.
+
+    Raises a ValueError if the reference is outside our versification.
+    """
+    if not is_valid_verse( BBB, C, V ):
+        raise ValueError( f"{BBB}_{C}:{V} is outside our versification" )
+    return CHAPTER_FIRST_ORDINALS[BBB][C-1] + V - 1
+# end of BibleReferences.verse_ordinal
+
+def ordinal_verse( ordinal:int ) -> Tuple[str,int,int]:
+    """
+    Returns the BBB, C, V of the given dense verse ordinal.
+    """
+    verseKey = ORDINAL_VERSE_KEYS[ordinal]
+    return BOS_BOOK_ID_MAP[verseKey >> 24], (verseKey >> 16) & 0xFF, (verseKey >> 8) & 0xFF
+# end of BibleReferences.ordinal_verse
+
+def verse_key_ordinal( verseKey:int ) -> int:
+    """
+    Returns the dense verse ordinal of our packed verse key
+        (ignoring any suffix or brackets).
+
+    Raises a ValueError if the reference is outside our versification.
+    """
+    return verse_ordinal( BOS_BOOK_ID_MAP[verseKey >> 24], (verseKey >> 16) & 0xFF, (verseKey >> 8) & 0xFF )
+# end of BibleReferences.verse_key_ordinal
+
+def reference_ordinal( BOSref:str ) -> Optional[int]:
+    """
+    Returns the dense verse ordinal of a BOS reference like 'CO1_1:14' or '[GEN_1:1a]'
+        (ignoring any suffix or brackets),
+        or None if it's not a valid reference in our versification.
+    """
+    match = BOS_REFERENCE_RE.match( BOSref )
+    if match:
+        _opening, BBB, C, V, _suffix, _closing = match.groups()
+        if is_valid_verse( BBB, int(C), int(V) ):
+            return CHAPTER_FIRST_ORDINALS[BBB][int(C)-1] + int(V) - 1
+    return None
+# end of BibleReferences.reference_ordinal
+
+def ordinal_verse_key( ordinal:int ) -> int:
+    """
+    Returns the (plain) packed verse key of the given dense verse ordinal.
+    """
+    return ORDINAL_VERSE_KEYS[ordinal]
+# end of BibleReferences.ordinal_verse_key
+
+def book_ordinals( BBB:str ) -> range:
+    """
+    Returns the range of the dense verse ordinals of all the verses in the BOS book.
+    """
+    return range( CHAPTER_FIRST_ORDINALS[BBB][0], CHAPTER_FIRST_ORDINALS[BBB][-1] + VERSE_COUNTS[BBB][-1] )
+# end of BibleReferences.book_ordinals
+
+
+
+def briefDemo() -> None:
+    """
+    Brief demo to check the conversions are working
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    for referenceFormat, refs in ( ('Uuu',['1Co.1.14','Gen.1.1a','[Jhn.3.16]']), ('OSIS',['2Chr.1.14','Ps.23.1']) ):
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {referenceFormat} {refs} -> {convert_references(refs, referenceFormat)}" )
+        packedRefs = convert_references( refs, referenceFormat, packed=True )
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"    packed to {[hex(verseKey) for verseKey in packedRefs]} -> {render_references(packedRefs)}" )
+# end of BibleReferences.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check the conversions are working
+        and to time them in isolation.
+    """
+    from timeit import timeit
+    import sys
+    briefDemo()
+
+    refs = [f'{Uuu_BOOK_ID_MAP[ix]}.{c}.{v}' for ix,BBB in BOS_BOOK_ID_MAP.items()
+                for c,verseCount in enumerate(VERSE_COUNTS[BBB][:10], start=1) for v in range(1,verseCount+1)]
+    for label, fn in ( ('uncached', lambda: [_convert_Uuu_reference(ref) for ref in refs]),
+                       ('batch', lambda: convert_references(refs, 'Uuu')) ):
+        seconds = timeit( fn, number=10 ) / 10
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Converted {len(refs):,} {label} Uuu references in {seconds*1000:.1f}ms ({seconds*1_000_000_000/len(refs):.0f}ns each)" )
+
+    strRefs, packedRefs = convert_references(refs, 'Uuu'), convert_references(refs, 'Uuu', packed=True)
+    assert render_references( packedRefs ) == strRefs
+    assert list(packedRefs) == sorted(packedRefs) # Packed keys sort into Biblical order
+    strBytes = sys.getsizeof(strRefs) + sum( sys.getsizeof(ref) for ref in strRefs )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {len(refs):,} references take {strBytes:,} bytes as a list of strings and {sys.getsizeof(packedRefs):,} bytes as a packed array" )
+
+    # Check our ordinals go both ways for every verse
+    for ordinal in range( TOTAL_VERSE_COUNT ):
+        assert verse_ordinal( *ordinal_verse(ordinal) ) == ordinal
+        assert verse_key_ordinal( ordinal_verse_key(ordinal) ) == ordinal
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {TOTAL_VERSE_COUNT:,} verse ordinals checked; REV_22:21 is {verse_ordinal('REV',22,21):,}" )
+# end of BibleReferences.fullDemo
+
+if __name__ == '__main__':
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of BibleReferences.py
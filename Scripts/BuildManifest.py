@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# BuildManifest.py
+#
+# Module handling the build manifests which let the loaders skip unnecessary rebuilds
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+GitHub@gmail.com>
+#
+# License: CC0 1.0 Universal (CC0 1.0) Public Domain Dedication
+#
+#   This is a human-readable summary of the Legal Code
+#
+#   No Copyright
+#
+#   The person who associated a work with this deed has dedicated the work to the public domain
+#       by waiving all of his or her rights to the work worldwide under copyright law,
+#       including all related and neighboring rights, to the extent allowed by law.
+#
+#   You can copy, modify, distribute and perform the work, even for commercial purposes,
+#       all without asking permission. See Other Information below.
+#
+#   Other Information
+#
+#   In no way are the patent or trademark rights of any person affected by CC0,
+#       nor are the rights that other persons may have in the work or in how the work is used,
+#       such as publicity or privacy rights.
+#    Unless expressly stated otherwise, the person who associated a work with this deed makes no
+#       warranties about the work, and disclaims liability for all uses of the work,
+#       to the fullest extent permitted by applicable law.
+#    When using or citing the work, you should not imply endorsement by the author or the affirmer.
+#
+#   You should have received a copy of the formal licence text
+#   along with this program.  If not, see <https://CreativeCommons.org/publicdomain/zero/1.0/>.
+#
+"""
+Module to record what went into (and came out of) a loader run
+    so that the next run can be skipped if nothing has changed.
+
+The manifest (a small JSON file in the loader's output folder) records:
+    the loader's PROGRAM_VERSION and LAST_MODIFIED_DATE,
+    the hashes of the loader's source file and of our other modules that it uses,
+    the settings of the loader's *_FLAG options,
+    and the hashes of each input file and of each output file
+        (i.e., each file that the run wrote via DerivedFileWriter, not everything in the folder).
+
+If all of those still match, the loader doesn't need to do anything.
+Otherwise it does a full rebuild and saves a new manifest.
+(Every output of a loader depends on all of its inputs,
+    so there's no finer granularity to be had.)
+
+We remember the size and modification time of each file
+    so that we only need to rehash files whose stat has changed,
+    which makes checking an unchanged build almost instantaneous.
+"""
+from gettext import gettext as _
+from typing import Dict, List, Optional
+from types import ModuleType
+from pathlib import Path
+from datetime import datetime
+import os
+import sys
+import logging
+import hashlib
+import json
+
+import BibleOrgSysGlobals
+from BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+from DerivedFileWriter import get_all_write_results
+
+
+LAST_MODIFIED_DATE = '2026-10-17' # by RJH
+SHORT_PROGRAM_NAME = "BuildManifest"
+PROGRAM_NAME = "Loader build manifests"
+PROGRAM_VERSION = '0.11'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+BUILD_MANIFEST_FORMAT_VERSION = '0.2' # Increment this if the contents of the manifest change
+HASH_CHUNK_SIZE = 1 << 20 # 1 MiB
+
+
+
+def hash_file( filepath:Path ) -> str:
+    """
+    Returns the SHA-256 hex digest of the file contents.
+
+    The file is read in chunks so that large files don't need to be held in memory.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"hash_file( {filepath} )" )
+    hasher = hashlib.sha256()
+    with open( filepath, 'rb' ) as hashed_file:
+        while chunk := hashed_file.read( HASH_CHUNK_SIZE ):
+            hasher.update( chunk )
+    return hasher.hexdigest()
+# end of BuildManifest.hash_file
+
+
+def find_local_source_filepaths( module:ModuleType ) -> List[Path]:
+    """
+    Returns the sorted source filepaths of the given module
+        and (recursively) of any modules in the same folder that it uses,
+        e.g., BibleReferences.py and FGidAllocator.py for one of our loaders.
+
+    We find the modules from the module namespaces,
+        so both 'import X' and 'from X import Y' are found.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"find_local_source_filepaths( {module.__name__} )" )
+    source_folderpath = Path( module.__file__ ).resolve().parent
+    found_filepaths, modules_to_check = set(), [module]
+    while modules_to_check:
+        this_module = modules_to_check.pop()
+        this_filepath = getattr( this_module, '__file__', None )
+        if not this_filepath: continue # e.g., a built-in module
+        this_filepath = Path( this_filepath ).resolve()
+        if this_filepath.parent != source_folderpath or this_filepath in found_filepaths:
+            continue
+        found_filepaths.add( this_filepath )
+        for value in list( vars(this_module).values() ):
+            if isinstance( value, ModuleType ):
+                modules_to_check.append( value )
+            else:
+                module_name = getattr( value, '__module__', None )
+                if isinstance( module_name, str ) and module_name in sys.modules:
+                    modules_to_check.append( sys.modules[module_name] )
+    return sorted( found_filepaths )
+# end of BuildManifest.find_local_source_filepaths
+
+
+
+class BuildManifest:
+    """
+    Keeps track of the files and settings used for a loader run.
+
+    Typical use is:
+        manifest = BuildManifest( loader_module, input_filepaths, output_folderpath )
+        if manifest.is_up_to_date(): return True # nothing to do
+        ... load, normalise, and export everything ...
+        manifest.save()
+    """
+    def __init__( self, loader_module:ModuleType, input_filepaths:List[Path], output_folderpath:Path ) -> None:
+        """
+        loader_module is the (already imported) loader,
+            e.g., sys.modules[__name__] from inside the loader itself.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"BuildManifest.__init__( {loader_module.__name__}, {input_filepaths}, {output_folderpath} )" )
+        self.loader_module = loader_module
+        self.loader_name = loader_module.SHORT_PROGRAM_NAME
+        self.input_filepaths = [Path(input_filepath) for input_filepath in input_filepaths]
+        self.output_folderpath = Path( output_folderpath )
+        self.manifest_filepath = self.output_folderpath.joinpath( f'{self.loader_name}_build_manifest.json' )
+        self.previous_manifest = self.load()
+        self.previous_file_entries = {} # Filepath strings to previous stat/hash dicts
+        if self.previous_manifest:
+            for section_name in ('sources','inputs','outputs'):
+                self.previous_file_entries.update( self.previous_manifest.get(section_name, {}) )
+        self.current_manifest = None
+        self.first_write_result_index = len( get_all_write_results() ) # Anything written after this is from our run
+    # end of BuildManifest.__init__
+
+
+    def __str__( self ) -> str:
+        return f"BuildManifest for {self.loader_name}: {len(self.input_filepaths)} input file(s) -> {self.output_folderpath}"
+
+
+    def load( self ) -> Optional[dict]:
+        """
+        Returns the previously saved manifest (if any and if it's our format).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"BuildManifest.load() from {self.manifest_filepath}" )
+        try:
+            with open( self.manifest_filepath, 'rt', encoding='utf-8' ) as manifest_file:
+                manifest = json.load( manifest_file )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as err:
+            logging.warning( f"Ignoring unreadable build manifest {self.manifest_filepath}: {err}" )
+            return None
+        if not isinstance( manifest, dict ) or manifest.get('build_manifest_format_version') != BUILD_MANIFEST_FORMAT_VERSION:
+            dPrint( 'Info', DEBUGGING_THIS_MODULE, f"  Ignoring build manifest with wrong format in {self.manifest_filepath}" )
+            return None
+        return manifest
+    # end of BuildManifest.load
+
+
+    def _file_entry( self, filepath:Path, key:str ) -> Dict[str,object]:
+        """
+        Returns a dict with the size, modification time, and hash of the file.
+
+        If the size and modification time match the previous manifest entry for the key,
+            we trust the previous hash rather than rereading the file.
+        """
+        stat_result = os.stat( filepath )
+        previous_entry = self.previous_file_entries.get( key )
+        if previous_entry is not None \
+        and previous_entry['size'] == stat_result.st_size and previous_entry['mtime_ns'] == stat_result.st_mtime_ns:
+            sha256 = previous_entry['sha256']
+        else:
+            dPrint( 'Verbose', DEBUGGING_THIS_MODULE, f"  Hashing {filepath}…" )
+            sha256 = hash_file( filepath )
+        return { 'size':stat_result.st_size, 'mtime_ns':stat_result.st_mtime_ns, 'sha256':sha256 }
+    # end of BuildManifest._file_entry
+
+
+    def _written_output_filepaths( self ) -> List[Path]:
+        """
+        Returns the sorted list of files which the loader has written (or found unchanged)
+            in the output folder (including any subfolders) since this manifest was created.
+
+        We take these from DerivedFileWriter rather than looking in the folder,
+            so other files there (and any temporary files left by a crashed write) are ignored.
+        """
+        output_folderpath = self.output_folderpath.resolve()
+        return sorted( { Path(filepath) for filepath,_was_written in get_all_write_results()[self.first_write_result_index:]
+                        if output_folderpath in Path(filepath).resolve().parents
+                        and not str(filepath).endswith('.tmp')
+                        and Path(filepath) != self.manifest_filepath } )
+    # end of BuildManifest._written_output_filepaths
+
+
+    def make_manifest( self, output_filepaths:Optional[List[Path]] ) -> Optional[dict]:
+        """
+        Returns a manifest dict for the current state of things
+            including entries for the given output files (if any)
+            (or None if any of the input files can't be found).
+
+        The input and output file entries are keyed by their path strings (as used by the loader)
+            so the manifest is only valid for runs from the same folder.
+        The source file entries are keyed by just their filenames.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"BuildManifest.make_manifest( {None if output_filepaths is None else len(output_filepaths)} )" )
+        for input_filepath in self.input_filepaths:
+            if not os.access( input_filepath, os.R_OK ):
+                dPrint( 'Info', DEBUGGING_THIS_MODULE, f"  Can't find input file {input_filepath} for build manifest" )
+                return None
+
+        loader_module = self.loader_module
+        manifest = {
+            'build_manifest_format_version': BUILD_MANIFEST_FORMAT_VERSION,
+            'loader_name': self.loader_name,
+            'loader_version': loader_module.PROGRAM_VERSION,
+            'loader_last_modified_date': loader_module.LAST_MODIFIED_DATE,
+            'loader_flags': { name:value for name,value in sorted(vars(loader_module).items())
+                                if name.endswith('_FLAG') and isinstance(value, (bool,int,str)) },
+            'sources': { source_filepath.name:self._file_entry(source_filepath, source_filepath.name)
+                                for source_filepath in find_local_source_filepaths(loader_module) },
+            'inputs': { str(input_filepath):self._file_entry(input_filepath, str(input_filepath))
+                                for input_filepath in self.input_filepaths },
+            }
+        if output_filepaths is not None:
+            manifest['outputs'] = { str(output_filepath):self._file_entry(output_filepath, str(output_filepath))
+                                        for output_filepath in output_filepaths }
+        return manifest
+    # end of BuildManifest.make_manifest
+
+
+    def is_up_to_date( self ) -> bool:
+        """
+        Returns True if the loader version, source files, flags, and input files
+            are all unchanged since the manifest was saved,
+            and all of the output files are still there unchanged.
+
+        If only the modification times have changed (e.g., files were touched or re-checked-out),
+            the manifest is resaved with the new times so that we don't need to rehash them next time.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, "BuildManifest.is_up_to_date()" )
+        if not self.previous_manifest:
+            vPrint( 'Info', DEBUGGING_THIS_MODULE, f"  No previous build manifest found for {self.loader_name}." )
+            return False
+        previous_output_filepaths = [Path(filepath_string) for filepath_string in self.previous_manifest.get('outputs', {})]
+        for output_filepath in previous_output_filepaths:
+            if not output_filepath.is_file():
+                vPrint( 'Info', DEBUGGING_THIS_MODULE, f"  {self.loader_name} output file {output_filepath} has gone." )
+                return False
+        self.current_manifest = self.make_manifest( previous_output_filepaths )
+        if self.current_manifest is None:
+            return False
+
+        previous_manifest = self.previous_manifest
+        for key in ('loader_version','loader_last_modified_date','loader_flags'):
+            if self.current_manifest[key] != previous_manifest.get(key):
+                vPrint( 'Info', DEBUGGING_THIS_MODULE, f"  {self.loader_name} {key.replace('_',' ')} has changed." )
+                return False
+        needs_resave = False
+        for section_name in ('sources','inputs','outputs'):
+            current_entries, previous_entries = self.current_manifest[section_name], previous_manifest.get(section_name, {})
+            if current_entries.keys() != previous_entries.keys():
+                vPrint( 'Info', DEBUGGING_THIS_MODULE, f"  {self.loader_name} {section_name} files have changed: {sorted(current_entries.keys() ^ previous_entries.keys())}" )
+                return False
+            for filepath_string, current_entry in current_entries.items():
+                if current_entry['sha256'] != previous_entries[filepath_string]['sha256']:
+                    vPrint( 'Info', DEBUGGING_THIS_MODULE, f"  {self.loader_name} {section_name} file {filepath_string} has changed." )
+                    return False
+                if current_entry != previous_entries[filepath_string]:
+                    needs_resave = True # Same contents but different size/time
+        if needs_resave:
+            self._write( self.current_manifest )
+        return True
+    # end of BuildManifest.is_up_to_date
+
+
+    def save( self ) -> bool:
+        """
+        Writes the manifest for the outputs that the loader has just written.
+
+        Returns False if it couldn't be made (e.g., input files not found).
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, "BuildManifest.save()" )
+        self.current_manifest = self.make_manifest( self._written_output_filepaths() )
+        if self.current_manifest is None:
+            logging.warning( f"Unable to save build manifest for {self.loader_name}" )
+            return False
+        self._write( self.current_manifest )
+        vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Saved build manifest with {len(self.current_manifest['outputs']):,} output files to {self.manifest_filepath}." )
+        return True
+    # end of BuildManifest.save
+
+
+    def _write( self, manifest:dict ) -> None:
+        """
+        Writes the manifest (via a temporary file so that an interrupted write
+            can't leave a partial manifest that might look up-to-date).
+        """
+        manifest = manifest | { 'manifest_written': datetime.now().isoformat(timespec='seconds') }
+        temporary_filepath = self.manifest_filepath.with_suffix( '.tmp' )
+        with open( temporary_filepath, 'wt', encoding='utf-8' ) as manifest_file:
+            json.dump( manifest, manifest_file, ensure_ascii=False, indent=2 )
+        os.replace( temporary_filepath, self.manifest_filepath )
+    # end of BuildManifest._write
+# end of class BuildManifest
+
+
+
+def briefDemo() -> None:
+    """
+    Brief demo to check class is working
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    this_module = sys.modules[__name__]
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Local sources used by {SHORT_PROGRAM_NAME}: {[filepath.name for filepath in find_local_source_filepaths(this_module)]}" )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  SHA-256 of {Path(__file__).name} is {hash_file(Path(__file__))}" )
+# end of BuildManifest.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+
+    for loader_name in ('loadTIPNR', 'loadGlyssenData', 'loadTheographicBibleData'):
+        loader_module = __import__( loader_name )
+        manifest = loader_module.get_build_manifest()
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"\n  {manifest}" )
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"    Local sources: {[filepath.name for filepath in find_local_source_filepaths(loader_module)]}" )
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"    Up-to-date: {manifest.is_up_to_date()}" )
+# end of BuildManifest.fullDemo
+
+if __name__ == '__main__':
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of BuildManifest.py
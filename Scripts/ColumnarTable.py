@@ -0,0 +1,493 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# ColumnarTable.py
+#
+# Module handling columnar in-memory tables of rows (like the Glyssen CharacterVerse table)
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+GitHub@gmail.com>
+#
+# License: CC0 1.0 Universal (CC0 1.0) Public Domain Dedication
+#
+#   This is a human-readable summary of the Legal Code
+#
+#   No Copyright
+#
+#   The person who associated a work with this deed has dedicated the work to the public domain
+#       by waiving all of his or her rights to the work worldwide under copyright law,
+#       including all related and neighboring rights, to the extent allowed by law.
+#
+#   You can copy, modify, distribute and perform the work, even for commercial purposes,
+#       all without asking permission. See Other Information below.
+#
+#   Other Information
+#
+#   In no way are the patent or trademark rights of any person affected by CC0,
+#       nor are the rights that other persons may have in the work or in how the work is used,
+#       such as publicity or privacy rights.
+#    Unless expressly stated otherwise, the person who associated a work with this deed makes no
+#       warranties about the work, and disclaims liability for all uses of the work,
+#       to the fullest extent permitted by applicable law.
+#    When using or citing the work, you should not imply endorsement by the author or the affirmer.
+#
+#   You should have received a copy of the formal licence text
+#   along with this program.  If not, see <https://CreativeCommons.org/publicdomain/zero/1.0/>.
+#
+"""
+Module containing a table of rows (each a dict of field values)
+    which is stored by column rather than as a separate dict for every row.
+
+Each column is dictionary-encoded: each of its distinct values is stored (interned) only once
+    and each row only has a small integer code for it in an array,
+    so a table like the Glyssen CharacterVerse table (about 20k rows of ten mostly repeated strings)
+    takes only a fraction of the memory of a dict for every row.
+
+The table is a mapping (like a dict) from the row keys (e.g., our FGids) to the rows,
+    but each row is only materialised (as a ColumnarRow dict) when it's accessed,
+    and any fields changed in it are written back into the table.
+Any non-dict entries (e.g., '__COLUMN_HEADERS__') are kept as they are (before the rows)
+    so the writers (like JSONWriter.py) don't need to know the difference.
+
+The rows can be filtered by their column values (see ColumnarTable.select)
+    by comparing the integer codes of each column,
+    which is vectorised using NumPy if it's installed.
+"""
+from gettext import gettext as _
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+from collections.abc import MutableMapping
+from array import array
+import sys
+
+try: import numpy
+except ImportError:
+    numpy = None
+
+import BibleOrgSysGlobals
+from BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+
+
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
+SHORT_PROGRAM_NAME = "ColumnarTable"
+PROGRAM_NAME = "Columnar in-memory tables"
+PROGRAM_VERSION = '0.10'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+ABSENT_CODE = 0 # The code for a row which doesn't have that field at all
+MAX_SHORT_CODE = 0xFFFF # Columns with more distinct values than this need 32-bit codes
+
+
+
+class ColumnarRow( dict ):
+    """
+    A row materialised from a ColumnarTable (a normal dict of its fields)
+        which writes any changed or added fields back into the table.
+
+    It's only meant to be used straight away (e.g., while iterating through the table)
+        because its row number would be out-of-date if an earlier row was deleted.
+    Fields can't be deleted from it.
+    """
+    __slots__ = ('table', 'rowNumber')
+
+    def __init__( self, table:'ColumnarTable', rowNumber:int, fields:Iterable[Tuple[str,Any]] ) -> None:
+        super().__init__( fields )
+        self.table, self.rowNumber = table, rowNumber
+
+    def __setitem__( self, fieldName:str, value:Any ) -> None:
+        self.table.set_value( self.rowNumber, fieldName, value )
+        super().__setitem__( fieldName, value )
+
+    def update( self, *args, **kwargs ) -> None:
+        for fieldName, value in dict( *args, **kwargs ).items():
+            self[fieldName] = value
+    def __ior__( self, other ) -> 'ColumnarRow':
+        self.update( other )
+        return self
+    def setdefault( self, fieldName:str, default:Any=None ) -> Any:
+        if fieldName not in self: self[fieldName] = default
+        return self[fieldName]
+
+    def _cant_delete( self, *args ) -> None:
+        raise TypeError( "Can't delete fields from a ColumnarTable row" )
+    __delitem__ = pop = popitem = clear = _cant_delete
+
+    def __reduce__( self ) -> tuple:
+        return dict, (dict( self ),) # Copied or pickled rows are just normal dicts
+# end of class ColumnarRow
+
+
+
+class ColumnarTable( MutableMapping ):
+    """
+    A mapping from row keys to rows (dicts of field values) which stores the rows by column.
+
+    Dict values are stored as rows (with a new column added for any new field name)
+        and any other values as metadata entries, which always come before the rows.
+
+    For each column, we keep a list of its distinct values (with None for ABSENT_CODE)
+        and a dict from each value to its code (so the values must be hashable,
+        and values that compare equal, like 1 and True, share the same code),
+        along with an array of the code for each row (16-bit unless there's too many distinct values).
+    """
+    def __init__( self, columnNames:Iterable[str]=() ) -> None:
+        self.metadata:Dict[Any,Any] = {} # Non-row entries, e.g., '__COLUMN_HEADERS__'
+        self.columnNames:List[str] = []
+        self.columnIndexes:Dict[str,int] = {}
+        self.columnValues:List[List[Any]] = [] # The distinct values of each column
+        self.valueCodes:List[Dict[Any,int]] = [] # The code of each distinct value of each column
+        self.columnCodes:List[array] = [] # The code of the value of each row in each column
+        self.rowKeys:List[Any] = []
+        self.rowNumbers:Dict[Any,int] = {}
+        for columnName in columnNames:
+            self.add_column( columnName )
+    # end of ColumnarTable.__init__
+
+    def __len__( self ) -> int:
+        return len( self.metadata ) + len( self.rowKeys )
+    def __iter__( self ) -> Iterator[Any]:
+        yield from self.metadata
+        yield from self.rowKeys
+    def __contains__( self, key:Any ) -> bool:
+        return key in self.metadata or key in self.rowNumbers
+    def __repr__( self ) -> str:
+        return f"ColumnarTable({len(self.rowKeys):,} rows of {len(self.columnNames)} columns and {len(self.metadata)} other entries)"
+
+
+    def __getstate__( self ) -> Dict[str,Any]:
+        """
+        The lookup dicts aren't pickled (e.g., in checkpoints) as they're easily rebuilt.
+        """
+        return { 'metadata':self.metadata, 'columnNames':self.columnNames,
+                    'columnValues':self.columnValues, 'columnCodes':self.columnCodes, 'rowKeys':self.rowKeys }
+    def __setstate__( self, state:Dict[str,Any] ) -> None:
+        self.__dict__.update( state )
+        self.rebuild_lookups()
+
+    def rebuild_lookups( self ) -> None:
+        """
+        Rebuild the dicts for finding the columns, the codes of their values, and the rows.
+        """
+        self.columnIndexes = { columnName:columnIndex for columnIndex,columnName in enumerate( self.columnNames ) }
+        self.valueCodes = [{ value:code for code,value in enumerate( values ) if code != ABSENT_CODE } for values in self.columnValues]
+        self.rowNumbers = { key:rowNumber for rowNumber,key in enumerate( self.rowKeys ) }
+    # end of ColumnarTable.rebuild_lookups
+
+
+    def add_column( self, columnName:str ) -> int:
+        """
+        Adds a new column (which the existing rows don't have) and returns its index.
+        """
+        assert columnName not in self.columnIndexes
+        columnIndex = self.columnIndexes[columnName] = len( self.columnNames )
+        self.columnNames.append( columnName )
+        self.columnValues.append( [None] ) # for ABSENT_CODE
+        self.valueCodes.append( {} )
+        self.columnCodes.append( array( 'H', bytes( 2 * len(self.rowKeys) ) ) ) # all ABSENT_CODE
+        return columnIndex
+    # end of ColumnarTable.add_column
+
+    def set_value( self, rowNumber:int, columnName:str, value:Any ) -> None:
+        """
+        Sets the value of one field of a row (adding a new column if necessary).
+
+        Strings are interned so that they're shared with any other columns (or tables) with the same value.
+        """
+        try: columnIndex = self.columnIndexes[columnName]
+        except KeyError: columnIndex = self.add_column( columnName )
+        if type(value) is str: value = sys.intern( value )
+        valueCodes = self.valueCodes[columnIndex]
+        try: code = valueCodes[value]
+        except KeyError: # it's a new value for this column
+            code = valueCodes[value] = len( self.columnValues[columnIndex] )
+            self.columnValues[columnIndex].append( value )
+            if code > MAX_SHORT_CODE and self.columnCodes[columnIndex].typecode == 'H':
+                self.columnCodes[columnIndex] = array( 'I', self.columnCodes[columnIndex] )
+        self.columnCodes[columnIndex][rowNumber] = code
+    # end of ColumnarTable.set_value
+
+    def get_row( self, rowNumber:int ) -> ColumnarRow:
+        """
+        Materialise the row (in column order, without any absent fields).
+        """
+        return ColumnarRow( self, rowNumber, [(columnName, values[codes[rowNumber]])
+                        for columnName, values, codes in zip( self.columnNames, self.columnValues, self.columnCodes )
+                            if codes[rowNumber] != ABSENT_CODE] )
+    # end of ColumnarTable.get_row
+
+
+    def __getitem__( self, key:Any ) -> Any:
+        try: return self.metadata[key]
+        except KeyError: return self.get_row( self.rowNumbers[key] )
+
+    def __setitem__( self, key:Any, value:Any ) -> None:
+        if not isinstance( value, dict ):
+            if key in self.rowNumbers: del self[key]
+            self.metadata[key] = value
+            return
+        self.metadata.pop( key, None )
+        try: rowNumber = self.rowNumbers[key]
+        except KeyError: # it's a new row
+            rowNumber = self.rowNumbers[key] = len( self.rowKeys )
+            self.rowKeys.append( key )
+            for codes in self.columnCodes: codes.append( ABSENT_CODE )
+        else: # it's replacing an existing row
+            for codes in self.columnCodes: codes[rowNumber] = ABSENT_CODE
+        for fieldName, fieldValue in value.items():
+            self.set_value( rowNumber, fieldName, fieldValue )
+    # end of ColumnarTable.__setitem__
+
+    def __delitem__( self, key:Any ) -> None:
+        if key in self.metadata:
+            del self.metadata[key]
+            return
+        rowNumber = self.rowNumbers.pop( key )
+        del self.rowKeys[rowNumber]
+        for codes in self.columnCodes: del codes[rowNumber]
+        for laterKey in self.rowKeys[rowNumber:]: self.rowNumbers[laterKey] -= 1
+    # end of ColumnarTable.__delitem__
+
+    def clear( self ) -> None:
+        self.__init__()
+
+    def update( self, other:Any=(), /, **kwargs ) -> None:
+        """
+        If this table is empty, another ColumnarTable is copied column by column
+            (e.g., when restoring a checkpoint) rather than row by row.
+        """
+        if isinstance( other, ColumnarTable ) and not self and not kwargs:
+            self.metadata = dict( other.metadata )
+            self.columnNames = list( other.columnNames )
+            self.columnValues = [list( values ) for values in other.columnValues]
+            self.columnCodes = [codes[:] for codes in other.columnCodes]
+            self.rowKeys = list( other.rowKeys )
+            self.rebuild_lookups()
+        else: super().update( other, **kwargs )
+    # end of ColumnarTable.update
+
+
+    def rekey( self, columnName:str ) -> None:
+        """
+        Change the row keys to the values of the given column (keeping the row order),
+            e.g., after our FGids have been changed,
+            and remove any values which are no longer used.
+
+        Raises a ValueError (without changing anything) if any rows don't have the field
+            or if the values aren't unique.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"ColumnarTable.rekey( {columnName!r} )" )
+        columnIndex = self.columnIndexes[columnName]
+        codes = self.columnCodes[columnIndex]
+        if ABSENT_CODE in codes:
+            raise ValueError( f"Can't rekey on {columnName!r} which some rows don't have" )
+        newRowNumbers = { key:rowNumber for rowNumber,key in enumerate( map( self.columnValues[columnIndex].__getitem__, codes ) ) }
+        if len(newRowNumbers) != len(self.rowKeys):
+            raise ValueError( f"Can't rekey on {columnName!r} which only has {len(newRowNumbers):,} distinct values for {len(self.rowKeys):,} rows" )
+        self.rowKeys, self.rowNumbers = list( newRowNumbers ), newRowNumbers
+        self.remove_unused_values()
+    # end of ColumnarTable.rekey
+
+    def remove_unused_values( self ) -> int:
+        """
+        Remove any distinct values which are no longer used by any rows
+            (e.g., after the values have been changed)
+            and return how many were removed.
+        """
+        removedCount = 0
+        for columnIndex, codes in enumerate( self.columnCodes ):
+            values = self.columnValues[columnIndex]
+            usedCodes = sorted( set( codes ) | {ABSENT_CODE} )
+            if len(usedCodes) == len(values): continue
+            newCodes = [ABSENT_CODE] * len(values) # Indexed by the old codes
+            for newCode, oldCode in enumerate( usedCodes ): newCodes[oldCode] = newCode
+            self.columnCodes[columnIndex] = array( 'H' if len(usedCodes) <= MAX_SHORT_CODE+1 else 'I', map( newCodes.__getitem__, codes ) )
+            self.columnValues[columnIndex] = [values[oldCode] for oldCode in usedCodes]
+            self.valueCodes[columnIndex] = { value:code for code,value in enumerate( self.columnValues[columnIndex] ) if code != ABSENT_CODE }
+            removedCount += len(values) - len(usedCodes)
+        return removedCount
+    # end of ColumnarTable.remove_unused_values
+
+
+    def iter_columns( self, *columnNames:str ) -> Iterator[Tuple]:
+        """
+        Yields a tuple of the values of the given columns for each row (in order)
+            without materialising the rows (with None for any absent fields).
+        """
+        columnIndexes = [self.columnIndexes[columnName] for columnName in columnNames]
+        return zip( *(map( self.columnValues[columnIndex].__getitem__, self.columnCodes[columnIndex] ) for columnIndex in columnIndexes) )
+    # end of ColumnarTable.iter_columns
+
+    def get_int_column( self, columnName:str, convert:Callable[[Any],int]=int, default:int=-1 ) -> array:
+        """
+        Returns an array of the integers (e.g., chapter numbers) converted from the column values
+            (converting each distinct value only once).
+
+        Absent fields and values which can't be converted are given as the default.
+        """
+        columnIndex = self.columnIndexes[columnName]
+        intValues = [default]
+        for value in self.columnValues[columnIndex][1:]:
+            try: intValues.append( convert( value ) )
+            except (ValueError, TypeError): intValues.append( default )
+        return array( 'i', map( intValues.__getitem__, self.columnCodes[columnIndex] ) )
+    # end of ColumnarTable.get_int_column
+
+
+    def get_matching_codes( self, columnName:str, condition:Any ) -> List[int]:
+        """
+        Returns the codes of the distinct values of the column which meet the condition,
+            which can be a function (called once with each distinct value),
+            a set of values, or a single value.
+        """
+        valueCodes = self.valueCodes[self.columnIndexes[columnName]]
+        if callable( condition ):
+            return [code for value,code in valueCodes.items() if condition( value )]
+        if isinstance( condition, (set,frozenset) ):
+            return [valueCodes[value] for value in condition if value in valueCodes]
+        return [valueCodes[condition]] if condition in valueCodes else []
+    # end of ColumnarTable.get_matching_codes
+
+    def select_row_numbers( self, conditions:Dict[str,Any] ) -> List[int]:
+        """
+        Returns the numbers of the rows (in order) which meet all of the conditions
+            (a dict from column names to conditions -- see get_matching_codes() above).
+
+        Only the integer codes of each column are compared
+            (all at once if NumPy is installed), so no rows are materialised.
+        Rows without a field never meet a condition on it.
+        """
+        matchingCodesList = []
+        for columnName, condition in conditions.items():
+            matchingCodes = self.get_matching_codes( columnName, condition ) if columnName in self.columnIndexes else []
+            if not matchingCodes: return []
+            matchingCodesList.append( (self.columnCodes[self.columnIndexes[columnName]], matchingCodes) )
+
+        if numpy is not None and self.rowKeys:
+            rowMask = numpy.ones( len(self.rowKeys), dtype=bool )
+            for codes, matchingCodes in matchingCodesList:
+                codes = numpy.frombuffer( codes, dtype=f'u{codes.itemsize}' ) # No copying
+                rowMask &= (codes == matchingCodes[0]) if len(matchingCodes) == 1 else numpy.isin( codes, matchingCodes )
+            return numpy.flatnonzero( rowMask ).tolist()
+
+        rowNumbers = range( len(self.rowKeys) )
+        for codes, matchingCodes in matchingCodesList:
+            matchingCodes = set( matchingCodes )
+            rowNumbers = [rowNumber for rowNumber in rowNumbers if codes[rowNumber] in matchingCodes]
+        return list( rowNumbers )
+    # end of ColumnarTable.select_row_numbers
+
+    def select( self, conditions:Dict[str,Any] ) -> List[Any]:
+        """
+        Returns the keys of the rows (in order) which meet all of the conditions
+            (see select_row_numbers() above),
+            e.g., select( {'B':'ISA', 'Character ID':'God', 'Quote Type':'Dialogue'} ).
+        """
+        return [self.rowKeys[rowNumber] for rowNumber in self.select_row_numbers( conditions )]
+    # end of ColumnarTable.select
+# end of class ColumnarTable
+
+
+
+def get_memory_size( obj:Any ) -> int:
+    """
+    Returns the approximate number of bytes used by the object and everything in it
+        (counting any shared objects, like interned strings, only once),
+        e.g., to compare a ColumnarTable with the equivalent dict of dicts.
+    """
+    seenIDs = set()
+    size = 0
+    pendingObjects = [obj]
+    while pendingObjects:
+        obj = pendingObjects.pop()
+        if id(obj) in seenIDs: continue
+        seenIDs.add( id(obj) )
+        size += sys.getsizeof( obj )
+        if isinstance( obj, dict ):
+            pendingObjects.extend( obj.keys() )
+            pendingObjects.extend( obj.values() )
+        elif isinstance( obj, (list,tuple,set,frozenset) ):
+            pendingObjects.extend( obj )
+        elif isinstance( obj, ColumnarTable ):
+            pendingObjects.append( vars( obj ) )
+    return size
+# end of ColumnarTable.get_memory_size
+
+
+
+def briefDemo() -> None:
+    """
+    Brief demo to check class is working
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    table = ColumnarTable()
+    table['__COLUMN_HEADERS__'] = ['FGid', 'B', 'C', 'V', 'Character ID', 'Quote Type']
+    for FGid, B, C, V, character, quoteType in (('GEN_1:3~', 'GEN', '1', '3', 'God', 'Normal'),
+                                                ('GEN_1:5~', 'GEN', '1', '5', 'narrator-GEN', 'Quotation'),
+                                                ('GEN_1:5~2', 'GEN', '1', '5', 'God', 'Indirect'),
+                                                ('ISA_1:2~', 'ISA', '1', '2', 'God', 'Dialogue')):
+        table[FGid] = { 'FGid':FGid, 'B':B, 'C':C, 'V':V, 'Character ID':character, 'Quote Type':quoteType }
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {table}" )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  GEN_1:5~2 is {table['GEN_1:5~2']}" )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  God speaks in {table.select( {'Character ID':'God'} )}" )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  God speaks Dialogue in ISA in {table.select( {'B':'ISA', 'Character ID':'God', 'Quote Type':'Dialogue'} )}" )
+    for key, row in table.items():
+        if key != '__COLUMN_HEADERS__' and row['FGid'].endswith( '~' ):
+            row['FGid'] = row['FGid'][:-1] # Written back into the table
+    table.rekey( 'FGid' )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Rekeyed to {list( table )}" )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Chapters are {table.get_int_column( 'C' )}" )
+# end of ColumnarTable.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+        by comparing it with a dict of dicts of the Glyssen CharacterVerse table.
+    """
+    from pathlib import Path
+    from csv import DictReader
+    import time
+    briefDemo()
+
+    filepath = Path( '../outsideSources/GlyssenData/CharacterVerse.tsv' )
+    if not filepath.is_file():
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Can't find {filepath} for the full demo." )
+        return
+    with open( filepath, 'rt', encoding='utf-8' ) as tsv_file:
+        tsv_lines = tsv_file.readlines()[1:] # Skip the version line
+    tsv_lines[0] = tsv_lines[0].replace( '#', 'B', 1 )
+    dictRows = { str(n):row for n,row in enumerate( DictReader( tsv_lines, delimiter='\t' ) ) }
+    table = ColumnarTable()
+    for key, row in dictRows.items():
+        table[key] = row
+    assert all( table[key] == row for key,row in dictRows.items() )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {table} takes {get_memory_size( table ):,} bytes but the dict of dicts takes {get_memory_size( dictRows ):,} bytes." )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Distinct values per column: { {columnName:len(values)-1 for columnName,values in zip( table.columnNames, table.columnValues )} }" )
+
+    conditions = { 'B':'ISA', 'Character ID':'God', 'Quote Type':'Dialogue' }
+    startTime = time.perf_counter()
+    for _loop in range( 100 ):
+        selectedKeys = table.select( conditions )
+    selectTime = (time.perf_counter() - startTime) / 100
+    startTime = time.perf_counter()
+    for _loop in range( 100 ):
+        expectedKeys = [key for key,row in dictRows.items() if all( row[columnName]==value for columnName,value in conditions.items() )]
+    scanTime = (time.perf_counter() - startTime) / 100
+    assert selectedKeys == expectedKeys, f"{selectedKeys} {expectedKeys}"
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Found {len(selectedKeys)} Dialogue quotes for God in ISA in {selectTime*1000:.2f}ms ({'with' if numpy is not None else 'without'} NumPy) rather than {scanTime*1000:.2f}ms for a scan of the dicts." )
+    laterChapterKeys = table.select( {'B':'ISA', 'C':lambda C: bool(C) and C.isdigit() and int(C) >= 40} )
+    assert laterChapterKeys == [key for key,row in dictRows.items() if row['B']=='ISA' and row['C'] and row['C'].isdigit() and int(row['C']) >= 40]
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Found {len(laterChapterKeys):,} rows for ISA 40-66." )
+# end of ColumnarTable.fullDemo
+
+if __name__ == '__main__':
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of ColumnarTable.py
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# DerivedFileWriter.py
+#
+# Module handling the atomic (and skip-if-unchanged) writing of our derived files
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+GitHub@gmail.com>
+#
+# License: CC0 1.0 Universal (CC0 1.0) Public Domain Dedication
+#
+#   This is a human-readable summary of the Legal Code
+#
+#   No Copyright
+#
+#   The person who associated a work with this deed has dedicated the work to the public domain
+#       by waiving all of his or her rights to the work worldwide under copyright law,
+#       including all related and neighboring rights, to the extent allowed by law.
+#
+#   You can copy, modify, distribute and perform the work, even for commercial purposes,
+#       all without asking permission. See Other Information below.
+#
+#   Other Information
+#
+#   In no way are the patent or trademark rights of any person affected by CC0,
+#       nor are the rights that other persons may have in the work or in how the work is used,
+#       such as publicity or privacy rights.
+#    Unless expressly stated otherwise, the person who associated a work with this deed makes no
+#       warranties about the work, and disclaims liability for all uses of the work,
+#       to the fullest extent permitted by applicable law.
+#    When using or citing the work, you should not imply endorsement by the author or the affirmer.
+#
+#   You should have received a copy of the formal licence text
+#   along with this program.  If not, see <https://CreativeCommons.org/publicdomain/zero/1.0/>.
+#
+"""
+Module to write our derived (output) files atomically,
+    and only if their content has actually changed.
+
+Each file is written to a temporary file alongside it,
+    and then a hash of its content is compared with a hash of the existing file.
+When calculating the hashes, we ignore the values of any volatile header fields
+    (like 'conversion_date' in the loaders' HEADER_DICT) which change on every run,
+    so if nothing else has changed, the temporary file is just deleted
+    and the existing file (with its modification time) is left untouched.
+Otherwise the temporary file atomically replaces the existing one.
+
+The headers are always near the start of our files (in any of our formats, even SQLite),
+    so we only look for the volatile fields in the first part of each file.
+
+display_write_report() shows how many files were actually written.
+"""
+from gettext import gettext as _
+from typing import List, Tuple, Optional
+from pathlib import Path
+import os
+import re
+import hashlib
+
+import BibleOrgSysGlobals
+from BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+
+
+LAST_MODIFIED_DATE = '2026-10-17' # by RJH
+SHORT_PROGRAM_NAME = "DerivedFileWriter"
+PROGRAM_NAME = "Derived file writer"
+PROGRAM_VERSION = '0.12'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+VOLATILE_HEADER_FIELD_NAMES = ('conversion_date',) # Header fields which change on every run (even if nothing else does)
+# Matches the field name followed by its (ISO date) value in JSON ('"conversion_date": "2026-10-16"'),
+#   XML ('<conversion_date>2026-10-16<'), or an SQLite record (where the name and value are adjacent)
+VOLATILE_FIELD_RE = re.compile( rb'((?:' + b'|'.join( re.escape(name.encode('utf-8')) for name in VOLATILE_HEADER_FIELD_NAMES )
+                                + rb')\W{0,4})\d{4}-\d\d-\d\d' )
+HEADER_SCAN_SIZE = 1 << 16 # 64 KiB -- How far into each file we look for the volatile header fields
+HASH_CHUNK_SIZE = 1 << 20 # 1 MiB
+
+
+write_results = [] # (filepath, was_written) since the last report
+reported_write_results = [] # (filepath, was_written) from the earlier reports (kept for the build manifests)
+
+
+
+def get_temporary_filepath( filepath:Path ) -> Path:
+    """
+    Returns the filepath that we write to before (maybe) replacing the real file.
+    """
+    return filepath.with_name( f'{filepath.name}.tmp' )
+# end of DerivedFileWriter.get_temporary_filepath
+
+
+def hash_content( filepath:Path ) -> str:
+    """
+    Returns the sha256 hex digest of the content of the file
+        ignoring the values of any volatile header fields near the start.
+    """
+    hasher = hashlib.sha256()
+    with open( filepath, 'rb' ) as inputFile:
+        hasher.update( VOLATILE_FIELD_RE.sub( rb'\1', inputFile.read( HEADER_SCAN_SIZE ) ) )
+        while chunk := inputFile.read( HASH_CHUNK_SIZE ):
+            hasher.update( chunk )
+    return hasher.hexdigest()
+# end of DerivedFileWriter.hash_content
+
+
+def is_content_unchanged( new_filepath:Path, filepath:Path ) -> bool:
+    """
+    Returns True if the file exists and has the same content as the new file
+        (ignoring the values of any volatile header fields).
+    """
+    try:
+        if os.path.getsize( filepath ) != os.path.getsize( new_filepath ): return False # Our volatile values are all fixed-length
+    except FileNotFoundError: return False
+    return hash_content( new_filepath ) == hash_content( filepath )
+# end of DerivedFileWriter.is_content_unchanged
+
+
+def replace_if_changed( temp_filepath:Path, filepath:Path, results:Optional[List[Tuple[Path,bool]]]=None ) -> bool:
+    """
+    Atomically replaces the file with the newly written temporary file
+        if the content has changed (otherwise just deletes the temporary file).
+
+    The result is appended to results (defaults to write_results).
+
+    Returns True if the file was replaced.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"replace_if_changed( {temp_filepath}, {filepath} )" )
+    if is_content_unchanged( temp_filepath, filepath ):
+        os.remove( temp_filepath )
+        was_written = False
+    else:
+        os.replace( temp_filepath, filepath )
+        was_written = True
+    (write_results if results is None else results).append( (filepath, was_written) )
+    return was_written
+# end of DerivedFileWriter.replace_if_changed
+
+
+class DerivedFile:
+    """
+    Context manager to use instead of open() when writing a derived file, e.g.,
+        with DerivedFile( filepath, 'wt', encoding='utf-8' ) as outputFile:
+            outputFile.write( … )
+
+    The file object is actually for a temporary file
+        which replaces the real file at the end (only if its content changed).
+    If there's an exception, the temporary file is deleted and the real file isn't touched.
+    """
+    def __init__( self, filepath:Path, mode:str='wt', results:Optional[List[Tuple[Path,bool]]]=None, **open_kwargs ) -> None:
+        """
+        The mode and open_kwargs (e.g., encoding, buffering) are passed to open().
+        The result is appended to results (defaults to write_results).
+        """
+        assert mode.startswith( 'w' )
+        self.filepath, self.mode, self.results, self.open_kwargs = Path( filepath ), mode, results, open_kwargs
+        self.temp_filepath = get_temporary_filepath( self.filepath )
+        self.was_written = None
+    # end of DerivedFile.__init__
+
+    def __enter__( self ):
+        self.outputFile = open( self.temp_filepath, self.mode, **self.open_kwargs )
+        return self.outputFile
+    # end of DerivedFile.__enter__
+
+    def __exit__( self, exc_type, exc_value, traceback ) -> None:
+        self.outputFile.close()
+        if exc_type is not None:
+            os.remove( self.temp_filepath )
+            return
+        self.was_written = replace_if_changed( self.temp_filepath, self.filepath, self.results )
+    # end of DerivedFile.__exit__
+# end of class DerivedFile
+
+
+def display_write_report() -> None:
+    """
+    Display how many of the derived files written since the last report
+        actually changed (and then forget them).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, "display_write_report()" )
+    if not write_results: return
+    written_count = sum( 1 for _filepath,was_written in write_results if was_written )
+    unchanged_note = '' if written_count == len(write_results) \
+                    else " (they were all unchanged so weren't rewritten)" if written_count == 0 \
+                    else " (the others were unchanged so weren't rewritten)"
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"\nWrote {written_count:,} of {len(write_results):,} derived files{unchanged_note}." )
+    for filepath, was_written in write_results:
+        if was_written: vPrint( 'Info', DEBUGGING_THIS_MODULE, f"  Wrote changed {filepath}" )
+    reported_write_results.extend( write_results )
+    write_results.clear()
+# end of DerivedFileWriter.display_write_report
+
+
+def get_all_write_results() -> List[Tuple[Path,bool]]:
+    """
+    Returns the (filepath, was_written) results for all of the derived files
+        written (or found unchanged) so far in this run, in order,
+        whether or not they've been reported yet.
+    """
+    return reported_write_results + write_results
+# end of DerivedFileWriter.get_all_write_results
+
+
+
+def briefDemo() -> None:
+    """
+    Brief demo to check module is working
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    import tempfile
+    with tempfile.TemporaryDirectory() as temp_folderpath:
+        filepath = Path( temp_folderpath, 'test.json' )
+        for date_string, data in (('2026-10-15','Fred'), ('2026-10-16','Fred'), ('2026-10-16','Freddy')):
+            with DerivedFile( filepath, 'wt', encoding='utf-8' ) as outputFile:
+                outputFile.write( f'{{\n  "__HEADERS__": {{\n    "conversion_date": "{date_string}"\n  }},\n  "name": "{data}"\n}}' )
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Written: {[was_written for _filepath,was_written in write_results]} (should be [True, False, True])" )
+        display_write_report()
+# end of DerivedFileWriter.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check module is working
+    """
+    briefDemo()
+# end of DerivedFileWriter.fullDemo
+
+if __name__ == '__main__':
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of DerivedFileWriter.py
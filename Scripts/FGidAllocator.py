@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# FGidAllocator.py
+#
+# Module handling the allocation of our Freely-Given ids (FGids) for the loaders
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+GitHub@gmail.com>
+#
+# License: CC0 1.0 Universal (CC0 1.0) Public Domain Dedication
+#
+#   This is a human-readable summary of the Legal Code
+#
+#   No Copyright
+#
+#   The person who associated a work with this deed has dedicated the work to the public domain
+#       by waiving all of his or her rights to the work worldwide under copyright law,
+#       including all related and neighboring rights, to the extent allowed by law.
+#
+#   You can copy, modify, distribute and perform the work, even for commercial purposes,
+#       all without asking permission. See Other Information below.
+#
+#   Other Information
+#
+#   In no way are the patent or trademark rights of any person affected by CC0,
+#       nor are the rights that other persons may have in the work or in how the work is used,
+#       such as publicity or privacy rights.
+#    Unless expressly stated otherwise, the person who associated a work with this deed makes no
+#       warranties about the work, and disclaims liability for all uses of the work,
+#       to the fullest extent permitted by applicable law.
+#    When using or citing the work, you should not imply endorsement by the author or the affirmer.
+#
+#   You should have received a copy of the formal licence text
+#   along with this program.  If not, see <https://CreativeCommons.org/publicdomain/zero/1.0/>.
+#
+"""
+Module to allocate our Freely-Given ids (FGids) as the loaders
+    work through the rows of their source tables.
+
+We don't append a numerical suffix for the first entry with a given name.
+However, if the same name is used again, we append suffixes starting with 2.
+So might end up with "Fred, Fred2, Fred3".
+(The loaders later convert that to "Fred1, Fred2, Fred3"
+    and if Fred3 is the most well-known one, to "Fred1, Fred2, Fred".)
+
+We keep a count for each name (rather than searching a list of names used so far)
+    so that each allocation is a constant-time operation.
+"""
+from gettext import gettext as _
+from collections import defaultdict
+
+import BibleOrgSysGlobals
+from BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+
+
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
+SHORT_PROGRAM_NAME = "FGidAllocator"
+PROGRAM_NAME = "Freely-Given id allocator"
+PROGRAM_VERSION = '0.10'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+
+class FGidAllocator:
+    """
+    Allocates unique ids from (possibly repeated) base names,
+        e.g., 'Fred', 'Fred2', 'Fred3'.
+
+    Also remembers the largest suffix that had to be used (and on which name)
+        so that the loaders can report it.
+    """
+    def __init__( self, dataName:str ) -> None:
+        """
+        dataName is only used for display, e.g., 'people' or 'characters'.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"FGidAllocator.__init__( {dataName!r} )" )
+        self.dataName = dataName
+        self.name_counts = defaultdict(int) # Number of times each base name has been seen
+        self.allocated_ids = set()
+        self.max_suffix, self.max_name = 0, ''
+    # end of FGidAllocator.__init__
+
+
+    def __str__( self ) -> str:
+        return f"FGidAllocator for {self.dataName}: {len(self.allocated_ids):,} ids from {len(self.name_counts):,} names (max suffix was {self.max_suffix} on '{self.max_name}')"
+    def __len__( self ) -> int:
+        return len(self.allocated_ids)
+    def __contains__( self, FGid:str ) -> bool:
+        return FGid in self.allocated_ids
+
+
+    def allocate( self, name:str ) -> str:
+        """
+        Returns the next unused id for the given base name.
+
+        If a suffixed id is already taken (e.g., there was an original name 'Fred2'),
+            we just keep incrementing the suffix until we find a free one.
+        """
+        assert name
+        count = self.name_counts[name] + 1
+        FGid = name if count == 1 else f'{name}{count}'
+        while FGid in self.allocated_ids: # Very rare
+            count += 1
+            FGid = f'{name}{count}'
+        self.name_counts[name] = count
+        self.allocated_ids.add( FGid )
+        if count > 1 and count > self.max_suffix:
+            self.max_suffix, self.max_name = count, name
+        return FGid
+    # end of FGidAllocator.allocate
+
+
+    def count( self, name:str ) -> int:
+        """
+        Returns the number of ids allocated so far for the given base name.
+        """
+        return self.name_counts.get(name, 0)
+    # end of FGidAllocator.count
+
+
+    def report( self ) -> None:
+        """
+        Display the largest suffix that we had to use.
+        """
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Max suffix for {self.dataName} was {self.max_suffix} on {self.max_name}." )
+    # end of FGidAllocator.report
+# end of class FGidAllocator
+
+
+
+def briefDemo() -> None:
+    """
+    Brief demo to check class is working
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    allocator = FGidAllocator( 'demo' )
+    for name in ('Fred','Joe','Fred','Fred2','Fred','Joe'):
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {name!r} -> {allocator.allocate(name)!r}" )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, allocator )
+    allocator.report()
+# end of FGidAllocator.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+    """
+    briefDemo()
+# end of FGidAllocator.fullDemo
+
+if __name__ == '__main__':
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of FGidAllocator.py
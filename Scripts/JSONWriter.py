@@ -0,0 +1,503 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# JSONWriter.py
+#
+# Module handling the streaming export of our JSON data files
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+GitHub@gmail.com>
+#
+# License: CC0 1.0 Universal (CC0 1.0) Public Domain Dedication
+#
+#   This is a human-readable summary of the Legal Code
+#
+#   No Copyright
+#
+#   The person who associated a work with this deed has dedicated the work to the public domain
+#       by waiving all of his or her rights to the work worldwide under copyright law,
+#       including all related and neighboring rights, to the extent allowed by law.
+#
+#   You can copy, modify, distribute and perform the work, even for commercial purposes,
+#       all without asking permission. See Other Information below.
+#
+#   Other Information
+#
+#   In no way are the patent or trademark rights of any person affected by CC0,
+#       nor are the rights that other persons may have in the work or in how the work is used,
+#       such as publicity or privacy rights.
+#    Unless expressly stated otherwise, the person who associated a work with this deed makes no
+#       warranties about the work, and disclaims liability for all uses of the work,
+#       to the fullest extent permitted by applicable law.
+#    When using or citing the work, you should not imply endorsement by the author or the affirmer.
+#
+#   You should have received a copy of the formal licence text
+#   along with this program.  If not, see <https://CreativeCommons.org/publicdomain/zero/1.0/>.
+#
+"""
+Module to write our (header plus entries) dicts to JSON files
+    one entry at a time through a write buffer,
+    rather than using json.dump( HEADER_DICT | the_dict, … )
+    which copies the dict and then writes thousands of tiny chunks.
+
+The (default) indented output is exactly the same as json.dump with indent=2
+    (and ensure_ascii=False) would produce, but it's built with our own simpler encoder
+    (Python's own C encoder can't indent, so json.dump falls back to a slow generator-based one).
+The compact output (no indentation or spaces) uses Python's C encoder for each entry.
+
+Optionally, gzip and/or xz compressed copies can be written at the same time
+    (compressing the data as it's written rather than rereading the file afterwards).
+
+write_JSON_files can be used to write a number of files in parallel.
+
+Each file (and compressed copy) is only replaced if its content has changed
+    (ignoring the conversion date, see DerivedFileWriter.py).
+
+write_JSON_lines_file writes one entry per line (with the headers in a separate file)
+    so that the entries can be read one at a time.
+"""
+from gettext import gettext as _
+from collections import defaultdict
+from typing import Dict, List, Tuple, Callable, Optional
+from pathlib import Path
+import os
+import time
+import multiprocessing
+import concurrent.futures
+import json
+import zlib
+import lzma
+from json.encoder import encode_basestring # The C version (if available) which doesn't escape non-ASCII characters
+
+import BibleOrgSysGlobals
+from BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+from DerivedFileWriter import DerivedFile, write_results, get_temporary_filepath
+
+
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
+SHORT_PROGRAM_NAME = "JSONWriter"
+PROGRAM_NAME = "Streaming JSON writer"
+PROGRAM_VERSION = '0.14'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+WRITE_BUFFER_SIZE = 1 << 16 # 64 KiB
+INDENT_STRING = '  ' # Same as json.dump( …, indent=2 )
+COMPRESSION_FORMATS = ('gz', 'xz') # File extensions of the compressed copies that we can write
+GZIP_COMPRESSION_LEVEL = 6 # zlib's default (9 is about three times slower for only about 4% smaller files)
+XZ_COMPRESSION_PRESET = 6 # The xz default (higher presets only help with files much bigger than ours)
+
+
+compressed_copy_results = [] # (filepath, extension, uncompressed_size, compressed_size, seconds) since the last report
+pending_file_list = [] # Parameters for _write_JSON_file (only set while write_JSON_files is running)
+
+
+
+def encode_key( key ) -> str:
+    """
+    Returns the JSON encoding of a dict key.
+
+    Like json.dump, we convert non-string keys (e.g., integers) to strings.
+    """
+    if isinstance( key, str ): return encode_basestring( key )
+    if key is True: return '"true"'
+    if key is False: return '"false"'
+    if key is None: return '"null"'
+    if isinstance( key, (int,float) ): return encode_basestring( encode_scalar(key) )
+    raise TypeError( f"Keys must be str, int, float, bool or None, not {key.__class__.__name__}" )
+# end of JSONWriter.encode_key
+
+
+def encode_scalar( obj ) -> str:
+    """
+    Returns the JSON encoding of None, a bool, an int, or a float.
+
+    Raises a TypeError for anything else.
+    """
+    if obj is None: return 'null'
+    if obj is True: return 'true'
+    if obj is False: return 'false'
+    if isinstance( obj, int ): return int.__repr__( obj )
+    if isinstance( obj, float ): return json.dumps( obj ) # Handles NaN and Infinity the same as json.dump
+    raise TypeError( f"Object of type {obj.__class__.__name__} is not JSON serializable" )
+# end of JSONWriter.encode_scalar
+
+
+def encode_indented( obj, newline_indent:str, output_list:list, default:Optional[Callable] ) -> None:
+    """
+    Appends the indented JSON encoding of the object to output_list.
+
+    newline_indent is the newline plus the indent of the line that the object starts on.
+    default (if given) is called to convert any objects that JSON can't serialise
+        (e.g., render_packed_references_for_JSON for our arrays of packed verse keys).
+    """
+    if isinstance( obj, str ):
+        output_list.append( encode_basestring( obj ) )
+    elif isinstance( obj, dict ):
+        if not obj: output_list.append( '{}' ); return
+        inner_newline_indent = newline_indent + INDENT_STRING
+        output_list.append( '{' )
+        separator = inner_newline_indent
+        for key, value in obj.items():
+            output_list.append( f'{separator}{encode_key(key)}: ' )
+            encode_indented( value, inner_newline_indent, output_list, default )
+            separator = ',' + inner_newline_indent
+        output_list.append( newline_indent + '}' )
+    elif isinstance( obj, (list,tuple) ):
+        if not obj: output_list.append( '[]' ); return
+        inner_newline_indent = newline_indent + INDENT_STRING
+        output_list.append( '[' )
+        separator = inner_newline_indent
+        for value in obj:
+            output_list.append( separator )
+            encode_indented( value, inner_newline_indent, output_list, default )
+            separator = ',' + inner_newline_indent
+        output_list.append( newline_indent + ']' )
+    else:
+        try: output_list.append( encode_scalar( obj ) )
+        except TypeError:
+            if default is None: raise
+            encode_indented( default(obj), newline_indent, output_list, default )
+# end of JSONWriter.encode_indented
+
+
+class CompressedCopy:
+    """
+    Writes a gzip or xz compressed copy of a file as it's being written,
+        and keeps track of the compressed size and the time taken to compress it.
+
+    The gzip header has a zero timestamp and no filename
+        so that identical data always gives an identical compressed file.
+
+    The copy is written to a temporary file which only replaces the real one
+        if the uncompressed file was replaced (see close).
+    """
+    def __init__( self, filepath:Path, extension:str ) -> None:
+        """
+        The compressed copy is written to filepath with the extension (e.g., 'gz') appended.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"CompressedCopy.__init__( {filepath}, {extension!r} )" )
+        assert extension in COMPRESSION_FORMATS
+        self.extension = extension
+        self.filepath = Path( f'{filepath}.{extension}' )
+        self.compressor = zlib.compressobj( GZIP_COMPRESSION_LEVEL, zlib.DEFLATED, 16+zlib.MAX_WBITS ) if extension=='gz' \
+                            else lzma.LZMACompressor( preset=XZ_COMPRESSION_PRESET )
+        self.outputFile = open( get_temporary_filepath( self.filepath ), 'wb' )
+        self.uncompressed_size = self.compressed_size = 0
+        self.seconds = 0.0
+    # end of CompressedCopy.__init__
+
+
+    def write( self, data:bytes ) -> None:
+        start_time = time.perf_counter()
+        compressed_data = self.compressor.compress( data )
+        self.seconds += time.perf_counter() - start_time
+        self.uncompressed_size += len(data)
+        self.compressed_size += len(compressed_data)
+        self.outputFile.write( compressed_data )
+    # end of CompressedCopy.write
+
+
+    def close( self, replace:bool ) -> bool:
+        """
+        Finishes the compressed copy and replaces the real one with it
+            if replace is set (i.e., if the uncompressed file changed) or if there's no real one yet.
+
+        (The compressed data always changes with the conversion date, so can't be compared itself.)
+
+        Returns True if the compressed copy was replaced.
+        """
+        start_time = time.perf_counter()
+        compressed_data = self.compressor.flush()
+        self.seconds += time.perf_counter() - start_time
+        self.compressed_size += len(compressed_data)
+        self.outputFile.write( compressed_data )
+        self.outputFile.close()
+        if replace or not self.filepath.exists():
+            os.replace( self.outputFile.name, self.filepath )
+            return True
+        os.remove( self.outputFile.name )
+        return False
+    # end of CompressedCopy.close
+# end of class CompressedCopy
+
+
+def write_JSON_file( filepath:Path, header_dict:Dict[str,dict], the_dict:dict, compact:bool=False, default:Optional[Callable]=None,
+                        compression_formats:Tuple[str,...]=() ) -> int:
+    """
+    Writes the header entries and then the entries from the_dict (in order)
+        as a single JSON object, one entry at a time.
+
+    If compact is False, the output is the same as
+        json.dump( header_dict | the_dict, outputFile, ensure_ascii=False, indent=2, default=default ).
+    If compact is True, there's no indentation and no spaces after separators.
+
+    Note that (as with json.dump) any entry in the_dict with the same key
+        as a header entry will produce a duplicated JSON key.
+
+    If compression_formats are given (e.g., COMPRESSION_FORMATS), we also write compressed copies
+        (e.g., 'file.json.gz' and 'file.json.xz') as we go
+        and remember their sizes and times for display_compression_report().
+
+    Returns the number of entries written (not counting the header entries).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"write_JSON_file( {filepath}, {len(header_dict)}, {len(the_dict):,}, compact={compact}, compression_formats={compression_formats} )" )
+    compression_results, file_results = _write_JSON_file( filepath, header_dict, the_dict, compact, default, compression_formats )
+    compressed_copy_results.extend( compression_results )
+    write_results.extend( file_results )
+    return len(the_dict)
+# end of JSONWriter.write_JSON_file
+
+
+def _write_JSON_file( filepath:Path, header_dict:Dict[str,dict], the_dict:dict, compact:bool, default:Optional[Callable],
+                        compression_formats:Tuple[str,...], json_lines:bool=False ) -> Tuple[List[tuple],List[tuple]]:
+    """
+    Does the work for write_JSON_file and write_JSON_lines_file (see above and below),
+        returning the results for any compressed copies
+        and the (filepath, was_written) results for each file
+        rather than adding them to compressed_copy_results and DerivedFileWriter.write_results
+        (so that they can be collected from threads or other processes).
+    """
+    file_results = []
+    if json_lines:
+        metadata_dict = header_dict | { key:value for key,value in the_dict.items() if is_metadata_key(key) }
+        metadata_dict['__JSON_LINES__'] = { 'filename': filepath.name,
+            'entry_count': sum( 1 for key in the_dict if not is_metadata_key(key) ),
+            'format': "Each line is a JSON object with a single key (the id of the entry) and its value" }
+        file_results.extend( _write_JSON_file( get_JSON_lines_headers_filepath( filepath ), {}, metadata_dict, False, default, () )[1] )
+    if compact or json_lines:
+        encode_entry = json.JSONEncoder( ensure_ascii=False, separators=(',',':'), default=default ).encode
+    compressed_copies = [CompressedCopy( filepath, extension ) for extension in compression_formats]
+    derived_file = DerivedFile( filepath, 'wt', results=file_results, encoding='utf-8', buffering=WRITE_BUFFER_SIZE )
+    with derived_file as outputFile:
+        def write( text:str ) -> None:
+            outputFile.write( text )
+            if compressed_copies:
+                data = text.encode( 'utf-8' )
+                for compressed_copy in compressed_copies:
+                    compressed_copy.write( data )
+
+        if json_lines:
+            for key, value in the_dict.items():
+                if not is_metadata_key( key ):
+                    write( f'{{{encode_key(key)}:{encode_entry(value)}}}\n' )
+        else:
+            write( '{' )
+            separator = '' if compact else f'\n{INDENT_STRING}'
+            for entries in (header_dict, the_dict):
+                for key, value in entries.items():
+                    if compact:
+                        write( f'{separator}{encode_key(key)}:{encode_entry(value)}' )
+                        separator = ','
+                    else:
+                        output_list = [separator, encode_key(key), ': ']
+                        encode_indented( value, f'\n{INDENT_STRING}', output_list, default )
+                        write( ''.join(output_list) )
+                        separator = f',\n{INDENT_STRING}'
+            write( '}' if compact or not (header_dict or the_dict) else '\n}' )
+    return _close_compressed_copies( filepath, compressed_copies, derived_file.was_written, file_results ), file_results
+# end of JSONWriter._write_JSON_file
+
+
+def _close_compressed_copies( filepath:Path, compressed_copies:List[CompressedCopy], was_written:bool, file_results:List[tuple] ) -> List[tuple]:
+    """
+    Finishes off any compressed copies of the file
+        (only replacing them if the file itself was written)
+        and returns their results (for compressed_copy_results).
+
+    The (filepath, was_written) result for each compressed copy is appended to file_results.
+    """
+    results = []
+    for compressed_copy in compressed_copies:
+        file_results.append( (compressed_copy.filepath, compressed_copy.close( was_written )) )
+        results.append( (filepath, compressed_copy.extension, compressed_copy.uncompressed_size, compressed_copy.compressed_size, compressed_copy.seconds) )
+    return results
+# end of JSONWriter._close_compressed_copies
+
+
+def is_metadata_key( key ) -> bool:
+    """
+    Returns True for keys like '__HEADERS__' and '__COLUMN_HEADERS__'
+        which aren't actual entries in our tables.
+    """
+    return isinstance( key, str ) and key.startswith( '__' ) and key.endswith( '__' )
+# end of JSONWriter.is_metadata_key
+
+
+def get_JSON_lines_headers_filepath( filepath:Path ) -> Path:
+    """
+    Returns the filepath of the sidecar file which holds the headers for a JSON Lines file,
+        e.g., 'normalised_People.headers.json' for 'normalised_People.jsonl'.
+    """
+    return filepath.with_suffix( '.headers.json' )
+# end of JSONWriter.get_JSON_lines_headers_filepath
+
+
+def write_JSON_lines_file( filepath:Path, header_dict:Dict[str,dict], the_dict:dict, default:Optional[Callable]=None,
+                        compression_formats:Tuple[str,...]=() ) -> int:
+    """
+    Writes the entries from the_dict (in order) as JSON Lines (see https://JSONLines.org),
+        i.e., one compact JSON object per line, each with a single key (the entry id) and its value,
+        e.g., {"Fred":{"names":["Fred","Freddy"],"age":42}}
+        so that the entries can be read (or grepped or split) one at a time.
+
+    The header entries and any other metadata entries from the_dict (like '__COLUMN_HEADERS__')
+        are written (indented) to a separate sidecar file (see get_JSON_lines_headers_filepath)
+        along with a '__JSON_LINES__' entry describing the JSON Lines file.
+
+    Compressed copies of the JSON Lines file (not the sidecar) are written as for write_JSON_file.
+
+    Returns the number of entries written.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"write_JSON_lines_file( {filepath}, {len(header_dict)}, {len(the_dict):,}, compression_formats={compression_formats} )" )
+    compression_results, file_results = _write_JSON_file( filepath, header_dict, the_dict, True, default, compression_formats, json_lines=True )
+    compressed_copy_results.extend( compression_results )
+    write_results.extend( file_results )
+    return sum( 1 for key in the_dict if not is_metadata_key(key) )
+# end of JSONWriter.write_JSON_lines_file
+
+
+def write_JSON_files( file_list:List[Tuple[Path,dict]], header_dict:Dict[str,dict], compact:bool=False, default:Optional[Callable]=None,
+                        compression_formats:Tuple[str,...]=(), json_lines:bool=False ) -> bool:
+    """
+    Writes each (filepath, the_dict) in file_list as for write_JSON_file
+        (or write_JSON_lines_file if json_lines is set -- see above),
+        but in parallel (up to BibleOrgSysGlobals.maxProcesses at a time) if possible,
+        and displays the time taken for each file.
+
+    Where possible (i.e., on systems that can fork, and if we're not already in a subprocess),
+        we use a process pool. The subprocesses inherit file_list when they're forked,
+        so they're only sent the index of the file to write (not the large dicts).
+    Otherwise we use a thread pool, which still lets the writing and compression
+        (but not the JSON encoding) overlap.
+
+    Each file is written by exactly the same code whichever way we do it,
+        so the output files are always the same.
+
+    Returns True if successful.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"write_JSON_files( {len(file_list)}, {len(header_dict)}, compact={compact}, compression_formats={compression_formats}, json_lines={json_lines} )" )
+    global pending_file_list
+    pending_file_list = [(filepath, header_dict, the_dict, compact, default, compression_formats, json_lines) for filepath,the_dict in file_list]
+    num_workers = min( BibleOrgSysGlobals.maxProcesses, len(pending_file_list) )
+    # Start the biggest files first so that the workers finish at about the same time
+    index_order = sorted( range(len(file_list)), key=lambda index: -len(file_list[index][1]) ) if num_workers > 1 else range(len(file_list))
+    start_time = time.perf_counter()
+    if num_workers > 1 and not BibleOrgSysGlobals.alreadyMultiprocessing \
+    and multiprocessing.get_start_method() == 'fork':
+        BibleOrgSysGlobals.alreadyMultiprocessing = True
+        try:
+            with multiprocessing.Pool( processes=num_workers ) as pool:
+                ordered_results = pool.map( write_pending_JSON_file, index_order )
+        finally: BibleOrgSysGlobals.alreadyMultiprocessing = False
+        parallel_method = f'{num_workers} processes'
+    elif num_workers > 1:
+        with concurrent.futures.ThreadPoolExecutor( max_workers=num_workers ) as executor:
+            ordered_results = list( executor.map( write_pending_JSON_file, index_order ) )
+        parallel_method = f'{num_workers} threads'
+    else: # Just single-threaded
+        ordered_results = [write_pending_JSON_file( index ) for index in index_order]
+        parallel_method = 'one at a time'
+    total_seconds = time.perf_counter() - start_time
+    pending_file_list = []
+    results = [None] * len(file_list)
+    for index, result in zip( index_order, ordered_results ):
+        results[index] = result
+
+    for (filepath,the_dict), (seconds,compression_results,file_results) in zip( file_list, results ):
+        vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"    Wrote {len(the_dict):,} entries to {filepath.name} in {seconds:.2f}s{'' if dict(file_results)[filepath] else ' (unchanged so not replaced)'}." )
+        compressed_copy_results.extend( compression_results )
+        write_results.extend( file_results )
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"    Wrote {len(file_list)} JSON{' Lines' if json_lines else ''} files ({parallel_method}) in {total_seconds:.2f}s (sum of file times was {sum(result[0] for result in results):.2f}s)." )
+    return True
+# end of JSONWriter.write_JSON_files
+
+
+def write_pending_JSON_file( index:int ) -> Tuple[float,List[tuple],List[tuple]]:
+    """
+    Writes one file from pending_file_list (possibly in a thread or another process).
+
+    Returns the time taken, the results for any compressed copies,
+        and the (filepath, was_written) results.
+    """
+    start_time = time.perf_counter()
+    compression_results, file_results = _write_JSON_file( *pending_file_list[index] )
+    return time.perf_counter() - start_time, compression_results, file_results
+# end of JSONWriter.write_pending_JSON_file
+
+
+def display_compression_report() -> None:
+    """
+    Display the sizes and compression times of the compressed copies
+        written since the last report (and then forget them).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, "display_compression_report()" )
+    if not compressed_copy_results: return
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "\nCompressed JSON file sizes:" )
+    totals = defaultdict( lambda: [0, 0, 0.0] )
+    for filepath, extension, uncompressed_size, compressed_size, seconds in compressed_copy_results:
+        vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  {filepath.name:<48} {uncompressed_size:>10,} -> {extension} {compressed_size:>9,} ({compressed_size/uncompressed_size:5.1%}) in {seconds:.2f}s" )
+        totals[extension][0] += uncompressed_size
+        totals[extension][1] += compressed_size
+        totals[extension][2] += seconds
+    for extension, (uncompressed_size, compressed_size, seconds) in totals.items():
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Total {extension}: {uncompressed_size:,} bytes compressed to {compressed_size:,} bytes ({compressed_size/uncompressed_size:.1%}) in {seconds:.2f}s." )
+    compressed_copy_results.clear()
+# end of JSONWriter.display_compression_report
+
+
+
+def briefDemo() -> None:
+    """
+    Brief demo to check module is working
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    import tempfile, gzip
+    header_dict = { '__HEADERS__': {'conversion_software':PROGRAM_NAME_VERSION} }
+    the_dict = { 'Fred': {'names':['Fred','Freddy'], 'age':42, 'height':1.8, 'married':True, 'spouse':None, 'children':[], 'notes':{}},
+                 'Zoë': {'names':['Zoë'], 'refs':('GEN_1:1','EXO_2:3'), 7:'int key'} }
+    with tempfile.TemporaryDirectory() as temp_folderpath:
+        for compact in (False, True):
+            filepath = Path( temp_folderpath, 'test.json' )
+            write_JSON_file( filepath, header_dict, the_dict, compact=compact, compression_formats=COMPRESSION_FORMATS )
+            with open( filepath, 'rt', encoding='utf-8' ) as inputFile:
+                written = inputFile.read()
+            for extension, open_function in (('gz',gzip.open), ('xz',lzma.open)):
+                with open_function( f'{filepath}.{extension}', 'rt', encoding='utf-8' ) as compressedInputFile:
+                    if compressedInputFile.read() != written:
+                        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Compressed {extension} copy DOES NOT MATCH" )
+            expected = json.dumps( header_dict | the_dict, ensure_ascii=False, separators=(',',':') ) if compact \
+                        else json.dumps( header_dict | the_dict, ensure_ascii=False, indent=2 )
+            vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {'Compact' if compact else 'Indented'} output is {len(written):,} characters and {'matches' if written==expected else 'DOES NOT MATCH'} json.dumps." )
+            vPrint( 'Normal', DEBUGGING_THIS_MODULE, written )
+        display_compression_report()
+
+        filepath = Path( temp_folderpath, 'test.jsonl' )
+        write_JSON_lines_file( filepath, header_dict, the_dict )
+        with open( filepath, 'rt', encoding='utf-8' ) as inputFile:
+            reloaded_dict = {}
+            for line in inputFile:
+                reloaded_dict.update( json.loads( line ) )
+        with open( get_JSON_lines_headers_filepath( filepath ), 'rt', encoding='utf-8' ) as inputFile:
+            headers = json.load( inputFile )
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  JSON Lines output with {headers['__JSON_LINES__']['entry_count']} entries {'matches' if reloaded_dict==json.loads(json.dumps(the_dict)) else 'DOES NOT MATCH'}." )
+# end of JSONWriter.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check module is working
+    """
+    briefDemo()
+# end of JSONWriter.fullDemo
+
+if __name__ == '__main__':
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of JSONWriter.py
@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# SQLiteExporter.py
+#
+# Module handling the export of our normalised tables into SQLite databases
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+GitHub@gmail.com>
+#
+# License: CC0 1.0 Universal (CC0 1.0) Public Domain Dedication
+#
+#   This is a human-readable summary of the Legal Code
+#
+#   No Copyright
+#
+#   The person who associated a work with this deed has dedicated the work to the public domain
+#       by waiving all of his or her rights to the work worldwide under copyright law,
+#       including all related and neighboring rights, to the extent allowed by law.
+#
+#   You can copy, modify, distribute and perform the work, even for commercial purposes,
+#       all without asking permission. See Other Information below.
+#
+#   Other Information
+#
+#   In no way are the patent or trademark rights of any person affected by CC0,
+#       nor are the rights that other persons may have in the work or in how the work is used,
+#       such as publicity or privacy rights.
+#    Unless expressly stated otherwise, the person who associated a work with this deed makes no
+#       warranties about the work, and disclaims liability for all uses of the work,
+#       to the fullest extent permitted by applicable law.
+#    When using or citing the work, you should not imply endorsement by the author or the affirmer.
+#
+#   You should have received a copy of the formal licence text
+#   along with this program.  If not, see <https://CreativeCommons.org/publicdomain/zero/1.0/>.
+#
+"""
+Module to export our normalised tables (dicts of entry dicts keyed by FGid)
+    into an SQLite database (using only the Python standard library sqlite3),
+    so that our apps can do indexed queries rather than loading and scanning the JSON files.
+
+Each loader writes its own database into its output folder containing:
+    a headers table (our usual __HEADERS__ fields as name/value rows),
+    a table for each normalised table, with an FGid primary key and a column for each field
+        (lists and dicts are stored as JSON text),
+    a verse_entities table linking each verse reference (and its dense verse ordinal,
+        see BibleReferences.py) to the FGids of the entries which occur in it,
+    and (if this SQLite has FTS5) a name_search full-text table
+        over the names, translations, and descriptions of the entries.
+
+open_combined_database attaches the databases from all the loaders to one connection
+    so that the TIPNR, Glyssen, and Theographic data can be joined in queries.
+"""
+from gettext import gettext as _
+from typing import Dict, List, Tuple, Callable, Optional, Iterator, Union
+from pathlib import Path
+import os
+import time
+import json
+import sqlite3
+import logging
+
+import BibleOrgSysGlobals
+from BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+from JSONWriter import is_metadata_key
+from DerivedFileWriter import get_temporary_filepath, replace_if_changed
+from BibleReferences import verse_ordinal, reference_ordinal
+
+
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
+SHORT_PROGRAM_NAME = "SQLiteExporter"
+PROGRAM_NAME = "SQLite database exporter"
+PROGRAM_VERSION = '0.12'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+SQLITE_FILE_EXTENSION = 'sqlite'
+HEADERS_TABLE_NAME = 'headers'
+VERSE_TABLE_NAME = 'verse_entities'
+SEARCH_TABLE_NAME = 'name_search'
+SEARCH_COLUMN_NAMES = ('names', 'translations', 'descriptions') # The same in every database so that searches can be combined
+SEARCH_TOKENIZER = 'unicode61 remove_diacritics 2' # So that searching for 'Zoe' also finds 'Zoë'
+
+
+
+def quote_identifier( name:str ) -> str:
+    """
+    Returns the table or column name quoted for SQL
+        (needed for column names like 'Character ID').
+    """
+    return '"' + name.replace( '"', '""' ) + '"'
+# end of SQLiteExporter.quote_identifier
+
+
+def get_entries( the_dict:dict ) -> Iterator[Tuple[str,dict]]:
+    """
+    Yields the FGid and entry dict of each actual entry in one of our tables
+        (i.e., skipping metadata like '__HEADERS__' and '__COLUMN_HEADERS__').
+    """
+    for FGid, entry in the_dict.items():
+        if not is_metadata_key( FGid ) and isinstance( entry, dict ):
+            yield FGid, entry
+# end of SQLiteExporter.get_entries
+
+
+def get_storage_class( value ) -> Optional[str]:
+    """
+    Returns the SQLite storage class that we'll store the value as
+        (lists and dicts are stored as JSON text).
+    """
+    if value is None: return None
+    if isinstance( value, int ): return 'INTEGER' # including bools
+    if isinstance( value, float ): return 'REAL'
+    return 'TEXT'
+# end of SQLiteExporter.get_storage_class
+
+
+def get_column_type( storage_classes:set ) -> str:
+    """
+    Returns the type to declare for a column containing values of the given storage classes.
+
+    Columns with a mixture of (non-numeric) types are declared without a type
+        so that SQLite doesn't try to convert the values
+        (e.g., we don't want a text value like '31.76' converted to a number).
+    """
+    storage_classes = storage_classes - {None}
+    if len( storage_classes ) == 1: return storage_classes.pop()
+    if storage_classes == {'INTEGER','REAL'}: return 'REAL'
+    return ''
+# end of SQLiteExporter.get_column_type
+
+
+def collect_strings( obj, key_names:Tuple[str,...], output_list:List[str], collecting:bool=False ) -> None:
+    """
+    Appends (without duplicates) all the non-empty strings from the object
+        which are anywhere below one of the given dict keys,
+        e.g., all of the translated names from a TIPNR entry for the key 'translations'.
+    """
+    if isinstance( obj, str ):
+        if collecting and obj and obj not in output_list:
+            output_list.append( obj )
+    elif isinstance( obj, dict ):
+        for key, value in obj.items():
+            collect_strings( value, key_names, output_list, collecting or key in key_names )
+    elif isinstance( obj, (list,tuple) ):
+        for value in obj:
+            collect_strings( value, key_names, output_list, collecting )
+# end of SQLiteExporter.collect_strings
+
+
+def create_headers_table( cursor:sqlite3.Cursor, header_dict:dict ) -> None:
+    """
+    Saves our header dict (e.g., {'__HEADERS__': {'conversion_software':…}})
+        as section/name/value rows.
+    """
+    cursor.execute( f'CREATE TABLE {HEADERS_TABLE_NAME} (section TEXT NOT NULL, name TEXT NOT NULL, value, PRIMARY KEY (section, name))' )
+    cursor.executemany( f'INSERT INTO {HEADERS_TABLE_NAME} VALUES (?, ?, ?)',
+        ( (section, name, value) for section, fields in header_dict.items() for name, value in fields.items() ) )
+# end of SQLiteExporter.create_headers_table
+
+
+def create_entity_table( cursor:sqlite3.Cursor, table_name:str, the_dict:dict, encode_JSON:Callable, indexed_column_names:Tuple[str,...] ) -> int:
+    """
+    Creates and fills a table for one of our normalised dicts.
+
+    The columns are all the fields found in the entries (in the order that they're first found),
+        each declared with a type if all its values are of the same type.
+    Any of the indexed_column_names which are in the table are indexed.
+
+    Returns the number of entries.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"create_entity_table( {table_name}, ({len(the_dict)}), {indexed_column_names} )" )
+    column_storage_classes = {} # Column name -> set of the storage classes of its values
+    for _FGid, entry in get_entries( the_dict ):
+        for column_name, value in entry.items():
+            if column_name != 'FGid': # That's our primary key
+                try: column_storage_classes[column_name].add( get_storage_class( value ) )
+                except KeyError: column_storage_classes[column_name] = { get_storage_class( value ) }
+    column_names = list( column_storage_classes )
+
+    column_definitions = ['FGid TEXT PRIMARY KEY'] \
+        + [f'{quote_identifier(column_name)} {get_column_type(column_storage_classes[column_name])}'.rstrip() for column_name in column_names]
+    cursor.execute( f'CREATE TABLE {quote_identifier(table_name)} ({", ".join(column_definitions)})' )
+    cursor.executemany( f'INSERT INTO {quote_identifier(table_name)} VALUES ({", ".join("?"*(len(column_names)+1))})',
+        ( (FGid, *(value if value is None or isinstance(value, (str,int,float)) else encode_JSON(value)
+                    for value in (entry.get(column_name) for column_name in column_names)))
+            for FGid, entry in get_entries( the_dict ) ) )
+    entry_count = cursor.rowcount
+
+    for column_name in indexed_column_names:
+        if column_name in column_storage_classes:
+            cursor.execute( f'CREATE INDEX {quote_identifier(f"{table_name}_{column_name}_index")} ON {quote_identifier(table_name)} ({quote_identifier(column_name)})' )
+    return entry_count
+# end of SQLiteExporter.create_entity_table
+
+
+def create_verse_table( cursor:sqlite3.Cursor, verse_index_list:List[Tuple[str,dict]] ) -> int:
+    """
+    Creates and fills the verse_entities (junction) table
+        from the verse reference indexes of each table,
+        i.e., from a list of (table_name, ref_index_dict) where ref_index_dict maps BOS references to lists of FGids.
+
+    The verse ordinal is NULL for any reference which isn't in our versification.
+
+    Returns the number of rows.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"create_verse_table( ({len(verse_index_list)}) )" )
+    cursor.execute( f'CREATE TABLE {VERSE_TABLE_NAME} (verse_ref TEXT NOT NULL, verse_ordinal INTEGER, table_name TEXT NOT NULL, FGid TEXT NOT NULL)' )
+    cursor.executemany( f'INSERT INTO {VERSE_TABLE_NAME} VALUES (?, ?, ?, ?)',
+        ( (ref, reference_ordinal(ref), table_name, FGid)
+            for table_name, ref_index_dict in verse_index_list
+                for ref, FGids in ref_index_dict.items()
+                    for FGid in dict.fromkeys( FGids ) ) ) # Removes any duplicates but keeps the order
+    row_count = max( cursor.rowcount, 0 )
+
+    # Index for looking up verses (or ranges of verses), for looking up exact references, and for finding the verses of an entry
+    cursor.execute( f'CREATE INDEX {VERSE_TABLE_NAME}_ordinal_index ON {VERSE_TABLE_NAME} (verse_ordinal, table_name)' )
+    cursor.execute( f'CREATE INDEX {VERSE_TABLE_NAME}_ref_index ON {VERSE_TABLE_NAME} (verse_ref)' )
+    cursor.execute( f'CREATE INDEX {VERSE_TABLE_NAME}_FGid_index ON {VERSE_TABLE_NAME} (FGid, verse_ordinal)' )
+    return row_count
+# end of SQLiteExporter.create_verse_table
+
+
+def create_search_table( cursor:sqlite3.Cursor, table_list:List[Tuple[str,dict]], search_keys:Dict[str,Tuple[str,...]] ) -> int:
+    """
+    Creates and fills the FTS5 full-text search table
+        with the names, translations, and descriptions of every entry.
+
+    search_keys maps each of our SEARCH_COLUMN_NAMES to the entry keys to collect the strings from
+        (which can be at any depth, e.g., inside the list of TIPNR names).
+
+    Returns the number of rows (or zero if this SQLite doesn't have FTS5).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"create_search_table( ({len(table_list)}), {search_keys} )" )
+    assert all( column_name in SEARCH_COLUMN_NAMES for column_name in search_keys ), f"{search_keys=}"
+    try:
+        cursor.execute( f"CREATE VIRTUAL TABLE {SEARCH_TABLE_NAME} USING fts5(FGid UNINDEXED, table_name UNINDEXED, {', '.join(SEARCH_COLUMN_NAMES)}, tokenize='{SEARCH_TOKENIZER}')" )
+    except sqlite3.OperationalError as err:
+        logging.error( f"Unable to create {SEARCH_TABLE_NAME} table (SQLite v{sqlite3.sqlite_version} probably doesn't have FTS5): {err}" )
+        return 0
+
+    def get_search_rows() -> Iterator[List[str]]:
+        for table_name, the_dict in table_list:
+            for FGid, entry in get_entries( the_dict ):
+                row = [FGid, table_name]
+                for column_name in SEARCH_COLUMN_NAMES:
+                    strings = []
+                    collect_strings( entry, search_keys.get( column_name, () ), strings )
+                    row.append( '\n'.join( strings ) )
+                if any( row[2:] ):
+                    yield row
+    cursor.executemany( f'INSERT INTO {SEARCH_TABLE_NAME} VALUES ({", ".join("?"*(len(SEARCH_COLUMN_NAMES)+2))})', get_search_rows() )
+    row_count = max( cursor.rowcount, 0 )
+    cursor.execute( f"INSERT INTO {SEARCH_TABLE_NAME}({SEARCH_TABLE_NAME}) VALUES ('optimize')" ) # Merge the index segments
+    return row_count
+# end of SQLiteExporter.create_search_table
+
+
+def export_SQLite_database( filepath:Path, header_dict:dict, table_list:List[Tuple[str,dict]], verse_index_list:List[Tuple[str,dict]],
+                            search_keys:Dict[str,Tuple[str,...]], indexed_column_names:Tuple[str,...]=(),
+                            search_table_names:Optional[Tuple[str,...]]=None, default:Optional[Callable]=None ) -> bool:
+    """
+    Write a new SQLite database containing our headers, the given (table_name, the_dict) tables,
+        the verse_entities table built from the given (table_name, ref_index_dict) verse indexes,
+        and the name_search full-text table
+        (containing the entries of all the tables unless search_table_names is given).
+
+    default (if given) is used when encoding lists and dicts as JSON
+        (e.g., render_packed_references_for_JSON for our arrays of packed verse keys).
+
+    The database is built in a temporary file which then replaces any existing one
+        so that an app reading the database never sees it half-written
+        (but only if its content has changed, see DerivedFileWriter.py).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"export_SQLite_database( {filepath}, …, ({len(table_list)}), ({len(verse_index_list)}), {search_keys}, {indexed_column_names}, {search_table_names} )" )
+    assert not any( table_name in (HEADERS_TABLE_NAME, VERSE_TABLE_NAME, SEARCH_TABLE_NAME) for table_name,_the_dict in table_list )
+    start_time = time.time()
+    encode_JSON = json.JSONEncoder( ensure_ascii=False, separators=(',',':'), default=default ).encode
+
+    temp_filepath = get_temporary_filepath( filepath )
+    if temp_filepath.exists(): os.remove( temp_filepath ) # Left over from a failed run
+    connection = sqlite3.connect( temp_filepath )
+    try:
+        connection.execute( 'PRAGMA journal_mode = OFF' ) # It's a new (temporary) file so we don't need to be able to roll back
+        connection.execute( 'PRAGMA synchronous = OFF' )
+        with connection: # All in one transaction
+            cursor = connection.cursor()
+            create_headers_table( cursor, header_dict )
+            entry_count = sum( create_entity_table( cursor, table_name, the_dict, encode_JSON, indexed_column_names )
+                                for table_name, the_dict in table_list )
+            verse_row_count = create_verse_table( cursor, verse_index_list )
+            search_row_count = create_search_table( cursor, [(table_name,the_dict) for table_name,the_dict in table_list
+                                                                if search_table_names is None or table_name in search_table_names], search_keys )
+        connection.execute( 'ANALYZE' ) # Gives the query planner statistics about our indexes
+    except Exception:
+        connection.close()
+        os.remove( temp_filepath )
+        raise
+    connection.close()
+    was_written = replace_if_changed( temp_filepath, filepath )
+
+    vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Wrote {entry_count:,} entries from {len(table_list)} tables with {verse_row_count:,} verse links and {search_row_count:,} search entries to {filepath} ({filepath.stat().st_size:,} bytes) in {time.time()-start_time:.2f}s{'' if was_written else ' (unchanged so not replaced)'}" )
+    return True
+# end of SQLiteExporter.export_SQLite_database
+
+
+def open_combined_database( filepaths:Dict[str,Union[Path,str]] ) -> sqlite3.Connection:
+    """
+    Returns a connection with each of the given databases attached (read-only) by the given schema name,
+        e.g., {'TIPNR':…/normalised_TIPNR.sqlite, 'Glyssen':…/normalised_GlyssenData.sqlite}
+        so that queries can join them, e.g., SELECT … FROM TIPNR.verse_entities JOIN Glyssen.verse_entities USING (verse_ordinal).
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"open_combined_database( {filepaths} )" )
+    connection = sqlite3.connect( ':memory:', uri=True )
+    for schema_name, filepath in filepaths.items():
+        connection.execute( f'ATTACH DATABASE ? AS {quote_identifier(schema_name)}', (f'{Path(filepath).resolve().as_uri()}?mode=ro',) )
+    return connection
+# end of SQLiteExporter.open_combined_database
+
+
+def find_verse_entities( connection:sqlite3.Connection, BBB:str, C:int, V:int, schema_name:str='main' ) -> List[Tuple[str,str]]:
+    """
+    Returns a list of (table_name, FGid) for the entries which occur in the given verse.
+    """
+    return connection.execute( f'SELECT table_name, FGid FROM {quote_identifier(schema_name)}.{VERSE_TABLE_NAME} WHERE verse_ordinal = ?',
+                                (verse_ordinal( BBB, C, V ),) ).fetchall()
+# end of SQLiteExporter.find_verse_entities
+
+
+def search_names( connection:sqlite3.Connection, query:str, schema_name:str='main', limit:int=20 ) -> List[Tuple[str,str]]:
+    """
+    Returns a list of (table_name, FGid) for the best matches of the FTS5 query,
+        e.g., 'Joshua', 'names:Jos*', or 'translations:Isaac AND descriptions:patriarch'.
+    """
+    return connection.execute( f'SELECT table_name, FGid FROM {quote_identifier(schema_name)}.{SEARCH_TABLE_NAME} WHERE {SEARCH_TABLE_NAME} MATCH ? ORDER BY rank LIMIT ?',
+                                (query, limit) ).fetchall()
+# end of SQLiteExporter.search_names
+
+
+
+def briefDemo() -> None:
+    """
+    Brief demo to check module is working
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    import tempfile
+    header_dict = { '__HEADERS__': {'conversion_software':PROGRAM_NAME_VERSION} }
+    people = { '__COLUMN_HEADERS__': ['FGid','name'],
+                'PAdam': {'FGid':'PAdam', 'name':'Adam', 'names':[{'translations':{'ESV':'Adam','KJB':'Adam'}}], 'age':930, 'description':"The first man", 'verses':['GEN_2:7','GEN_5:5']},
+                'PZoë': {'FGid':'PZoë', 'name':'Zoë', 'age':None, 'description':"Not in the Bible", 'verses':['[GEN_2:7a]','XYZ_1:1']} }
+    with tempfile.TemporaryDirectory() as temp_folderpath:
+        filepath = Path( temp_folderpath, f'test.{SQLITE_FILE_EXTENSION}' )
+        ref_index_dict = {}
+        for FGid, entry in get_entries( people ):
+            for ref in entry['verses']: ref_index_dict.setdefault( ref, [] ).append( FGid )
+        export_SQLite_database( filepath, header_dict, [('people',people)], [('people',ref_index_dict)],
+                                {'names':('name',), 'translations':('translations',), 'descriptions':('description',)}, ('name',) )
+        connection = open_combined_database( {'test':filepath} )
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  GEN_2:7 has {find_verse_entities( connection, 'GEN', 2, 7, 'test' )}" )
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Search for 'zoe' finds {search_names( connection, 'zoe', 'test' )}" )
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Search for 'descriptions:man' finds {search_names( connection, 'descriptions:man', 'test' )}" )
+        vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  {connection.execute('SELECT * FROM test.people').fetchall()}" )
+        connection.close()
+# end of SQLiteExporter.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check module is working
+    """
+    briefDemo()
+# end of SQLiteExporter.fullDemo
+
+if __name__ == '__main__':
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of SQLiteExporter.py
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# StageCheckpoints.py
+#
+# Module handling the checkpointing (and resuming) of the loader pipeline stages
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+GitHub@gmail.com>
+#
+# License: CC0 1.0 Universal (CC0 1.0) Public Domain Dedication
+#
+#   This is a human-readable summary of the Legal Code
+#
+#   No Copyright
+#
+#   The person who associated a work with this deed has dedicated the work to the public domain
+#       by waiving all of his or her rights to the work worldwide under copyright law,
+#       including all related and neighboring rights, to the extent allowed by law.
+#
+#   You can copy, modify, distribute and perform the work, even for commercial purposes,
+#       all without asking permission. See Other Information below.
+#
+#   Other Information
+#
+#   In no way are the patent or trademark rights of any person affected by CC0,
+#       nor are the rights that other persons may have in the work or in how the work is used,
+#       such as publicity or privacy rights.
+#    Unless expressly stated otherwise, the person who associated a work with this deed makes no
+#       warranties about the work, and disclaims liability for all uses of the work,
+#       to the fullest extent permitted by applicable law.
+#    When using or citing the work, you should not imply endorsement by the author or the affirmer.
+#
+#   You should have received a copy of the formal licence text
+#   along with this program.  If not, see <https://CreativeCommons.org/publicdomain/zero/1.0/>.
+#
+"""
+Module to snapshot the in-memory state of a loader before each stage of its pipeline
+    so that it can be resumed from that stage (with --resume-from)
+    without having to reload and reclean the source data every time,
+    e.g., while working on the normalisation code.
+
+All of our loaders use the same stage names (see STAGE_NAMES below)
+    and each loader provides:
+        run_stage( stage_name ) to run one stage, and
+        CHECKPOINT_STATE_NAMES -- the names of the module globals that hold its state.
+
+The checkpoints are saved using BibleOrgSysGlobals.pickleObject
+    into the BibleOrgSys object cache folder.
+Each checkpoint contains a key (the checkpoint format, the loader version,
+    and the loader's data flags) and is refused if that doesn't match the current loader.
+"""
+from gettext import gettext as _
+from typing import Dict, Optional
+from collections.abc import MutableMapping
+from types import ModuleType
+import time
+import logging
+
+import BibleOrgSysGlobals
+from BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+
+
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
+SHORT_PROGRAM_NAME = "StageCheckpoints"
+PROGRAM_NAME = "Loader stage checkpoints"
+PROGRAM_VERSION = '0.16'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+CHECKPOINT_FORMAT_VERSION = '0.1' # Increment this if the contents of the checkpoints change
+STAGE_NAMES = ('load', 'clean', 'FGids', 'normalise', 'export') # The stages of all of our loader pipelines
+RESUMABLE_STAGE_NAMES = STAGE_NAMES[1:] # There's nothing to checkpoint before we load
+NON_DATA_FLAG_NAMES = ('USE_BUILD_MANIFEST_FLAG', 'SAVE_CHECKPOINTS_FLAG', 'COMPACT_JSON_FLAG', 'COMPRESS_JSON_FLAG',
+                        'EXPORT_JSON_LINES_FLAG', 'EXPORT_SQLITE_FLAG', 'SHARD_VERSE_INDEXES_FLAG') # Loader flags that don't affect the in-memory state
+
+
+
+def get_checkpoint_filename( loader_module:ModuleType, stage_name:str ) -> str:
+    """
+    Returns the filename of the checkpoint (taken before the given stage) for the loader.
+    """
+    return f'{loader_module.SHORT_PROGRAM_NAME}_{stage_name}_checkpoint.pickle'
+# end of StageCheckpoints.get_checkpoint_filename
+
+
+def get_checkpoint_key( loader_module:ModuleType ) -> Dict[str,object]:
+    """
+    Returns the key which must match for a checkpoint to be used.
+
+    Only the flags which affect how the loader holds its data are included.
+    """
+    return {
+        'checkpoint_format_version': CHECKPOINT_FORMAT_VERSION,
+        'loader_name': loader_module.SHORT_PROGRAM_NAME,
+        'loader_version': loader_module.PROGRAM_VERSION,
+        'loader_flags': { name:value for name,value in sorted(vars(loader_module).items())
+                            if name.endswith('_FLAG') and name not in NON_DATA_FLAG_NAMES },
+        }
+# end of StageCheckpoints.get_checkpoint_key
+
+
+def save_checkpoint( loader_module:ModuleType, stage_name:str ) -> bool:
+    """
+    Pickles the loader's state (as it is before the given stage).
+
+    All of the state is pickled together so that any objects shared
+        between the dicts (e.g., in allEntries) are still shared when reloaded.
+
+    Returns True if successful.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"save_checkpoint( {loader_module.SHORT_PROGRAM_NAME}, {stage_name!r} )" )
+    assert stage_name in RESUMABLE_STAGE_NAMES
+    start_time = time.perf_counter()
+    checkpoint = { 'checkpoint_key': get_checkpoint_key( loader_module ),
+                    'stage_name': stage_name,
+                    'state': { state_name:getattr(loader_module, state_name) for state_name in loader_module.CHECKPOINT_STATE_NAMES },
+                    }
+    if not BibleOrgSysGlobals.pickleObject( checkpoint, get_checkpoint_filename( loader_module, stage_name ) ):
+        return False
+    dPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Saved {stage_name!r} checkpoint in {time.perf_counter()-start_time:.2f}s." )
+    return True
+# end of StageCheckpoints.save_checkpoint
+
+
+def load_checkpoint( loader_module:ModuleType, stage_name:str ) -> bool:
+    """
+    Restores the loader's state from the checkpoint taken before the given stage.
+
+    Dicts (and other mutable mappings like ColumnarTables) and lists are updated in place (rather than rebound)
+        because the loaders keep other references to them, e.g., in DB_LIST.
+
+    Returns True if successful.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"load_checkpoint( {loader_module.SHORT_PROGRAM_NAME}, {stage_name!r} )" )
+    assert stage_name in RESUMABLE_STAGE_NAMES
+    checkpoint_filename = get_checkpoint_filename( loader_module, stage_name )
+    start_time = time.perf_counter()
+    try:
+        checkpoint = BibleOrgSysGlobals.unpickleObject( checkpoint_filename )
+    except FileNotFoundError:
+        logging.critical( f"No {stage_name!r} checkpoint found for {loader_module.SHORT_PROGRAM_NAME} -- need to do a full run first" )
+        return False
+    except Exception as err:
+        logging.critical( f"Unable to load {stage_name!r} checkpoint for {loader_module.SHORT_PROGRAM_NAME}: {err!r}" )
+        return False
+    if checkpoint.get('checkpoint_key') != get_checkpoint_key( loader_module ):
+        logging.critical( f"The {stage_name!r} checkpoint for {loader_module.SHORT_PROGRAM_NAME} is out-of-date ({checkpoint.get('checkpoint_key')} but now {get_checkpoint_key( loader_module )}) -- need to do a full run first" )
+        return False
+
+    for state_name, saved_value in checkpoint['state'].items():
+        current_value = getattr( loader_module, state_name )
+        if isinstance( current_value, MutableMapping ):
+            current_value.clear()
+            current_value.update( saved_value )
+        elif isinstance( current_value, list ):
+            current_value[:] = saved_value
+        else: # Immutable, or an object that's only referred to by this name
+            setattr( loader_module, state_name, saved_value )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"\nResuming {loader_module.SHORT_PROGRAM_NAME} from {stage_name!r} checkpoint (loaded in {time.perf_counter()-start_time:.2f}s)…" )
+    return True
+# end of StageCheckpoints.load_checkpoint
+
+
+def run_stages( loader_module:ModuleType, resume_stage_name:Optional[str]=None ) -> bool:
+    """
+    Runs the loader pipeline stages in order (using loader_module.run_stage),
+        starting from the given stage if resume_stage_name is given.
+
+    If the loader's SAVE_CHECKPOINTS_FLAG is set, a checkpoint is saved before each stage
+        (except of course, the one that we're resuming from).
+
+    Returns True if all of the stages succeeded.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"run_stages( {loader_module.SHORT_PROGRAM_NAME}, {resume_stage_name!r} )" )
+    start_index = 0
+    if resume_stage_name:
+        if not load_checkpoint( loader_module, resume_stage_name ):
+            return False
+        start_index = STAGE_NAMES.index( resume_stage_name )
+
+    for stage_name in STAGE_NAMES[start_index:]:
+        if loader_module.SAVE_CHECKPOINTS_FLAG and stage_name in RESUMABLE_STAGE_NAMES and stage_name != resume_stage_name:
+            save_checkpoint( loader_module, stage_name ) # We continue even if it fails
+        if not loader_module.run_stage( stage_name ):
+            logging.critical( f"{loader_module.SHORT_PROGRAM_NAME} failed in {stage_name!r} stage" )
+            return False
+    return True
+# end of StageCheckpoints.run_stages
+
+
+
+def briefDemo() -> None:
+    """
+    Brief demo to check module is working
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Stages are {STAGE_NAMES} (can resume from {RESUMABLE_STAGE_NAMES})." )
+# end of StageCheckpoints.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check module is working
+    """
+    briefDemo()
+
+    for loader_name in ('loadTIPNR', 'loadGlyssenData', 'loadTheographicBibleData'):
+        loader_module = __import__( loader_name )
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"\n  {loader_name} checkpoint key: {get_checkpoint_key( loader_module )}" )
+        for stage_name in RESUMABLE_STAGE_NAMES:
+            checkpoint_filepath = BibleOrgSysGlobals.DEFAULT_WRITEABLE_CACHE_FOLDERPATH.joinpath( get_checkpoint_filename( loader_module, stage_name ) )
+            vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"    {stage_name!r} checkpoint: {f'{checkpoint_filepath.stat().st_size:,} bytes' if checkpoint_filepath.is_file() else 'not found'}" )
+# end of StageCheckpoints.fullDemo
+
+if __name__ == '__main__':
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of StageCheckpoints.py
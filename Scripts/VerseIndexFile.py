@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# VerseIndexFile.py
+#
+# Module handling our memory-mappable binary verse index files
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+GitHub@gmail.com>
+#
+# License: CC0 1.0 Universal (CC0 1.0) Public Domain Dedication
+#
+#   This is a human-readable summary of the Legal Code
+#
+#   No Copyright
+#
+#   The person who associated a work with this deed has dedicated the work to the public domain
+#       by waiving all of his or her rights to the work worldwide under copyright law,
+#       including all related and neighboring rights, to the extent allowed by law.
+#
+#   You can copy, modify, distribute and perform the work, even for commercial purposes,
+#       all without asking permission. See Other Information below.
+#
+#   Other Information
+#
+#   In no way are the patent or trademark rights of any person affected by CC0,
+#       nor are the rights that other persons may have in the work or in how the work is used,
+#       such as publicity or privacy rights.
+#    Unless expressly stated otherwise, the person who associated a work with this deed makes no
+#       warranties about the work, and disclaims liability for all uses of the work,
+#       to the fullest extent permitted by applicable law.
+#    When using or citing the work, you should not imply endorsement by the author or the affirmer.
+#
+#   You should have received a copy of the formal licence text
+#   along with this program.  If not, see <https://CreativeCommons.org/publicdomain/zero/1.0/>.
+#
+"""
+Module to write and read a binary version of our verse reference indexes
+    (which map each verse to the FGids of the entries which occur in it).
+
+Unlike the JSON index files, which have to be completely parsed before any verse can be looked up,
+    the binary file is memory-mapped and a verse is looked up directly by its dense verse ordinal
+    (see the versification table in BibleReferences.py) without any parsing.
+
+The file (all little-endian unsigned 32-bit integers) is:
+    a header: the magic bytes b'BOSVIDX\\0', the format version, the number of verse ordinals,
+        the number of different FGids (entities), and the number of (verse, entity) links,
+    the verse offsets table: for each verse ordinal (plus one extra at the end),
+        the index of the first link for that verse
+        (so the links for ordinal n are links[verse_offsets[n]:verse_offsets[n+1]]),
+    the links: the entity number of each entry in each verse,
+    the string offsets table: for each entity number (plus one extra at the end),
+        the byte offset of its FGid in the string table,
+    and the string table: the UTF-8 FGids (in sorted order).
+
+References with a partial verse suffix or brackets (e.g., TIPNR 'GEN_1:1a')
+    are indexed under their verse, and references which aren't in our versification are skipped.
+
+The JSON verse indexes can also be split into a JSON file for each book (e.g., 'GEN.json')
+    along with a small manifest of the books and their files,
+    so that a client only needs to fetch and parse the book that it's displaying.
+"""
+from gettext import gettext as _
+from typing import Dict, List, Tuple, Union
+from pathlib import Path
+from array import array
+import sys
+import mmap
+import struct
+import logging
+
+import BibleOrgSysGlobals
+from BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+from DerivedFileWriter import DerivedFile
+from JSONWriter import write_JSON_file
+from BibleReferences import TOTAL_VERSE_COUNT, verse_ordinal, reference_ordinal, \
+                            pack_reference, decode_verse_key, render_verse_key
+
+
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
+SHORT_PROGRAM_NAME = "VerseIndexFile"
+PROGRAM_NAME = "Binary verse index files"
+PROGRAM_VERSION = '0.12'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+VERSE_INDEX_FILE_EXTENSION = 'bin'
+MAGIC_BYTES = b'BOSVIDX\0'
+FORMAT_VERSION = 1
+HEADER_FORMAT = '<8sIIII' # Magic bytes, format version, verse count, entity count, link count
+HEADER_SIZE = struct.calcsize( HEADER_FORMAT ) # 24 so our uint32 arrays are aligned
+assert array( 'I' ).itemsize == 4
+SHARDS_MANIFEST_NAME = 'manifest' # The manifest is written as 'manifest.json' in the folder with the book shards
+
+
+
+def write_verse_index_file( filepath:Path, ref_index_dict:Dict[Union[str,int],List[str]] ) -> int:
+    """
+    Write our binary verse index file
+        from a dict mapping BOS references (or our packed verse keys) to lists of FGids.
+
+    The file is written to a temporary file which then replaces any existing one if it's changed
+        (so that a reader which has the old file memory-mapped isn't affected, see DerivedFileWriter.py).
+
+    Returns the number of (verse, entity) links written.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"write_verse_index_file( {filepath}, ({len(ref_index_dict)}) )" )
+    verse_FGids:Dict[int,Dict[str,None]] = {} # Verse ordinal -> FGids (as an ordered set)
+    skipped_refs = []
+    for ref, FGids in ref_index_dict.items():
+        if not isinstance( ref, str ): ref = render_verse_key( ref )
+        ordinal = reference_ordinal( ref )
+        if ordinal is None:
+            skipped_refs.append( ref )
+            continue
+        try: verse_FGids[ordinal].update( dict.fromkeys( FGids ) )
+        except KeyError: verse_FGids[ordinal] = dict.fromkeys( FGids )
+
+    if skipped_refs:
+        logging.warning( f"Skipped {len(skipped_refs)} references outside our versification for {filepath.name}: {skipped_refs}" )
+
+    entity_FGids = sorted( { FGid for FGids in verse_FGids.values() for FGid in FGids } )
+    entity_numbers = { FGid:number for number,FGid in enumerate( entity_FGids ) }
+    verse_offsets, links = array( 'I', [0] ), array( 'I' )
+    for ordinal in range( TOTAL_VERSE_COUNT ):
+        if ordinal in verse_FGids:
+            links.extend( entity_numbers[FGid] for FGid in verse_FGids[ordinal] )
+        verse_offsets.append( len(links) )
+    encoded_FGids = [FGid.encode( 'utf-8' ) for FGid in entity_FGids]
+    string_offsets = array( 'I', [0] )
+    for encoded_FGid in encoded_FGids:
+        string_offsets.append( string_offsets[-1] + len(encoded_FGid) )
+
+    with DerivedFile( filepath, 'wb' ) as outputFile:
+        outputFile.write( struct.pack( HEADER_FORMAT, MAGIC_BYTES, FORMAT_VERSION, TOTAL_VERSE_COUNT, len(entity_FGids), len(links) ) )
+        for uint32_array in (verse_offsets, links, string_offsets):
+            if sys.byteorder == 'big': uint32_array.byteswap()
+            uint32_array.tofile( outputFile )
+        outputFile.write( b''.join( encoded_FGids ) )
+    return len( links )
+# end of VerseIndexFile.write_verse_index_file
+
+
+def shard_verse_index( ref_index_dict:Dict[Union[str,int],List[str]] ) -> Dict[str,Dict[str,List[str]]]:
+    """
+    Split a dict mapping BOS references (or our packed verse keys) to lists of FGids
+        into a dict for each BOS book code (in Biblical book order)
+        each with its references sorted into verse order.
+
+    References which aren't valid BOS references are logged and skipped.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"shard_verse_index( ({len(ref_index_dict)}) )" )
+    keyed_refs = []
+    skipped_refs = []
+    for ref in ref_index_dict:
+        try: verseKey = ref if isinstance( ref, int ) else pack_reference( ref )
+        except ValueError:
+            skipped_refs.append( ref )
+            continue
+        keyed_refs.append( (verseKey, ref) )
+    if skipped_refs:
+        logging.warning( f"Skipped {len(skipped_refs)} invalid references when splitting verse index by book: {skipped_refs}" )
+
+    book_dicts:Dict[str,Dict[str,List[str]]] = {}
+    for verseKey, ref in sorted( keyed_refs ):
+        BBB = decode_verse_key( verseKey )[0]
+        if BBB not in book_dicts: book_dicts[BBB] = {}
+        book_dicts[BBB][render_verse_key( verseKey )] = ref_index_dict[ref]
+    return book_dicts
+# end of VerseIndexFile.shard_verse_index
+
+
+def write_verse_index_shards( folderpath:Path, ref_index_dict:Dict[Union[str,int],List[str]], header_dict:Dict[str,dict],
+                                compact:bool=False, compression_formats:Tuple[str,...]=() ) -> int:
+    """
+    Write the verse index as a JSON file for each book (e.g., 'GEN.json') into the folder,
+        along with 'manifest.json' which lists each book with its filename and size,
+        the number of references and different FGids in it, and its first and last references.
+
+    Any older book files (e.g., for books that are no longer in the index) are deleted.
+
+    Returns the number of books written.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"write_verse_index_shards( {folderpath}, ({len(ref_index_dict)}), {len(header_dict)}, compact={compact}, compression_formats={compression_formats} )" )
+    folderpath.mkdir( exist_ok=True )
+    manifest_dict = {}
+    for BBB, book_dict in shard_verse_index( ref_index_dict ).items():
+        filepath = folderpath.joinpath( f'{BBB}.json' )
+        write_JSON_file( filepath, header_dict, book_dict, compact=compact, compression_formats=compression_formats )
+        book_refs = list( book_dict )
+        manifest_dict[BBB] = { 'filename':filepath.name, 'size':filepath.stat().st_size,
+                                'reference_count':len(book_dict), 'FGid_count':len( { FGid for FGids in book_dict.values() for FGid in FGids } ),
+                                'first_reference':book_refs[0], 'last_reference':book_refs[-1] }
+    write_JSON_file( folderpath.joinpath( f'{SHARDS_MANIFEST_NAME}.json' ), header_dict, manifest_dict, compact=compact, compression_formats=compression_formats )
+
+    for filepath in folderpath.iterdir():
+        filename_root = filepath.name.split( '.', 1 )[0]
+        if filename_root != SHARDS_MANIFEST_NAME and filename_root not in manifest_dict:
+            vPrint( 'Info', DEBUGGING_THIS_MODULE, f"    Deleting old verse index book file {filepath}…" )
+            filepath.unlink()
+    return len( manifest_dict )
+# end of VerseIndexFile.write_verse_index_shards
+
+
+
+class VerseIndexFile:
+    """
+    Read-only access to one of our binary verse index files through mmap.
+
+    Use like:
+        with VerseIndexFile( filepath ) as verse_index:
+            FGids = verse_index.get_FGids( 'GEN', 22, 2 )
+    """
+    def __init__( self, filepath:Path ) -> None:
+        """
+        Memory-maps the file and checks its header.
+
+        Raises a ValueError if it's not one of our binary verse index files.
+        """
+        fnPrint( DEBUGGING_THIS_MODULE, f"VerseIndexFile.__init__( {filepath} )" )
+        self.filepath = filepath
+        with open( filepath, 'rb' ) as indexFile:
+            self.mmap = mmap.mmap( indexFile.fileno(), 0, access=mmap.ACCESS_READ )
+        magic_bytes, format_version, self.verse_count, self.entity_count, self.link_count = \
+            struct.unpack_from( HEADER_FORMAT, self.mmap ) if len(self.mmap) >= HEADER_SIZE else (b'', 0, 0, 0, 0)
+        if magic_bytes != MAGIC_BYTES or format_version != FORMAT_VERSION:
+            self.mmap.close()
+            raise ValueError( f"{filepath} is not a v{FORMAT_VERSION} binary verse index file" )
+
+        offset = HEADER_SIZE
+        self.verse_offsets, offset = self._get_uint32_array( offset, self.verse_count + 1 )
+        self.links, offset = self._get_uint32_array( offset, self.link_count )
+        self.string_offsets, self.strings_start = self._get_uint32_array( offset, self.entity_count + 1 )
+    # end of VerseIndexFile.__init__
+
+    def _get_uint32_array( self, offset:int, count:int ) -> Tuple[Union[memoryview,array],int]:
+        """
+        Returns an (unparsed) view of the count uint32s at the offset in the file,
+            along with the offset following them.
+        """
+        end_offset = offset + 4 * count
+        if sys.byteorder == 'little':
+            return memoryview( self.mmap )[offset:end_offset].cast( 'I' ), end_offset
+        uint32_array = array( 'I', self.mmap[offset:end_offset] ) # Have to make a (byte-swapped) copy on big-endian systems
+        uint32_array.byteswap()
+        return uint32_array, end_offset
+    # end of VerseIndexFile._get_uint32_array
+
+    def get_FGid( self, entity_number:int ) -> str:
+        """
+        Returns the FGid for the entity number (as stored in the links).
+        """
+        return self.mmap[self.strings_start+self.string_offsets[entity_number]:self.strings_start+self.string_offsets[entity_number+1]].decode( 'utf-8' )
+    # end of VerseIndexFile.get_FGid
+
+    def get_FGids_for_ordinal( self, ordinal:int ) -> List[str]:
+        """
+        Returns the list of FGids for the verse with the given dense verse ordinal.
+        """
+        return [self.get_FGid( entity_number ) for entity_number in self.links[self.verse_offsets[ordinal]:self.verse_offsets[ordinal+1]]]
+    # end of VerseIndexFile.get_FGids_for_ordinal
+
+    def get_FGids( self, BBB:str, C:int, V:int ) -> List[str]:
+        """
+        Returns the list of FGids for the given verse.
+
+        Raises a ValueError if the verse is outside our versification.
+        """
+        return self.get_FGids_for_ordinal( verse_ordinal( BBB, C, V ) )
+    # end of VerseIndexFile.get_FGids
+
+    def close( self ) -> None:
+        """
+        Releases our views of the file and unmaps it.
+        """
+        for uint32_array in (self.verse_offsets, self.links, self.string_offsets):
+            if isinstance( uint32_array, memoryview ): uint32_array.release()
+        self.mmap.close()
+    # end of VerseIndexFile.close
+
+    def __enter__( self ) -> 'VerseIndexFile':
+        return self
+    def __exit__( self, *args ) -> None:
+        self.close()
+# end of class VerseIndexFile
+
+
+
+def briefDemo() -> None:
+    """
+    Brief demo to check module is working
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    import tempfile
+    ref_index_dict = { 'GEN_1:1':['PGod'], 'GEN_1:1a':['PGod','PAdam'], '[GEN_2:7]':['PAdam'], 'REV_22:21':['PJesus'], 'MAT_15:42':['PNobody'] }
+    with tempfile.TemporaryDirectory() as temp_folderpath:
+        filepath = Path( temp_folderpath, f'test.{VERSE_INDEX_FILE_EXTENSION}' )
+        link_count = write_verse_index_file( filepath, ref_index_dict )
+        with VerseIndexFile( filepath ) as verse_index:
+            vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Wrote {link_count} links for {verse_index.entity_count} entities in {filepath.stat().st_size:,} bytes." )
+            for BBB, C, V in (('GEN',1,1), ('GEN',2,7), ('GEN',3,1), ('REV',22,21)):
+                vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {BBB}_{C}:{V} has {verse_index.get_FGids( BBB, C, V )}" )
+        book_count = write_verse_index_shards( Path( temp_folderpath, 'test' ), ref_index_dict, {'__HEADERS__':{'conversion_date':'2026-10-16'}}, compact=True )
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Split into {book_count} book files: {Path( temp_folderpath, 'test', f'{SHARDS_MANIFEST_NAME}.json' ).read_text( 'utf-8' )}" )
+# end of VerseIndexFile.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check module is working
+    """
+    briefDemo()
+# end of VerseIndexFile.fullDemo
+
+if __name__ == '__main__':
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of VerseIndexFile.py
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# VerseRangeIndex.py
+#
+# Module handling indexes of Bible verse ranges
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+GitHub@gmail.com>
+#
+# License: CC0 1.0 Universal (CC0 1.0) Public Domain Dedication
+#
+#   This is a human-readable summary of the Legal Code
+#
+#   No Copyright
+#
+#   The person who associated a work with this deed has dedicated the work to the public domain
+#       by waiving all of his or her rights to the work worldwide under copyright law,
+#       including all related and neighboring rights, to the extent allowed by law.
+#
+#   You can copy, modify, distribute and perform the work, even for commercial purposes,
+#       all without asking permission. See Other Information below.
+#
+#   Other Information
+#
+#   In no way are the patent or trademark rights of any person affected by CC0,
+#       nor are the rights that other persons may have in the work or in how the work is used,
+#       such as publicity or privacy rights.
+#    Unless expressly stated otherwise, the person who associated a work with this deed makes no
+#       warranties about the work, and disclaims liability for all uses of the work,
+#       to the fullest extent permitted by applicable law.
+#    When using or citing the work, you should not imply endorsement by the author or the affirmer.
+#
+#   You should have received a copy of the formal licence text
+#   along with this program.  If not, see <https://CreativeCommons.org/publicdomain/zero/1.0/>.
+#
+"""
+Module containing an index of (possibly overlapping) ranges of Bible verses
+    each with an associated value (e.g., the character of a narrator override).
+
+The ranges are inclusive (start, end) pairs of our dense verse ordinals
+    (see the versification table in BibleReferences.py)
+    and are kept sorted by their start ordinals
+    so that the ranges containing a verse are found with a binary search (bisect)
+    rather than by checking every range,
+    and the ranges for every verse of a book can be found in a single sweep.
+"""
+from gettext import gettext as _
+from typing import Any, Iterable, Iterator, List, Tuple
+from array import array
+from bisect import bisect_right
+
+import BibleOrgSysGlobals
+from BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+from BibleReferences import verse_ordinal, ordinal_verse, book_ordinals
+
+
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
+SHORT_PROGRAM_NAME = "VerseRangeIndex"
+PROGRAM_NAME = "Bible verse range indexes"
+PROGRAM_VERSION = '0.10'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+
+class VerseRangeIndex:
+    """
+    An immutable index of (start ordinal, end ordinal, value) ranges.
+
+    As well as the start and end ordinals of each range (sorted by start),
+        we keep the maximum end ordinal of all the ranges up to each one
+        so that a search can stop going backwards as soon as no earlier range can reach the verse.
+    So finding the ranges containing a verse is O(log n) for non-nested ranges
+        (plus the number of ranges found).
+    """
+    __slots__ = ('starts', 'ends', 'maxEnds', 'values')
+
+    def __init__( self, ranges:Iterable[Tuple[int,int,Any]]=() ) -> None:
+        """
+        Build the index from any iterable of (start ordinal, end ordinal, value) tuples
+            (which don't need to be sorted).
+
+        Ranges with the same start ordinal keep their given order.
+        """
+        sortedRanges = sorted( ranges, key=lambda startEndValue: startEndValue[0] )
+        self.starts = array( 'I', (start for start,_end,_value in sortedRanges) )
+        self.ends = array( 'I', (end for _start,end,_value in sortedRanges) )
+        self.values = [value for _start,_end,value in sortedRanges]
+        self.maxEnds = array( 'I' )
+        for end in self.ends:
+            self.maxEnds.append( max( end, self.maxEnds[-1] ) if self.maxEnds else end )
+        assert all( start <= end for start,end in zip( self.starts, self.ends ) )
+    # end of VerseRangeIndex.__init__
+
+    def __len__( self ) -> int:
+        return len( self.starts )
+    def __repr__( self ) -> str:
+        return f"VerseRangeIndex({len(self.starts):,} ranges)"
+
+
+    def find( self, ordinal:int ) -> List[Any]:
+        """
+        Returns a list of the values of all the ranges which contain the verse ordinal
+            (in order of their start ordinals).
+        """
+        foundValues = []
+        index = bisect_right( self.starts, ordinal ) # The first range starting after the ordinal
+        while index > 0 and self.maxEnds[index-1] >= ordinal:
+            index -= 1
+            if self.ends[index] >= ordinal: foundValues.append( self.values[index] )
+        foundValues.reverse()
+        return foundValues
+    # end of VerseRangeIndex.find
+
+    def find_verse( self, BBB:str, C:int, V:int ) -> List[Any]:
+        """
+        Returns a list of the values of all the ranges which contain the given verse.
+
+        Raises a ValueError if the verse is outside our versification.
+        """
+        return self.find( verse_ordinal( BBB, C, V ) )
+    # end of VerseRangeIndex.find_verse
+
+
+    def sweep( self, ordinals:range ) -> Iterator[Tuple[int,List[Any]]]:
+        """
+        Yields (ordinal, values) for every verse ordinal in the (ascending) range,
+            where values is a list of the values of the ranges which contain it,
+            passing through the ranges only once (rather than doing a search for every verse).
+        """
+        activeIndexes:List[int] = [] # The ranges which have started but maybe not yet finished
+        nextIndex = bisect_right( self.starts, ordinals.start - 1 ) if ordinals else 0
+        while nextIndex > 0 and self.maxEnds[nextIndex-1] >= ordinals.start: # Find any ranges which started earlier
+            nextIndex -= 1
+        for ordinal in ordinals:
+            while nextIndex < len(self.starts) and self.starts[nextIndex] <= ordinal:
+                activeIndexes.append( nextIndex )
+                nextIndex += 1
+            if activeIndexes:
+                activeIndexes = [index for index in activeIndexes if self.ends[index] >= ordinal]
+            yield ordinal, [self.values[index] for index in activeIndexes]
+    # end of VerseRangeIndex.sweep
+
+    def sweep_book( self, BBB:str ) -> Iterator[Tuple[int,int,List[Any]]]:
+        """
+        Yields (C, V, values) for every verse of the BOS book (in our versification)
+            where values is a list of the values of the ranges which contain it.
+        """
+        for ordinal, values in self.sweep( book_ordinals( BBB ) ):
+            _BBB, C, V = ordinal_verse( ordinal )
+            yield C, V, values
+    # end of VerseRangeIndex.sweep_book
+# end of class VerseRangeIndex
+
+
+
+def briefDemo() -> None:
+    """
+    Brief demo to check class is working
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    rangeIndex = VerseRangeIndex( [(verse_ordinal('PSA',81,1), verse_ordinal('PSA',81,7), 'Asaph'),
+                                    (verse_ordinal('PSA',81,6), verse_ordinal('PSA',81,16), 'God'),
+                                    (verse_ordinal('PSA',82,1), verse_ordinal('PSA',82,1), 'Asaph')] )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {rangeIndex}" )
+    for BBB, C, V in (('PSA',80,19), ('PSA',81,5), ('PSA',81,7), ('PSA',81,16), ('PSA',82,1), ('PSA',82,2)):
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {BBB}_{C}:{V} is in {rangeIndex.find_verse( BBB, C, V )}" )
+# end of VerseRangeIndex.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+        by comparing it with a simple linear search.
+    """
+    import random
+    briefDemo()
+
+    for _loop in range( 100 ):
+        ranges = []
+        for _r in range( random.randint( 0, 20 ) ):
+            start = random.randint( 0, 200 )
+            ranges.append( (start, start+random.randint( 0, 30 ), len(ranges)) )
+        rangeIndex = VerseRangeIndex( ranges )
+        sortedRanges = sorted( ranges, key=lambda startEndValue: startEndValue[0] )
+        first = random.randint( 0, 150 )
+        for ordinal, values in rangeIndex.sweep( range( first, first+100 ) ):
+            expectedValues = [value for start,end,value in sortedRanges if start <= ordinal <= end]
+            assert rangeIndex.find( ordinal ) == expectedValues, f"{ordinal=} {rangeIndex.find( ordinal )} {expectedValues} {sortedRanges}"
+            assert values == expectedValues, f"{ordinal=} {values} {expectedValues} {sortedRanges}"
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "  Random find/sweep tests passed." )
+# end of VerseRangeIndex.fullDemo
+
+if __name__ == '__main__':
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of VerseRangeIndex.py
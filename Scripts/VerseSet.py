@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# VerseSet.py
+#
+# Module handling compact sets of Bible verses
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+GitHub@gmail.com>
+#
+# License: CC0 1.0 Universal (CC0 1.0) Public Domain Dedication
+#
+#   This is a human-readable summary of the Legal Code
+#
+#   No Copyright
+#
+#   The person who associated a work with this deed has dedicated the work to the public domain
+#       by waiving all of his or her rights to the work worldwide under copyright law,
+#       including all related and neighboring rights, to the extent allowed by law.
+#
+#   You can copy, modify, distribute and perform the work, even for commercial purposes,
+#       all without asking permission. See Other Information below.
+#
+#   Other Information
+#
+#   In no way are the patent or trademark rights of any person affected by CC0,
+#       nor are the rights that other persons may have in the work or in how the work is used,
+#       such as publicity or privacy rights.
+#    Unless expressly stated otherwise, the person who associated a work with this deed makes no
+#       warranties about the work, and disclaims liability for all uses of the work,
+#       to the fullest extent permitted by applicable law.
+#    When using or citing the work, you should not imply endorsement by the author or the affirmer.
+#
+#   You should have received a copy of the formal licence text
+#   along with this program.  If not, see <https://CreativeCommons.org/publicdomain/zero/1.0/>.
+#
+"""
+Module containing a compact (immutable) set of Bible verses.
+
+The verses are held as our packed integer verse keys (see BibleReferences.py).
+Plain verse keys are stored as run-length ranges
+    so that a whole chapter (or a long event) is just one (start,end) pair,
+    and the rare keys with a partial verse suffix or brackets (e.g., TIPNR 'GEN_1:1a')
+    are kept in a separate sorted array.
+
+Union, intersection, and counting work directly on the ranges
+    so don't need to expand the individual verses.
+
+A set can also be converted to and from a bitmap (a Python int)
+    over our dense verse ordinals (see the versification table in BibleReferences.py)
+    where set algebra is just the bitwise operators on the ints.
+"""
+from gettext import gettext as _
+from typing import Iterable, Iterator, List
+from collections.abc import Set
+from array import array
+from bisect import bisect_right
+from heapq import merge
+import re
+
+import BibleOrgSysGlobals
+from BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+from BibleReferences import pack_reference, render_verse_key, verse_key_ordinal, ORDINAL_VERSE_KEYS
+
+
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
+SHORT_PROGRAM_NAME = "VerseSet"
+PROGRAM_NAME = "Compact Bible verse sets"
+PROGRAM_VERSION = '0.11'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+
+class VerseSet( Set ):
+    """
+    An immutable set of our packed integer verse keys.
+
+    Internally, plain keys are shifted down to drop the (zero) flags byte
+        so that consecutive verses in a chapter are consecutive integers,
+        and then stored as inclusive ranges in the starts and ends arrays.
+    Keys with flags (suffixes or brackets) are stored as is in flaggedKeys.
+
+    Iterating always gives the keys in sorted (i.e., Biblical) order.
+    """
+    __slots__ = ('starts', 'ends', 'flaggedKeys')
+
+    def __init__( self, verseKeys:Iterable[int]=() ) -> None:
+        """
+        Build the ranges from any iterable of our packed integer verse keys
+            (which don't need to be sorted and can contain duplicates).
+        """
+        self.starts, self.ends, self.flaggedKeys = array('I'), array('I'), array('I')
+        plainKeys = set()
+        flaggedKeys = set()
+        for verseKey in verseKeys:
+            if verseKey & 0xFF: flaggedKeys.add( verseKey )
+            else: plainKeys.add( verseKey >> 8 )
+        for plainKey in sorted( plainKeys ):
+            if self.ends and plainKey == self.ends[-1] + 1:
+                self.ends[-1] = plainKey
+            else:
+                self.starts.append( plainKey )
+                self.ends.append( plainKey )
+        self.flaggedKeys.extend( sorted( flaggedKeys ) )
+    # end of VerseSet.__init__
+
+
+    @classmethod
+    def _from_parts( cls, starts:array, ends:array, flaggedKeys:array ) -> 'VerseSet':
+        """
+        Used internally to create a new set from already calculated ranges.
+        """
+        newSet = cls.__new__( cls )
+        newSet.starts, newSet.ends, newSet.flaggedKeys = starts, ends, flaggedKeys
+        return newSet
+    # end of VerseSet._from_parts
+
+    @classmethod
+    def _from_iterable( cls, verseKeys:Iterable[int] ) -> 'VerseSet':
+        """
+        Used by the collections.abc.Set mixin methods (like __sub__).
+        """
+        return cls( verseKeys )
+    # end of VerseSet._from_iterable
+
+    @classmethod
+    def from_references( cls, BOSrefs:Iterable[str] ) -> 'VerseSet':
+        """
+        Create a new set from BOS reference strings like 'CO1_1:14'.
+        """
+        return cls( pack_reference(BOSref) for BOSref in BOSrefs )
+    # end of VerseSet.from_references
+
+
+    def __str__( self ) -> str:
+        return f"VerseSet with {len(self):,} verses in {len(self.starts):,} ranges (+{len(self.flaggedKeys):,} flagged)"
+    def __repr__( self ) -> str:
+        return f"VerseSet({self.render()!r})"
+    def __len__( self ) -> int:
+        return sum( self.ends ) - sum( self.starts ) + len(self.starts) + len(self.flaggedKeys)
+    def __bool__( self ) -> bool:
+        return bool(self.starts) or bool(self.flaggedKeys)
+    def __eq__( self, other ) -> bool:
+        if isinstance( other, VerseSet ):
+            return self.starts == other.starts and self.ends == other.ends and self.flaggedKeys == other.flaggedKeys
+        return Set.__eq__( self, other )
+    __hash__ = None # Like other set types, we're not hashable
+    def __reduce__( self ): # Needed for pickle (because we use __slots__)
+        return (VerseSet._from_parts, (self.starts, self.ends, self.flaggedKeys))
+
+    def __contains__( self, verseKey:int ) -> bool:
+        if verseKey & 0xFF:
+            ix = bisect_right( self.flaggedKeys, verseKey ) - 1
+            return ix >= 0 and self.flaggedKeys[ix] == verseKey
+        plainKey = verseKey >> 8
+        ix = bisect_right( self.starts, plainKey ) - 1
+        return ix >= 0 and plainKey <= self.ends[ix]
+
+    def __iter__( self ) -> Iterator[int]:
+        """
+        Yield the verse keys in order.
+        """
+        plainKeys = ( plainKey << 8 for start,end in zip(self.starts,self.ends) for plainKey in range(start,end+1) )
+        return merge( plainKeys, self.flaggedKeys ) if self.flaggedKeys else plainKeys
+
+
+    def count( self ) -> int:
+        """
+        Returns the number of verses in the set.
+        """
+        return len( self )
+    # end of VerseSet.count
+
+
+    def union( self, other:'VerseSet' ) -> 'VerseSet':
+        """
+        Returns a new set containing the verses in either set.
+        """
+        if not isinstance( other, VerseSet ): other = VerseSet( other )
+        starts, ends = array('I'), array('I')
+        for start, end in merge( zip(self.starts,self.ends), zip(other.starts,other.ends) ):
+            if ends and start <= ends[-1] + 1: # Overlaps or abuts the previous range
+                if end > ends[-1]: ends[-1] = end
+            else:
+                starts.append( start )
+                ends.append( end )
+        return VerseSet._from_parts( starts, ends,
+                        array( 'I', sorted( set(self.flaggedKeys) | set(other.flaggedKeys) ) ) )
+    # end of VerseSet.union
+    __or__ = union
+
+    def intersection( self, other:'VerseSet' ) -> 'VerseSet':
+        """
+        Returns a new set containing the verses in both sets.
+        """
+        if not isinstance( other, VerseSet ): other = VerseSet( other )
+        starts, ends = array('I'), array('I')
+        ix = jx = 0
+        while ix < len(self.starts) and jx < len(other.starts):
+            start, end = max(self.starts[ix], other.starts[jx]), min(self.ends[ix], other.ends[jx])
+            if start <= end:
+                starts.append( start )
+                ends.append( end )
+            if self.ends[ix] < other.ends[jx]: ix += 1
+            else: jx += 1
+        return VerseSet._from_parts( starts, ends,
+                        array( 'I', sorted( set(self.flaggedKeys) & set(other.flaggedKeys) ) ) )
+    # end of VerseSet.intersection
+    __and__ = intersection
+
+
+    def ordinal_bitmap( self ) -> int:
+        """
+        Returns an int with a bit set for the verse ordinal of each verse in the set.
+
+        Note: any suffixes or brackets are lost (e.g., 'GEN_1:1a' just becomes 'GEN_1:1')
+            and a ValueError is raised for any verse outside our versification.
+        """
+        bitmap = 0
+        for start, end in zip( self.starts, self.ends ): # A range never crosses a chapter boundary
+            startOrdinal = verse_key_ordinal( start << 8 )
+            bitmap |= ((1 << (verse_key_ordinal(end << 8) - startOrdinal + 1)) - 1) << startOrdinal
+        for verseKey in self.flaggedKeys:
+            bitmap |= 1 << verse_key_ordinal( verseKey )
+        return bitmap
+    # end of VerseSet.ordinal_bitmap
+
+    @classmethod
+    def from_ordinal_bitmap( cls, bitmap:int ) -> 'VerseSet':
+        """
+        Create a new set from an int with a bit set for each verse ordinal.
+        """
+        bits = bin( bitmap )[:1:-1] # Reversed so that the string index is the ordinal
+        return cls( verseKey for match in re.finditer( '1+', bits )
+                                for verseKey in ORDINAL_VERSE_KEYS[match.start():match.end()] )
+    # end of VerseSet.from_ordinal_bitmap
+
+
+    def render( self ) -> List[str]:
+        """
+        Returns a list of BOS reference strings (in order).
+        """
+        return [render_verse_key(verseKey) for verseKey in self]
+    # end of VerseSet.render
+# end of class VerseSet
+
+
+
+def briefDemo() -> None:
+    """
+    Brief demo to check class is working
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    set1 = VerseSet.from_references( ['GEN_1:3','GEN_1:1','GEN_1:2','GEN_1:1a','GEN_2:1','GEN_1:2'] )
+    set2 = VerseSet.from_references( ['GEN_1:2','GEN_1:1a','GEN_1:3','GEN_1:4','EXO_3:14'] )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {set1} {set1.render()}" )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {set2} {set2.render()}" )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Union: {(set1 | set2).render()}" )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Intersection: {(set1 & set2).render()}" )
+# end of VerseSet.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check class is working
+        and compare the size with a list of strings.
+    """
+    import sys
+    import random
+    briefDemo()
+
+    refs = [f'PSA_{c}:{v}' for c in range(1,151) for v in range(1,7)]
+    verseSet = VerseSet.from_references( refs )
+    assert verseSet.render() == sorted( refs, key=pack_reference )
+    setBytes = sum( sys.getsizeof(arr) for arr in (verseSet.starts,verseSet.ends,verseSet.flaggedKeys) )
+    strBytes = sys.getsizeof(refs) + sum( sys.getsizeof(ref) for ref in refs )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {verseSet} takes {setBytes:,} bytes vs {strBytes:,} bytes as a list of strings" )
+
+    # Check the range algebra against the built-in set type
+    keys = [pack_reference(f'GEN_{c}:{v}{s}') for c in range(1,4) for v in range(1,25) for s in ('','','','a')]
+    for _loop in range( 200 ):
+        keys1, keys2 = set(random.sample(keys, 100)), set(random.sample(keys, 100))
+        set1, set2 = VerseSet(keys1), VerseSet(keys2)
+        assert list(set1 | set2) == sorted(keys1 | keys2)
+        assert list(set1 & set2) == sorted(keys1 & keys2)
+        assert len(set1 & set2) == len(keys1 & keys2)
+        assert all( (key in set1) == (key in keys1) for key in keys )
+        plainKeys1, plainKeys2 = {key & ~0xFF for key in keys1}, {key & ~0xFF for key in keys2}
+        bitmap1, bitmap2 = set1.ordinal_bitmap(), set2.ordinal_bitmap()
+        assert list(VerseSet.from_ordinal_bitmap(bitmap1 | bitmap2)) == sorted(plainKeys1 | plainKeys2)
+        assert (bitmap1 & bitmap2).bit_count() == len(plainKeys1 & plainKeys2)
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "  Random union/intersection/bitmap tests passed." )
+# end of VerseSet.fullDemo
+
+if __name__ == '__main__':
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of VerseSet.py
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# XMLWriter.py
+#
+# Module handling the streaming export of our XML data files
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+GitHub@gmail.com>
+#
+# License: CC0 1.0 Universal (CC0 1.0) Public Domain Dedication
+#
+#   This is a human-readable summary of the Legal Code
+#
+#   No Copyright
+#
+#   The person who associated a work with this deed has dedicated the work to the public domain
+#       by waiving all of his or her rights to the work worldwide under copyright law,
+#       including all related and neighboring rights, to the extent allowed by law.
+#
+#   You can copy, modify, distribute and perform the work, even for commercial purposes,
+#       all without asking permission. See Other Information below.
+#
+#   Other Information
+#
+#   In no way are the patent or trademark rights of any person affected by CC0,
+#       nor are the rights that other persons may have in the work or in how the work is used,
+#       such as publicity or privacy rights.
+#    Unless expressly stated otherwise, the person who associated a work with this deed makes no
+#       warranties about the work, and disclaims liability for all uses of the work,
+#       to the fullest extent permitted by applicable law.
+#    When using or citing the work, you should not imply endorsement by the author or the affirmer.
+#
+#   You should have received a copy of the formal licence text
+#   along with this program.  If not, see <https://CreativeCommons.org/publicdomain/zero/1.0/>.
+#
+"""
+Module to write our (header plus entries) dicts to XML files
+    one element at a time through the standard library SAX XMLGenerator
+    (writing each element as it's visited rather than building an ElementTree
+    of the whole document in memory first).
+
+Each file has a root element (e.g., <TIPNR>) containing a <headers> element
+    and then an element for each table (e.g., <people count="3140">)
+    containing an <entry FGid="…"> element for each entry.
+Within the entries, each dict key becomes an element of the same name
+    (or, if the key isn't a valid XML name, e.g., 'Character ID',
+    an element with the invalid characters replaced by underscores
+    and the original key in a 'key' attribute),
+    lists become a series of <item> elements,
+    and None values are omitted.
+"""
+from gettext import gettext as _
+from typing import List, Tuple, Callable, Optional
+from pathlib import Path
+import re
+import time
+from xml.sax.saxutils import XMLGenerator
+
+import BibleOrgSysGlobals
+from BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+from JSONWriter import WRITE_BUFFER_SIZE, is_metadata_key
+from DerivedFileWriter import DerivedFile
+
+
+LAST_MODIFIED_DATE = '2026-10-17' # by RJH
+SHORT_PROGRAM_NAME = "XMLWriter"
+PROGRAM_NAME = "Streaming XML writer"
+PROGRAM_VERSION = '0.13'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+INDENT_STRING = ' ' * 2
+ENTRY_ELEMENT_NAME = 'entry'
+LIST_ITEM_ELEMENT_NAME = 'item'
+INVALID_NAME_CHARACTERS_RE = re.compile( r'[^\w.-]' )
+
+
+element_names = {} # Cache of dict key -> (element name, attributes dict)
+
+
+
+class StreamingXMLGenerator( XMLGenerator ):
+    """
+    The standard SAX XMLGenerator (with short empty elements like <item/>)
+        plus a comment method (like the SAX LexicalHandler one).
+    """
+    def __init__( self, outputFile ) -> None:
+        super().__init__( outputFile, encoding='utf-8', short_empty_elements=True )
+
+    def comment( self, text:str ) -> None:
+        """
+        Writes an XML comment (removing anything that's not allowed in one).
+        """
+        self._finish_pending_start_element()
+        text = re.sub( r'-(?=-)', '- ', text ) # Separates every pair (e.g., '---' becomes '- - -')
+        self._write( f'<!-- {text} -->' )
+# end of class StreamingXMLGenerator
+
+
+def get_element_name( key ) -> Tuple[str,dict]:
+    """
+    Returns the element name to use for a dict key,
+        along with a dict of the attributes for the element
+        (which has the original key if it's not a valid XML name).
+    """
+    try: return element_names[key]
+    except KeyError: pass
+    element_name = INVALID_NAME_CHARACTERS_RE.sub( '_', str(key) )
+    if not element_name or not (element_name[0].isalpha() or element_name[0] == '_'):
+        element_name = f'_{element_name}'
+    element_names[key] = element_name, ({} if element_name == key else {'key':str(key)})
+    return element_names[key]
+# end of XMLWriter.get_element_name
+
+
+def write_element( generator:StreamingXMLGenerator, element_name:str, attributes:dict, value, newline_indent:str, default:Optional[Callable] ) -> None:
+    """
+    Writes the value (and anything inside it) as an element.
+
+    newline_indent is the newline plus the indent of the line that the element starts on.
+    default (if given) is called to convert any objects that we can't write
+        (e.g., render_packed_references_for_JSON for our arrays of packed verse keys).
+    """
+    if default is not None and not isinstance( value, (str,dict,list,tuple,int,float) ):
+        value = default( value )
+    generator.startElement( element_name, attributes )
+    if isinstance( value, str ):
+        generator.characters( value )
+    elif isinstance( value, dict ):
+        inner_newline_indent = newline_indent + INDENT_STRING
+        for key, item in value.items():
+            if item is not None:
+                generator.ignorableWhitespace( inner_newline_indent )
+                write_element( generator, *get_element_name( key ), item, inner_newline_indent, default )
+        if value: generator.ignorableWhitespace( newline_indent )
+    elif isinstance( value, (list,tuple) ):
+        inner_newline_indent = newline_indent + INDENT_STRING
+        for item in value:
+            generator.ignorableWhitespace( inner_newline_indent )
+            if item is None: generator.startElement( LIST_ITEM_ELEMENT_NAME, {} ); generator.endElement( LIST_ITEM_ELEMENT_NAME ) # Keep the positions of the other items
+            else: write_element( generator, LIST_ITEM_ELEMENT_NAME, {}, item, inner_newline_indent, default )
+        if value: generator.ignorableWhitespace( newline_indent )
+    elif value is True or value is False:
+        generator.characters( 'true' if value else 'false' )
+    elif isinstance( value, (int,float) ):
+        generator.characters( str(value) )
+    else: raise TypeError( f"Object of type {value.__class__.__name__} is not XML serializable" )
+    generator.endElement( element_name )
+# end of XMLWriter.write_element
+
+
+def write_XML_file( filepath:Path, root_element_name:str, header_dict:dict, table_list:List[Tuple[str,dict]],
+                    comment_lines:List[str]=(), default:Optional[Callable]=None ) -> int:
+    """
+    Write the header dict (e.g., {'__HEADERS__': {'conversion_software':…}})
+        and the (table_name, the_dict) tables into one XML file,
+        preceded by any given comment lines (e.g., a licence from the source data).
+
+    Each table is written out one entry at a time as it's visited.
+    The file is only replaced if its content has changed (see DerivedFileWriter.py).
+
+    Returns the number of entries written.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"write_XML_file( {filepath}, {root_element_name}, …, ({len(table_list)}), ({len(comment_lines)}) )" )
+    entry_count = 0
+    with DerivedFile( filepath, 'wt', encoding='utf-8', buffering=WRITE_BUFFER_SIZE ) as outputFile:
+        generator = StreamingXMLGenerator( outputFile )
+        generator.startDocument()
+        for line in comment_lines:
+            generator.comment( line )
+            generator.ignorableWhitespace( '\n' )
+        generator.startElement( root_element_name, {} )
+
+        newline_indent = '\n' + INDENT_STRING
+        for key, value in header_dict.items(): # e.g., '__HEADERS__' becomes <headers>
+            generator.ignorableWhitespace( newline_indent )
+            write_element( generator, *get_element_name( key.strip('_').lower() ), value, newline_indent, default )
+
+        for table_name, the_dict in table_list:
+            start_time = time.time()
+            generator.ignorableWhitespace( newline_indent )
+            table_element_name, table_attributes = get_element_name( table_name )
+            table_entry_count = sum( 1 for key in the_dict if not is_metadata_key( key ) )
+            generator.startElement( table_element_name, table_attributes | {'count':str(table_entry_count)} )
+            inner_newline_indent = newline_indent + INDENT_STRING
+            for FGid, entry in the_dict.items():
+                if not is_metadata_key( FGid ):
+                    generator.ignorableWhitespace( inner_newline_indent )
+                    if isinstance( entry, dict ) and entry.get( 'FGid' ) == FGid: # Don't need it again inside
+                        entry = { key:value for key,value in entry.items() if key != 'FGid' }
+                    write_element( generator, ENTRY_ELEMENT_NAME, {'FGid':str(FGid)}, entry, inner_newline_indent, default )
+            if table_entry_count: generator.ignorableWhitespace( newline_indent )
+            generator.endElement( table_element_name )
+            entry_count += table_entry_count
+            vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"    Wrote {table_entry_count:,} {table_name} entries in {time.time()-start_time:.2f}s" )
+
+        generator.ignorableWhitespace( '\n' )
+        generator.endElement( root_element_name )
+        generator.ignorableWhitespace( '\n' )
+        generator.endDocument()
+    return entry_count
+# end of XMLWriter.write_XML_file
+
+
+
+def briefDemo() -> None:
+    """
+    Brief demo to check module is working
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    import tempfile
+    import xml.etree.ElementTree as ET
+    header_dict = { '__HEADERS__': {'conversion_software':PROGRAM_NAME_VERSION} }
+    the_dict = { '__COLUMN_HEADERS__': ['FGid','names'],
+                 'PFred': {'FGid':'PFred', 'names':['Fred','Freddy'], 'age':42, 'height':1.8, 'married':True, 'spouse':None, 'children':[], 'notes':{}},
+                 'PZoë': {'FGid':'PZoë', 'names':['Zoë & <Zoe>'], 'Character ID':'Zoë', 'refs':('GEN_1:1','EXO_2:3'), 7:'int key'} }
+    with tempfile.TemporaryDirectory() as temp_folderpath:
+        filepath = Path( temp_folderpath, 'test.xml' )
+        entry_count = write_XML_file( filepath, 'Test', header_dict, [('people',the_dict)], ["A -- test -- comment"] )
+        with open( filepath, 'rt', encoding='utf-8' ) as inputFile:
+            written = inputFile.read()
+        root = ET.fromstring( written.encode('utf-8') ) # Check that it's well-formed
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Wrote {entry_count} entries and reread {len(root.find('people'))} <{root.tag}> entries." )
+        vPrint( 'Normal', DEBUGGING_THIS_MODULE, written )
+# end of XMLWriter.briefDemo
+
+def fullDemo() -> None:
+    """
+    Full demo to check module is working
+    """
+    briefDemo()
+# end of XMLWriter.fullDemo
+
+if __name__ == '__main__':
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    fullDemo()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+# end of XMLWriter.py
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# loadAllData.py
+#
+# Script to run all of our loaders (in parallel if possible)
+#
+# Copyright (C) 2026 Robert Hunt
+# Author: Robert Hunt <Freely.Given.org+GitHub@gmail.com>
+#
+# License: CC0 1.0 Universal (CC0 1.0) Public Domain Dedication
+#
+#   This is a human-readable summary of the Legal Code
+#
+#   No Copyright
+#
+#   The person who associated a work with this deed has dedicated the work to the public domain
+#       by waiving all of his or her rights to the work worldwide under copyright law,
+#       including all related and neighboring rights, to the extent allowed by law.
+#
+#   You can copy, modify, distribute and perform the work, even for commercial purposes,
+#       all without asking permission. See Other Information below.
+#
+#   Other Information
+#
+#   In no way are the patent or trademark rights of any person affected by CC0,
+#       nor are the rights that other persons may have in the work or in how the work is used,
+#       such as publicity or privacy rights.
+#    Unless expressly stated otherwise, the person who associated a work with this deed makes no
+#       warranties about the work, and disclaims liability for all uses of the work,
+#       to the fullest extent permitted by applicable law.
+#    When using or citing the work, you should not imply endorsement by the author or the affirmer.
+#
+#   You should have received a copy of the formal licence text
+#   along with this program.  If not, see <https://CreativeCommons.org/publicdomain/zero/1.0/>.
+#
+"""
+Script to run the main() pipelines of all of our loaders, i.e.,
+    loadTIPNR.py, loadGlyssenData.py, and loadTheographicBibleData.py.
+
+Unless --single (or --debug) is given, the loaders are run in parallel
+    using up to BibleOrgSys maxProcesses processes, so the total time
+    is roughly that of the slowest loader.
+
+The console output of each loader is captured and displayed when it finishes
+    (so that the outputs of parallel loaders don't get jumbled),
+    and each loader also logs to its own logfile as when run by itself.
+
+If any loader fails, any still-running loaders are terminated
+    and we exit with a non-zero status.
+
+Each loader checks its own build manifest (see BuildManifest.py)
+    and does nothing if its inputs and outputs are unchanged
+    (unless --rebuild is given),
+    and --resume-from resumes each of them from its own checkpoint (see StageCheckpoints.py).
+"""
+from gettext import gettext as _
+from typing import List, Optional, Tuple
+from contextlib import redirect_stdout
+import io
+import sys
+import time
+import logging
+import importlib
+import traceback
+import multiprocessing
+
+import BibleOrgSysGlobals
+from BibleOrgSysGlobals import fnPrint, vPrint, dPrint
+from StageCheckpoints import RESUMABLE_STAGE_NAMES
+
+
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
+SHORT_PROGRAM_NAME = "loadAllData"
+PROGRAM_NAME = "Load all data sources"
+PROGRAM_VERSION = '0.12'
+PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
+
+DEBUGGING_THIS_MODULE = False
+
+
+# Put the slowest first, so it gets started first if we have less processes than loaders
+LOADER_MODULE_NAMES = ('loadTheographicBibleData', 'loadTIPNR', 'loadGlyssenData')
+
+
+def main() -> bool:
+    """
+    Runs all of the loaders (in parallel if possible).
+
+    Returns True if they all succeeded.
+    """
+    BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
+
+    rebuild_flag = getattr( BibleOrgSysGlobals.commandLineArguments, 'rebuild', False )
+    resume_stage_name = getattr( BibleOrgSysGlobals.commandLineArguments, 'resume_from', None )
+    parameters = [(loader_name, BibleOrgSysGlobals.verbosityLevel, BibleOrgSysGlobals.debugFlag, rebuild_flag, resume_stage_name)
+                    for loader_name in LOADER_MODULE_NAMES]
+    num_processes = min( BibleOrgSysGlobals.maxProcesses, len(parameters) )
+    results:List[Tuple[str,bool,float]] = []
+    start_time = time.perf_counter()
+    if num_processes > 1: # Get our subprocesses ready and waiting for work
+        vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"\nRunning {len(parameters)} loaders using {num_processes} processes…" )
+        BibleOrgSysGlobals.alreadyMultiprocessing = True
+        # maxtasksperchild=1 means each loader gets a fresh process (and so fresh module globals)
+        with multiprocessing.Pool( processes=num_processes, maxtasksperchild=1 ) as pool:
+            for loader_name, success_flag, elapsed_seconds, output in pool.imap_unordered( run_loader, parameters ):
+                results.append( (loader_name, success_flag, elapsed_seconds) )
+                display_loader_output( loader_name, success_flag, elapsed_seconds, output )
+                if not success_flag: break # Leaving the with block terminates any loaders that are still running
+        BibleOrgSysGlobals.alreadyMultiprocessing = False
+    else: # Just single-threaded
+        vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"\nRunning {len(parameters)} loaders one at a time…" )
+        for parameter in parameters:
+            loader_name, success_flag, elapsed_seconds, output = run_loader( parameter )
+            results.append( (loader_name, success_flag, elapsed_seconds) )
+            display_loader_output( loader_name, success_flag, elapsed_seconds, output )
+            if not success_flag: break
+    total_seconds = time.perf_counter() - start_time
+
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, "\nLoader timings:" )
+    for loader_name, success_flag, elapsed_seconds in results:
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {loader_name:<26} {elapsed_seconds:7.2f}s  {'ok' if success_flag else 'FAILED'}" )
+    completed_loader_names = [result[0] for result in results]
+    for loader_name in LOADER_MODULE_NAMES:
+        if loader_name not in completed_loader_names:
+            vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {loader_name:<26}     —    not completed" )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Total wall time was {total_seconds:.2f}s (sum of loader times was {sum(result[2] for result in results):.2f}s)." )
+    all_succeeded = len(results) == len(LOADER_MODULE_NAMES) and all( result[1] for result in results )
+    if not all_succeeded:
+        logging.critical( f"{SHORT_PROGRAM_NAME}: Not all loaders completed successfully" )
+    return all_succeeded
+# end of loadAllData.main
+
+
+def run_loader( parameter:Tuple[str,int,bool,bool,Optional[str]] ) -> Tuple[str,bool,float,str]:
+    """
+    Runs the main() pipeline of the given loader module
+        capturing its console output.
+
+    This might be run in a separate process (which won't have our command line arguments
+        if it was spawned rather than forked), so is passed the verbosity and debug settings,
+        and the --rebuild and --resume-from options that the loaders read from BibleOrgSysGlobals.commandLineArguments.
+
+    Returns (loader_name, success_flag, elapsed_seconds, captured_output).
+    """
+    loader_name, verbosity_level, debug_flag, rebuild_flag, resume_stage_name = parameter
+    fnPrint( DEBUGGING_THIS_MODULE, f"run_loader( {loader_name!r}, {verbosity_level}, {debug_flag}, {rebuild_flag}, {resume_stage_name!r} )" )
+    BibleOrgSysGlobals.setVerbosity( verbosity_level )
+    if debug_flag: BibleOrgSysGlobals.setDebugFlag()
+    BibleOrgSysGlobals.commandLineArguments.rebuild = rebuild_flag
+    BibleOrgSysGlobals.commandLineArguments.resume_from = resume_stage_name
+    logging.getLogger().setLevel( logging.DEBUG if debug_flag else logging.INFO )
+    _log_filepath, log_handler = BibleOrgSysGlobals.addLogfile( loader_name )
+
+    start_time = time.perf_counter()
+    output = io.StringIO()
+    with redirect_stdout( output ):
+        try:
+            loader = importlib.import_module( loader_name )
+            logging.info( f"{loader.PROGRAM_NAME_VERSION} started by {PROGRAM_NAME_VERSION}" )
+            success_flag = bool( loader.main() )
+        except Exception as err:
+            logging.critical( f"{loader_name} failed with {err!r}" )
+            traceback.print_exc( file=output )
+            success_flag = False
+    elapsed_seconds = time.perf_counter() - start_time
+
+    logging.info( f"{loader_name} {'finished' if success_flag else 'FAILED'} after {elapsed_seconds:.2f} seconds" )
+    BibleOrgSysGlobals.removeLogfile( log_handler )
+    log_handler.close()
+    return loader_name, success_flag, elapsed_seconds, output.getvalue()
+# end of loadAllData.run_loader
+
+
+def display_loader_output( loader_name:str, success_flag:bool, elapsed_seconds:float, output:str ) -> None:
+    """
+    Display the captured console output of a loader.
+    """
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"\n{loader_name} {'finished' if success_flag else 'FAILED'} after {elapsed_seconds:.2f}s:" )
+    for line in output.rstrip().split('\n'):
+        if line or not success_flag:
+            vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  {line}" )
+# end of loadAllData.display_loader_output
+
+
+if __name__ == '__main__':
+    multiprocessing.freeze_support() # Multiprocessing support for frozen Windows executables
+
+    # Configure basic Bible Organisational System (BOS) set-up
+    parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    parser.add_argument( '--resume-from', dest='resume_from', choices=RESUMABLE_STAGE_NAMES, help="resume each loader from the checkpoint saved before this stage of a previous run" )
+    parser.add_argument( '--rebuild', action='store_true', dest='rebuild', default=False, help="rebuild even if the build manifests show nothing has changed" )
+    BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
+
+    success_flag = main()
+
+    BibleOrgSysGlobals.closedown( PROGRAM_NAME, PROGRAM_VERSION )
+    if not success_flag: sys.exit( 1 )
+# end of loadAllData.py
@@ -43,22 +43,36 @@ Module to load and process SIL Glyssen data files
 from gettext import gettext as _
 from collections import defaultdict
 from csv import DictReader
-import re
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from pathlib import Path
+from array import array
+from xml.etree.ElementTree import iterparse
 from datetime import date
 import os
+import time
+import sys
 import logging
-import json
 
 import BibleOrgSysGlobals
 from BibleOrgSysGlobals import fnPrint, vPrint, dPrint
-
-
-LAST_MODIFIED_DATE = '2022-08-10' # by RJH
+from FGidAllocator import FGidAllocator
+from BuildManifest import BuildManifest
+from JSONWriter import COMPRESSION_FORMATS, write_JSON_files, display_compression_report
+from XMLWriter import write_XML_file
+from DerivedFileWriter import display_write_report
+from VerseIndexFile import VERSE_INDEX_FILE_EXTENSION, write_verse_index_file, write_verse_index_shards
+from VerseRangeIndex import VerseRangeIndex
+from ColumnarTable import ColumnarTable
+from SQLiteExporter import SQLITE_FILE_EXTENSION, export_SQLite_database
+from StageCheckpoints import STAGE_NAMES, RESUMABLE_STAGE_NAMES, run_stages
+from BibleReferences import BOOK_CODE_TO_BOS_MAPS, VERSE_COUNTS, convert_references, encode_verse_key, render_verse_key, \
+                            render_packed_references_for_JSON, verse_ordinal
+
+
+LAST_MODIFIED_DATE = '2026-10-17' # by RJH
 SHORT_PROGRAM_NAME = "loadGlyssenData"
 PROGRAM_NAME = "Load SIL Glyssen data files"
-PROGRAM_VERSION = '0.03'
+PROGRAM_VERSION = '0.24'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False
@@ -67,6 +81,19 @@ DEBUGGING_THIS_MODULE = False
 SOURCE_DATA_LAST_DOWNLOADED_DATE_STRING = '2022-07-25'
 
 PREFIX_OUR_IDS_FLAG = True
+COMPACT_JSON_FLAG = False # Write the JSON files without indentation or spaces (smaller and quicker, see JSONWriter.py)
+COMPRESS_JSON_FLAG = False # Also write gzip and xz compressed copies of the JSON files (see JSONWriter.py)
+EXPORT_JSON_LINES_FLAG = False # Also export the normalised tables as JSON Lines (one entry per line, see JSONWriter.py)
+EXPORT_SQLITE_FLAG = False # Also export the normalised tables and verse indexes into an SQLite database (see SQLiteExporter.py)
+SHARD_VERSE_INDEXES_FLAG = False # Also split each verse reference index into a JSON file for each book plus a manifest (see VerseIndexFile.py)
+SAVE_CHECKPOINTS_FLAG = True # Pickle our in-memory state before each pipeline stage so can use --resume-from (see StageCheckpoints.py)
+USE_BUILD_MANIFEST_FLAG = True # Skip the run if the loader, inputs, and outputs are unchanged since the last run (see BuildManifest.py)
+PACK_VERSE_REFERENCES_FLAG = False # Store verse reference lists as array('I') of packed verse keys (rendered back to strings on export)
+
+SQLITE_SEARCH_KEYS = { 'names':('Character ID','FCBH Character','Alias'),
+                        'descriptions':('Comment',) } # Entry keys for the full-text search columns (see SQLiteExporter.py)
+SQLITE_INDEXED_COLUMN_NAMES = ('Character ID',)
+SQLITE_SEARCH_TABLE_NAMES = ('characters',) # The verses table would just add the same names again for every verse
 
 # Create a header to go in the data files
 HEADER_DICT = { '__HEADERS__':
@@ -80,80 +107,102 @@ HEADER_DICT = { '__HEADERS__':
 }
 
 GlyssenData_INPUT_FOLDERPATH = Path(f'../outsideSources/GlyssenData/')
+GlyssenData_INPUT_FILENAMES = { 'characters':'CharacterDetail.tsv', 'verses':'CharacterVerse.tsv',
+                                'narratorOverrides':'NarratorOverrides.xml', 'styleMappings':'StyleToCharacterMappings.xml' }
 GlyssenData_OUTPUT_FOLDERPATH = GlyssenData_INPUT_FOLDERPATH.joinpath( 'derivedFiles/' )
 GlyssenData_XML_OUTPUT_FILENAME = 'GlyssenData.xml'
 GlyssenData_XML_OUTPUT_FILEPATH = GlyssenData_OUTPUT_FOLDERPATH.joinpath(GlyssenData_XML_OUTPUT_FILENAME)
 
-UUU_BOOK_ID_MAP = {
-             1: 'GEN',  2: 'EXO',  3: 'LEV',  4: 'NUM',  5: 'DEU',
-             6: 'JOS',  7: 'JDG',  8: 'RUT',  9: '1SA', 10: '2SA',
-            11: '1KI', 12: '2KI', 13: '1CH', 14: '2CH', 15: 'EZR', 16: 'NEH', 17: 'EST', 18: 'JOB',
-            19: 'PSA', 20: 'PRO', 21: 'ECC', 22: 'SNG', 23: 'ISA', 24: 'JER', 25: 'LAM',
-            26: 'EZK', 27: 'DAN', 28: 'HOS', 29: 'JOL', 30: 'AMO', 31: 'OBA',
-            32: 'JON', 33: 'MIC', 34: 'NAM', 35: 'HAB', 36: 'ZEP', 37: 'HAG', 38: 'ZEC', 39: 'MAL',
-            40: 'MAT', 41: 'MRK', 42: 'LUK', 43: 'JHN', 44: 'ACT',
-            45: 'ROM', 46: '1CO', 47: '2CO', 48: 'GAL', 49: 'EPH', 50: 'PHP', 51: 'COL',
-            52: '1TH', 53: '2TH', 54: '1TI', 55: '2TI', 56: 'TIT', 57: 'PHM',
-            58: 'HEB', 59: 'JAS', 60: '1PE', 61: '2PE', 62: '1JN', 63: '2JN', 64: '3JN', 65: 'JUD', 66: 'REV'}
-assert len(UUU_BOOK_ID_MAP) == 66
-OSIS_BOOK_ID_MAP = {
-            1: 'Gen', 2: 'Exod', 3: 'Lev', 4: 'Num', 5: 'Deut',
-            6: 'Josh', 7: 'Judg', 8: 'Ruth', 9: '1Sam', 10: '2Sam',
-            11: '1Kgs', 12: '2Kgs', 13: '1Chr', 14: '2Chr', 15: 'Ezra', 16: 'Neh', 17: 'Esth', 18: 'Job',
-            19: 'Ps', 20: 'Prov', 21: 'Eccl', 22: 'Song', 23: 'Isa', 24: 'Jer', 25: 'Lam',
-            26: 'Ezek', 27: 'Dan', 28: 'Hos', 29: 'Joel', 30: 'Amos', 31: 'Obad',
-            32: 'Jonah', 33: 'Mic', 34: 'Nah', 35: 'Hab', 36: 'Zeph', 37: 'Hag', 38: 'Zech', 39: 'Mal',
-            40: 'Matt', 41: 'Mark', 42: 'Luke', 43: 'John', 44: 'Acts',
-            45: 'Rom', 46: '1Cor', 47: '2Cor', 48: 'Gal', 49: 'Eph', 50: 'Phil', 51: 'Col',
-            52: '1Thess', 53: '2Thess', 54: '1Tim', 55: '2Tim', 56: 'Titus', 57: 'Phlm',
-            58: 'Heb', 59: 'Jas', 60: '1Pet', 61: '2Pet', 62: '1John', 63: '2John', 64: '3John', 65: 'Jude', 66: 'Rev'}
-assert len(OSIS_BOOK_ID_MAP) == 66
-BOS_BOOK_ID_MAP = {
-            1: 'GEN', 2: 'EXO', 3: 'LEV', 4: 'NUM', 5: 'DEU',
-            6: 'JOS', 7: 'JDG', 8: 'RUT', 9: 'SA1', 10: 'SA2',
-            11: 'KI1', 12: 'KI2', 13: 'CH1', 14: 'CH2', 15: 'EZR', 16: 'NEH', 17: 'EST', 18: 'JOB',
-            19: 'PSA', 20: 'PRO', 21: 'ECC', 22: 'SNG', 23: 'ISA', 24: 'JER', 25: 'LAM',
-            26: 'EZK', 27: 'DAN', 28: 'HOS', 29: 'JOL', 30: 'AMO', 31: 'OBA',
-            32: 'JNA', 33: 'MIC', 34: 'NAH', 35: 'HAB', 36: 'ZEP', 37: 'HAG', 38: 'ZEC', 39: 'MAL',
-            40: 'MAT', 41: 'MRK', 42: 'LUK', 43: 'JHN', 44: 'ACT',
-            45: 'ROM', 46: 'CO1', 47: 'CO2', 48: 'GAL', 49: 'EPH', 50: 'PHP', 51: 'COL',
-            52: 'TH1', 53: 'TH2', 54: '1TI', 55: '2TI', 56: 'TIT', 57: 'PHM',
-            58: 'HEB', 59: 'JAS', 60: 'PE1', 61: 'PE2', 62: 'JN1', 63: 'JN2', 64: 'JN3', 65: 'JDE', 66: 'REV'}
-assert len(BOS_BOOK_ID_MAP) == 66
 
 COLUMN_NAME_REPLACEMENT_MAP = {}
 
 
 
-def main() -> None:
+def main() -> bool:
     """
+    Runs the full load/clean/FGids/normalise/export pipeline
+        (or the latter part of it if --resume-from was given).
+
+    Returns True if all of the stages succeeded.
     """
     BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
 
-    if load_all_Glyssen_data():
-        if clean_data():
-            export_JSON('raw')
-            # export_xml('raw')
-            if add_FGids():
-                rebuild_dictionaries('FGid')
-                # if DEBUGGING_THIS_MODULE:
-                export_JSON('mid')
-                if normalise_data() and check_data():
-                    rebuild_dictionaries('FGid')
-                    export_JSON('normalised')
-                    export_xml('normalised')
-                    export_verse_index()
+    resume_stage_name = getattr( BibleOrgSysGlobals.commandLineArguments, 'resume_from', None )
+    # We don't use the build manifest when resuming because we haven't reread the inputs
+    build_manifest = get_build_manifest() if USE_BUILD_MANIFEST_FLAG and not resume_stage_name else None
+    if build_manifest is not None and not getattr( BibleOrgSysGlobals.commandLineArguments, 'rebuild', False ) \
+    and build_manifest.is_up_to_date():
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"\nNothing to do: {SHORT_PROGRAM_NAME} and its input and output files are unchanged since the last run." )
+        return True
+
+    if run_stages( sys.modules[__name__], resume_stage_name ):
+        if build_manifest is not None: build_manifest.save()
+        return True
+    return False
 # end of loadGlyssenData.main
 
 
+def run_stage( stage_name:str ) -> bool:
+    """
+    Runs one stage of our pipeline (called by StageCheckpoints.run_stages).
+
+    Returns True if the stage succeeded.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"run_stage( {stage_name!r} )" )
+    assert stage_name in STAGE_NAMES
+    if stage_name == 'load':
+        return load_all_Glyssen_data()
+    if stage_name == 'clean':
+        if not clean_data(): return False
+        export_JSON('raw')
+        # export_xml('raw')
+        return True
+    if stage_name == 'FGids':
+        if not add_FGids(): return False
+        rebuild_dictionaries('FGid')
+        # if DEBUGGING_THIS_MODULE:
+        export_JSON('mid')
+        return True
+    if stage_name == 'normalise':
+        return normalise_data() and check_data()
+    if stage_name == 'export':
+        rebuild_dictionaries('FGid')
+        export_JSON('normalised')
+        export_xml('normalised')
+        export_verse_index()
+        display_compression_report()
+        display_write_report()
+        return True
+# end of loadGlyssenData.run_stage
+
+
+def get_build_manifest() -> BuildManifest:
+    """
+    Returns the build manifest for our input files and output folder.
+    """
+    return BuildManifest( sys.modules[__name__], [GlyssenData_INPUT_FOLDERPATH.joinpath(filename) for filename in GlyssenData_INPUT_FILENAMES.values()], GlyssenData_OUTPUT_FOLDERPATH )
+# end of loadGlyssenData.get_build_manifest
+
+
+# The module globals that hold our in-memory state (pickled by StageCheckpoints)
+CHECKPOINT_STATE_NAMES = ('prefixed_our_IDs', 'characters', 'verses', 'allEntries', 'narrator_overrides', 'style_character_mappings',
+                            'people_map', 'peopleGroups_map', 'places_map')
 prefixed_our_IDs = False
-characters, verses = {}, {}
+characters, verses = {}, ColumnarTable() # The verses rows are stored by column (see ColumnarTable.py)
 allEntries = {}
+narrator_overrides:Dict[str,List[Dict[str,Union[str,int]]]] = {} # BOS book code -> list of overrides (from NarratorOverrides.xml)
+style_character_mappings:Dict[str,Dict[str,Union[str,bool]]] = {} # USFM marker -> character and paragraph flag (from StyleToCharacterMappings.xml)
 # NOTE: The following lists will be wrong if any of the above dict names are rebound to new/different objects
 DB_LIST = ( ('characters',characters), ('verses',verses), )
 ALL_DB_LIST = ( ('characters',characters), ('verses',verses),
             ('all',allEntries) )
 
+# Created from the verses table in the export stage (see create_verse_speaker_index() below)
+VERSE_SPEAKER_FIELD_NAMES = ('FGid', 'Delivery', 'Quote Type', 'Default Character')
+verse_speakers:Dict[int,List[Tuple[str,str,str,str]]] = {}
+narrator_override_index:Dict[str,VerseRangeIndex] = {} # BOS book code -> index of the overrides (see create_narrator_override_index() below)
+style_speakers:Dict[str,Tuple[str,bool]] = {} # USFM marker -> (character FGid, is paragraph marker) (see create_style_speaker_index() below)
+
 def load_all_Glyssen_data() -> bool:
     """
     This is quite quick.
@@ -167,6 +216,10 @@ def load_all_Glyssen_data() -> bool:
         if result is not None:
             db['__COLUMN_HEADERS__'], db['dataList'] = result
             db_count += 1
+    if load_Glyssen_narrator_overrides():
+        db_count += 1
+    if load_Glyssen_style_character_mappings():
+        db_count += 1
 
     vPrint('Quiet', DEBUGGING_THIS_MODULE, f"{db_count:,} tables loaded from GlyssenData files.")
     return True
@@ -182,7 +235,7 @@ def load_individual_GlyssenData_TSV_file(which:str) -> Tuple[List[str],List[Dict
     """
     fnPrint(DEBUGGING_THIS_MODULE, "load_individual_GlyssenData_TSV_file()")
 
-    tsv_filename = 'CharacterDetail.tsv' if which=='characters' else 'CharacterVerse.tsv' if which=='verses' else None
+    tsv_filename = GlyssenData_INPUT_FILENAMES[which]
     try_filepath = GlyssenData_INPUT_FOLDERPATH.joinpath(tsv_filename)
     tries = 1
     while not os.access(try_filepath, os.R_OK):
@@ -229,6 +282,77 @@ def load_individual_GlyssenData_TSV_file(which:str) -> Tuple[List[str],List[Dict
 # end of loadGlyssenData.load_individual_GlyssenData_TSV_file()
 
 
+def load_Glyssen_narrator_overrides() -> bool:
+    """
+    Load the books and passages from NarratorOverrides.xml
+        whose first-person speech should be attributed to a specific character
+        into narrator_overrides (a list of overrides for each BOS book code),
+        filling in the default start verse, end chapter, and end verse.
+
+    We use iterparse so each element is handled (and cleared) as it's parsed.
+
+    Note: The XML declaration says that the file is UTF-16, but it's actually UTF-8,
+            so we open it as UTF-8 text (and the parser then ignores the declared encoding).
+    """
+    fnPrint(DEBUGGING_THIS_MODULE, "load_Glyssen_narrator_overrides()")
+
+    xml_filepath = GlyssenData_INPUT_FOLDERPATH.joinpath(GlyssenData_INPUT_FILENAMES['narratorOverrides'])
+    if not os.access(xml_filepath, os.R_OK):
+        logging.error(f"Unable to load narrator overrides from {xml_filepath}")
+        return False
+    vPrint('Quiet', DEBUGGING_THIS_MODULE,
+        f"  Loading GlyssenData narrator overrides from {xml_filepath if BibleOrgSysGlobals.verbosityLevel > 2 else xml_filepath.name}…")
+    narrator_overrides.clear()
+    override_count = 0
+    with open(xml_filepath, 'rt', encoding='utf-8') as xml_file:
+        for event, element in iterparse(xml_file, events=('start','end')):
+            if event == 'start':
+                if element.tag == 'Book':
+                    BBB = BOOK_CODE_TO_BOS_MAPS['UUU'][element.get('id')]
+                    narrator_overrides[BBB] = []
+            elif element.tag == 'Override':
+                start_chapter = int(element.get('startChapter'))
+                end_chapter = int(element.get('endChapter', start_chapter))
+                override = { 'character':element.get('character'),
+                            'startChapter':start_chapter, 'startVerse':int(element.get('startVerse', 1)),
+                            'endChapter':end_chapter, 'endVerse':int(element.get('endVerse', VERSE_COUNTS[BBB][end_chapter-1])) }
+                for block_name in ('startBlock', 'endBlock'): # For overrides which start or end part way through a verse
+                    if block_name in element.attrib:
+                        override[block_name] = int(element.get(block_name))
+                narrator_overrides[BBB].append(override)
+                override_count += 1
+                element.clear()
+    vPrint('Quiet', DEBUGGING_THIS_MODULE, f"  Loaded {override_count:,} narrator overrides for {len(narrator_overrides)} books.")
+    return True
+# end of loadGlyssenData.load_Glyssen_narrator_overrides()
+
+
+def load_Glyssen_style_character_mappings() -> bool:
+    """
+    Load StyleToCharacterMappings.xml which maps USFM markers (e.g., 'wj' for the words of Jesus)
+        to the character who speaks the marked text
+        into style_character_mappings (along with whether it's a paragraph marker).
+
+    Note: As with NarratorOverrides.xml, the XML declaration says that the file is UTF-16 but it's not.
+    """
+    fnPrint(DEBUGGING_THIS_MODULE, "load_Glyssen_style_character_mappings()")
+
+    xml_filepath = GlyssenData_INPUT_FOLDERPATH.joinpath(GlyssenData_INPUT_FILENAMES['styleMappings'])
+    if not os.access(xml_filepath, os.R_OK):
+        logging.error(f"Unable to load style to character mappings from {xml_filepath}")
+        return False
+    vPrint('Quiet', DEBUGGING_THIS_MODULE,
+        f"  Loading GlyssenData style to character mappings from {xml_filepath if BibleOrgSysGlobals.verbosityLevel > 2 else xml_filepath.name}…")
+    style_character_mappings.clear()
+    with open(xml_filepath, 'rt', encoding='utf-8') as xml_file:
+        for _event, element in iterparse(xml_file):
+            if element.tag == 'StyleMapping':
+                style_character_mappings[element.get('sf')] = { 'character':element.get('character'), 'paragraph':element.get('paragraph') == 'true' }
+    vPrint('Quiet', DEBUGGING_THIS_MODULE, f"  Loaded {len(style_character_mappings):,} style to character mappings.")
+    return True
+# end of loadGlyssenData.load_Glyssen_style_character_mappings()
+
+
 def add_FGids() -> bool:
     """
     Take the raw data dict (containing __COLUMN_HEADERS__ and dataList lists),
@@ -248,9 +372,9 @@ def add_FGids() -> bool:
         column_header_list = [COLUMN_NAME_REPLACEMENT_MAP[item] if item in COLUMN_NAME_REPLACEMENT_MAP else item
                                 for item in column_header_list]
 
-        new_data_dict = {}
-        name_list = []
-        max_suffix, max_name = 0, ''
+        # The verses rows go straight into their columnar table (rather than each being copied into a new dict)
+        new_data_dict = the_dict if isinstance(the_dict, ColumnarTable) else {}
+        allocator = FGidAllocator( dict_name )
         for j1,entry_dict in enumerate(data_row_list):
             # dPrint('Info', DEBUGGING_THIS_MODULE, f"{dict_name} {j1} {len(entry_dict)}")
             new_entry_dict = {}
@@ -285,16 +409,8 @@ def add_FGids() -> bool:
                                 assert not entry_dict['C'] and not entry_dict['V']
                             FGid = 'Comment'
                         else:
-                            ix = list(UUU_BOOK_ID_MAP.values()).index(entry_dict['B']) + 1
-                            FGid = f"{BOS_BOOK_ID_MAP[ix]}_{entry_dict['C']}:{entry_dict['V']}~" # Final character to separate suffixes
-                    assert FGid
-                    name_list.append(FGid)
-                    if name_list.count(FGid) > 1:
-                        thisCount = name_list.count(FGid)
-                        if thisCount > max_suffix:
-                            max_suffix = thisCount
-                            max_name = FGid
-                        FGid = f'{FGid}{thisCount}'
+                            FGid = f"{BOOK_CODE_TO_BOS_MAPS['UUU'][entry_dict['B']]}_{entry_dict['C']}:{entry_dict['V']}~" # Final character to separate suffixes
+                    FGid = allocator.allocate( FGid )
                     assert ' ' not in FGid # We want single tokens
                     assert FGid not in new_entry_dict # Don't want to be losing data
                     new_entry_dict['FGid'] = FGid
@@ -302,8 +418,9 @@ def add_FGids() -> bool:
             new_data_dict[FGid] = new_entry_dict
         del the_dict['dataList']
         the_dict['__COLUMN_HEADERS__'] = column_header_list # which has been updated
-        the_dict['dataDict'] = new_data_dict
-        vPrint('Quiet', DEBUGGING_THIS_MODULE, f"  Max suffix for {dict_name} was {max_suffix} on {max_name}.")
+        if new_data_dict is not the_dict: the_dict['dataDict'] = new_data_dict
+        else: vPrint('Verbose', DEBUGGING_THIS_MODULE, f"    Stored {dict_name} in {the_dict}")
+        allocator.report()
     return True
 # end of loadGlyssenData.add_FGids()
 
@@ -374,6 +491,7 @@ def normalise_data() -> bool:
         # create_combined_name_verse_references(name, the_dict) # Not needed for this dataset
         convert_field_types(name, the_dict)
         adjust_Bible_references(name, the_dict)
+        if name == 'characters': add_character_verse_references()
         ensure_best_known_name(name, the_dict)
         if PREFIX_OUR_IDS_FLAG: prefix_our_IDs(name, the_dict)
 
@@ -464,44 +582,40 @@ def adjust_Bible_references(dataName:str, dataDict:dict) -> bool:
         # dPrint( 'Normal', DEBUGGING_THIS_MODULE, f"{value}")
         if key == '__COLUMN_HEADERS__':
             continue
-        # for name_data in value['names']:
-        #     for j,ref_string in enumerate(name_data['individualVerseReferences']):
-        #         name_data['individualVerseReferences'][j] = adjust_Bible_reference(ref_string)
         if 'verses' in value:
-            for j,ref_string in enumerate(value['verses']):
-                # dPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"{j} {ref_string=}")
-                value['verses'][j] = adjust_Bible_reference(ref_string)
+            value['verses'] = convert_references( value['verses'], 'OSIS', packed=PACK_VERSE_REFERENCES_FLAG )
 
     return True
 # end of loadGlyssenData.adjust_Bible_references()
 
-def adjust_Bible_reference(ref:str) -> str:
-    """
-    Change an OSIS Bible reference like '2Chr.1.14' to 'CH2_1:14'
-    """
-    assert len(ref) >= 6 # Uu.c.v
-    assert ';' not in ref
-    assert ':' not in ref
-    assert ' ' not in ref
-    assert ref.count('.') == 2
-    adjRef = ref.replace('.','_',1).replace('.',':',1)
 
-    pre = post = ''
-    # if adjRef[0] in '([' and adjRef[-1] in '])':
-    #     pre = adjRef[0]
-    #     post = adjRef[-1]
-    #     adjRef = adjRef[1:-1]
 
-    osisBookCode, rest = adjRef.split('_')
-    c, v = rest.split( ':' )
-    assert c.isdigit()
-    assert v.isdigit()
+def add_character_verse_references() -> bool:
+    """
+    CharacterDetail.tsv only gives a summary of the references for each character
+        (e.g., 'EST 2:2 <-(3 more)-> EST 6:5'),
+        so join the verses table (from CharacterVerse.tsv) to the characters table on the Character ID
+        to give each character a complete list of its verses (in Biblical order without duplicates).
 
-    ix = list(OSIS_BOOK_ID_MAP.values()).index(osisBookCode) + 1
-    adjRef = f'{pre}{BOS_BOOK_ID_MAP[ix]}_{rest}{post}'
-    # print(f"Converted '{ref}' to '{adjRef}'")
-    return adjRef
-# end of loadGlyssenData.adjust_Bible_reference
+    Where the verses table gives alternative speakers (e.g., 'Rachel/Leah'), the verse is added to each of them.
+    """
+    vPrint('Normal', DEBUGGING_THIS_MODULE, "    Adding verse references to characters…")
+    character_verse_keys = defaultdict(set) # Character ID -> packed verse keys
+    for B, C, V, character_IDs in verses.iter_columns('B', 'C', 'V', 'Character ID'):
+        verse_keys = get_verse_keys(B, C, V)
+        if verse_keys:
+            for character_ID in character_IDs.split('/'):
+                character_verse_keys[character_ID].update(verse_keys)
+
+    for key,value in characters.items():
+        if key == '__COLUMN_HEADERS__':
+            continue
+        verse_keys = sorted(character_verse_keys.get(value['Character ID'], ()))
+        value['verses'] = array('I', verse_keys) if PACK_VERSE_REFERENCES_FLAG else [render_verse_key(verseKey) for verseKey in verse_keys]
+    if 'verses' not in characters['__COLUMN_HEADERS__']:
+        characters['__COLUMN_HEADERS__'].append('verses')
+    return True
+# end of loadGlyssenData.add_character_verse_references()
 
 
 def ensure_best_known_name(dataName:str, dataDict:dict) -> bool:
@@ -511,24 +625,13 @@ def ensure_best_known_name(dataName:str, dataDict:dict) -> bool:
         e.g.,   Joshua, Joshua2, Joshua3.
     However, in this case, Joshua2 is the most well-known character and so we want to end up with
                 Joshua1, Joshua, Joshua3.
-    This is done by comparing the number of verse references.
+    This is done by comparing the number of verses (see add_character_verse_references() above).
 
     Note: This only changes the internal records, not the actual dictionary keys.
             That gets handled later.
     """
     vPrint('Normal', DEBUGGING_THIS_MODULE, f"    Normalising {dataName} to ensure best known name…")
 
-    def get_reference_count(referenceEntry:str) -> int:
-        """
-        Returns the number of Bible references for a given character entry
-        """
-        if '&' in referenceEntry: return referenceEntry.count('&') + 1
-        elif 'more)' in referenceEntry: # e.g., "EST 2:2 <-(3 more)-> EST 6:5"
-            match = re.search("\((\d{1,4}) more\)", referenceEntry)
-            assert match
-            return int(match.group(1)) + 2
-        else: return 1
-
     for key,value in dataDict.items():
         if key == '__COLUMN_HEADERS__':
             continue
@@ -539,13 +642,13 @@ def ensure_best_known_name(dataName:str, dataDict:dict) -> bool:
             base_id = old_id[:-1]
             # dPrint('Normal', DEBUGGING_THIS_MODULE, f"      {old_id=} {base_id=} {key}={value}")
 
-            references_count = get_reference_count(dataDict[base_id]['Reference']) if dataName=='characters' else 0
+            references_count = len(dataDict[base_id]['verses']) if dataName=='characters' else 0
             references_counts = { base_id: references_count }
             max_count, num_maxes, second_highest = references_count, 1, 0
             for suffix in range(2,30):
                 suffixed_entry = f'{base_id}{suffix}'
                 try:
-                    if dataName=='characters': references_count = get_reference_count( dataDict[suffixed_entry]['Reference'] )
+                    if dataName=='characters': references_count = len( dataDict[suffixed_entry]['verses'] )
                     else:
                         _just_test_for_an_entry = dataDict[suffixed_entry]['B']
                         references_count = 0
@@ -706,16 +809,20 @@ def rebuild_dictionaries(key_name:str) -> bool:
     for dict_name,the_dict in DB_LIST:
         # dPrint('Normal', DEBUGGING_THIS_MODULE, f"  {dict_name=} ({len(the_dict)}) {the_dict.keys()}")
         assert '__HEADERS__' not in the_dict # and '__HEADERS__' not in the_dict['dataDict']
-        column_headers_list = the_dict['__COLUMN_HEADERS__']
-        if 'dataDict' in the_dict:
-            old_length = len(the_dict['dataDict']) + 1
-            new_dict = { v[key_name]:v for _k,v in the_dict['dataDict'].items() }
-        else:
+        if isinstance(the_dict, ColumnarTable): # Just change its row keys (without materialising all the rows)
             old_length = len(the_dict)
-            new_dict = { v[key_name]:v for k,v in the_dict.items() if k!='__COLUMN_HEADERS__'}
-        the_dict.clear()            # We do it this way so that we update the existing (global) dict
-        the_dict['__COLUMN_HEADERS__'] = column_headers_list
-        the_dict.update(new_dict)   #  rather than creating an entirely new dict
+            the_dict.rekey(key_name)
+        else:
+            column_headers_list = the_dict['__COLUMN_HEADERS__']
+            if 'dataDict' in the_dict:
+                old_length = len(the_dict['dataDict']) + 1
+                new_dict = { v[key_name]:v for _k,v in the_dict['dataDict'].items() }
+            else:
+                old_length = len(the_dict)
+                new_dict = { v[key_name]:v for k,v in the_dict.items() if k!='__COLUMN_HEADERS__'}
+            the_dict.clear()            # We do it this way so that we update the existing (global) dict
+            the_dict['__COLUMN_HEADERS__'] = column_headers_list
+            the_dict.update(new_dict)   #  rather than creating an entirely new dict
         if len(the_dict) != old_length:
             logging.critical(f"rebuild_dictionaries({key_name}) for {dict_name} unexpectedly went from {old_length:,} entries to {len(the_dict):,}")
         if prefixed_our_IDs: # We can safely combine all the dictionaries into one
@@ -753,6 +860,7 @@ def export_JSON(subType:str) -> bool:
     """
     assert subType
     vPrint('Quiet', DEBUGGING_THIS_MODULE, f"\nExporting {subType} JSON GlyssenData files…")
+    export_file_list = []
 
     for dict_name,the_dict in ALL_DB_LIST:
         if the_dict:
@@ -764,39 +872,201 @@ def export_JSON(subType:str) -> bool:
             else: data_length = len(the_dict) - 1
             filepath = GlyssenData_OUTPUT_FOLDERPATH.joinpath(f'{subType}_{dict_name.title()}.json')
             vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Exporting {data_length:,} {dict_name} to {filepath}…")
-            with open( filepath, 'wt', encoding='utf-8' ) as outputFile:
-                # WARNING: The following code would convert any int keys to str !!!
-                json.dump( HEADER_DICT | the_dict, outputFile, ensure_ascii=False, indent=2 )
-
+            # WARNING: The following code would convert any int keys to str !!!
+            export_file_list.append( (filepath, the_dict) )
+
+    write_JSON_files( export_file_list, HEADER_DICT, compact=COMPACT_JSON_FLAG, default=render_packed_references_for_JSON,
+                        compression_formats=COMPRESSION_FORMATS if COMPRESS_JSON_FLAG else () )
+    if EXPORT_JSON_LINES_FLAG and subType == 'normalised':
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Also exporting {len(export_file_list)} {subType} tables as JSON Lines…")
+        write_JSON_files( [(filepath.with_suffix('.jsonl'), the_dict) for filepath,the_dict in export_file_list], HEADER_DICT,
+                            default=render_packed_references_for_JSON, compression_formats=COMPRESSION_FORMATS if COMPRESS_JSON_FLAG else (),
+                            json_lines=True )
     return True
 # end of loadGlyssenData.export_JSON()
 
 
 def export_xml(subType:str) -> bool:
     """
+    Export the dictionaries as a single XML file.
+
+    The entries are written one at a time (see XMLWriter.py) rather than building the whole XML document in memory.
     """
     assert subType
     vPrint('Quiet', DEBUGGING_THIS_MODULE, f"\nExporting {subType} XML GlyssenData file…")
 
-    # vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  NOT Wrote {len(xml_lines):,} XML lines.")
+    start_time = time.time()
+    filepath = GlyssenData_XML_OUTPUT_FILEPATH if subType == 'normalised' \
+                else GlyssenData_OUTPUT_FOLDERPATH.joinpath(f'{subType}_{GlyssenData_XML_OUTPUT_FILENAME}')
+    entry_count = write_XML_file( filepath, 'GlyssenData', HEADER_DICT, [(dict_name,the_dict) for dict_name,the_dict in DB_LIST if the_dict],
+                                    default=render_packed_references_for_JSON )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Wrote {entry_count:,} entries to {filepath} in {time.time()-start_time:.2f}s.")
     return True
 # end of loadGlyssenData.export_xml()
 
 
+def get_verse_keys(B:str, C:str, V:str) -> List[int]:
+    """
+    Returns the packed verse keys (see BibleReferences.py) of the verse (or verse range like '6-15')
+        from the B, C, and V fields of an entry from the verses table (or an empty list for the comment entries).
+    """
+    if B.startswith('#'): return [] # it's a comment line
+    BBB, C = BOOK_CODE_TO_BOS_MAPS['UUU'][B], int(C)
+    first_V, _hyphen, last_V = V.partition('-')
+    return [encode_verse_key(BBB, C, V) for V in range(int(first_V), int(last_V or first_V)+1)]
+# end of loadGlyssenData.get_verse_keys()
+
+
+def get_character_FGids() -> Dict[str,str]:
+    """
+    Returns a dict mapping each Glyssen Character ID to our FGid for the character.
+    """
+    return { value['Character ID']:FGid for FGid,value in characters.items() if FGid != '__COLUMN_HEADERS__' }
+# end of loadGlyssenData.get_character_FGids()
+
+
+def create_verse_speaker_index() -> bool:
+    """
+    Pivot the verses table (from CharacterVerse.tsv) in a single pass
+        into verse_speakers which maps our packed verse keys
+        to a list of (character FGid, delivery, quote type, default character FGid) tuples,
+        so that the possible speakers in a verse can be found without scanning all the rows.
+
+    Where the Character ID gives alternative speakers (e.g., 'Rachel/Leah'), each one gets its own tuple.
+    Character IDs which aren't in the characters table (e.g., 'narrator-GEN' or 'Needs Review')
+        are kept as they are.
+    """
+    vPrint('Normal', DEBUGGING_THIS_MODULE, "  Creating verse speaker index…")
+    character_FGids = get_character_FGids()
+    verse_speakers.clear()
+    unknown_character_count = 0
+    for B, C, V, character_IDs, delivery, quote_type, default_character \
+            in verses.iter_columns('B', 'C', 'V', 'Character ID', 'Delivery', 'Quote Type', 'Default Character'):
+        verse_keys = get_verse_keys(B, C, V)
+        if not verse_keys: continue
+        speakers = []
+        for character_ID in character_IDs.split('/'):
+            if character_ID not in character_FGids: unknown_character_count += 1
+            speakers.append( (character_FGids.get(character_ID, character_ID), delivery, quote_type,
+                                character_FGids.get(default_character, default_character)) )
+        for verseKey in verse_keys:
+            try: verse_speakers[verseKey].extend(speakers)
+            except KeyError: verse_speakers[verseKey] = speakers.copy()
+    vPrint('Normal', DEBUGGING_THIS_MODULE, f"    Indexed {sum(len(speakers) for speakers in verse_speakers.values()):,} speakers in {len(verse_speakers):,} verses ({unknown_character_count:,} speakers not in the characters table).")
+    return True
+# end of loadGlyssenData.create_verse_speaker_index()
+
+
+def get_verse_speakers(BBB:str, C:int, V:int) -> List[Tuple[str,str,str,str]]:
+    """
+    Returns the list of (character FGid, delivery, quote type, default character FGid) tuples
+        for the given verse (after create_verse_speaker_index() has been run).
+    """
+    return verse_speakers.get(encode_verse_key(BBB, C, V), [])
+# end of loadGlyssenData.get_verse_speakers()
+
+
+def create_narrator_override_index() -> bool:
+    """
+    Create narrator_override_index which has a VerseRangeIndex for each book
+        from its verse ranges to its narrator overrides (with the character FGid if it's in the characters table)
+        so that the overrides for a verse can be found with a binary search,
+        or those for every verse of a book with a single sweep (see VerseRangeIndex.py).
+
+    Overrides which start or end part way through a verse (with a startBlock or endBlock)
+        include the whole verse, so a verse can have more than one override.
+    """
+    vPrint('Normal', DEBUGGING_THIS_MODULE, "  Creating narrator override index…")
+    character_FGids = get_character_FGids()
+    narrator_override_index.clear()
+    for BBB,overrides in narrator_overrides.items():
+        ranges = []
+        for override in overrides:
+            start_reference = f"{BBB}_{override['startChapter']}:{override['startVerse']}"
+            end_reference = f"{BBB}_{override['endChapter']}:{override['endVerse']}"
+            try: start_ordinal, end_ordinal = verse_ordinal(BBB, override['startChapter'], override['startVerse']), verse_ordinal(BBB, override['endChapter'], override['endVerse'])
+            except ValueError as err:
+                logging.warning(f"Skipped narrator override for '{override['character']}' from {start_reference} to {end_reference}: {err}")
+                continue
+            ranges.append( (start_ordinal, end_ordinal, { 'character':character_FGids.get(override['character'], override['character']),
+                                'startReference':start_reference, 'endReference':end_reference,
+                                'startOrdinal':start_ordinal, 'endOrdinal':end_ordinal }
+                                | { block_name:override[block_name] for block_name in ('startBlock','endBlock') if block_name in override }) )
+        narrator_override_index[BBB] = VerseRangeIndex(ranges)
+    verse_count = sum(1 for BBB,range_index in narrator_override_index.items() for _C,_V,overrides in range_index.sweep_book(BBB) if overrides)
+    vPrint('Normal', DEBUGGING_THIS_MODULE, f"    Indexed {sum(len(range_index) for range_index in narrator_override_index.values()):,} narrator overrides covering {verse_count:,} verses in {len(narrator_override_index)} books.")
+    return True
+# end of loadGlyssenData.create_narrator_override_index()
+
+
+def get_narrator_overrides(BBB:str, C:int, V:int) -> List[Dict[str,Union[str,int]]]:
+    """
+    Returns the list of narrator overrides (if any) for the given verse
+        (after create_narrator_override_index() has been run).
+    """
+    return narrator_override_index[BBB].find_verse(BBB, C, V) if BBB in narrator_override_index else []
+# end of loadGlyssenData.get_narrator_overrides()
+
+
+def create_style_speaker_index() -> bool:
+    """
+    Create style_speakers which maps each USFM marker from StyleToCharacterMappings.xml
+        to a (character FGid, is paragraph marker) tuple
+        (with the Glyssen character name if it's not in the characters table, e.g., 'Narrator').
+
+    So that the markers can be looked up exactly as they're found in USFM,
+        each is included with and without its backslash (e.g., 'wj' and '\\wj'),
+        and character markers also in their nested form (e.g., '\\+wj').
+    """
+    vPrint('Normal', DEBUGGING_THIS_MODULE, "  Creating style speaker index…")
+    character_FGids = get_character_FGids()
+    style_speakers.clear()
+    for marker,mapping in style_character_mappings.items():
+        speaker = (character_FGids.get(mapping['character'], mapping['character']), mapping['paragraph'])
+        for marker_form in (marker, f'\\{marker}') if mapping['paragraph'] else (marker, f'\\{marker}', f'\\+{marker}'):
+            style_speakers[marker_form] = speaker
+    return True
+# end of loadGlyssenData.create_style_speaker_index()
+
+
+def get_style_speaker(marker:str) -> Optional[Tuple[str,bool]]:
+    """
+    Returns the (character FGid, is paragraph marker) tuple for the USFM marker (e.g., 'wj' or '\\wj' or '\\+wj')
+        or None if it's not a marker that's attributed to a character
+        (after create_style_speaker_index() has been run).
+    """
+    return style_speakers.get(marker)
+# end of loadGlyssenData.get_style_speaker()
+
+
 def export_verse_index() -> bool:
     """
     Pivot the data to determine which names exist in each verse,
-        and save this in JSON.
+        and save this in JSON and in a memory-mappable binary format (see VerseIndexFile.py)
+        (and optionally in an SQLite database along with the normalised tables).
+
+    Also create and save the verse speaker, narrator override, and style speaker lookups.
     """
     vPrint('Quiet', DEBUGGING_THIS_MODULE, f"\nCalculating and exporting index files…")
+    export_file_list = []
+    verse_index_list = [] # For the SQLite database
     subType = 'normalised'
+    create_verse_speaker_index()
+    create_narrator_override_index()
+    create_style_speaker_index()
     for dict_name,the_dict in ALL_DB_LIST:
         keyName = 'Character ID'
         if not keyName: continue
-        # if dict_name not in ('people','peopleGroups','places'):
-            # continue
 
-        ref_index_dict = defaultdict(list)
+        ref_index_dict = defaultdict(list) # Our keys are packed verse keys
+        if dict_name == 'verses':
+            for FGid, B, C, V in verses.iter_columns('FGid', 'B', 'C', 'V'):
+                for verseKey in get_verse_keys(B, C, V):
+                    ref_index_dict[verseKey].append(FGid)
+        else: # 'characters' and 'all' (which only contains the characters)
+            for verseKey,speakers in verse_speakers.items():
+                FGids = [FGid for FGid in dict.fromkeys(speaker[0] for speaker in speakers) if FGid in characters]
+                if FGids: ref_index_dict[verseKey] = FGids
         GlyssenData_index_dict = {}
         for jj, (key,value) in enumerate(the_dict.items()):
             if key == '__COLUMN_HEADERS__':
@@ -805,8 +1075,6 @@ def export_verse_index() -> bool:
                 continue
 
             FGid = value['FGid']
-            # for ref in value['verses']:
-            #     ref_index_dict[ref].append(FGid)
             unifiedNameGlyssenData = value[keyName]
             GlyssenData_index_dict[unifiedNameGlyssenData] = FGid
             # for name in value['names']:
@@ -818,17 +1086,42 @@ def export_verse_index() -> bool:
             #         else: GlyssenData_index_dict[uniqueNameGlyssenData] = FGid
 
         # Save the dicts as JSON files
+        ref_index_dict = { render_verse_key(verseKey):FGids for verseKey,FGids in ref_index_dict.items() }
+        if dict_name != 'all': verse_index_list.append( (dict_name, ref_index_dict) )
         if ref_index_dict:
             filepath = GlyssenData_OUTPUT_FOLDERPATH.joinpath(f'{subType}_{dict_name.title()}_verseRef_index.json')
             vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Exporting {len(ref_index_dict):,} verse ref index entries to {filepath}…")
-            with open( filepath, 'wt', encoding='utf-8' ) as outputFile:
-                json.dump( HEADER_DICT | ref_index_dict, outputFile, ensure_ascii=False, indent=2 )
+            export_file_list.append( (filepath, ref_index_dict) )
+            link_count = write_verse_index_file( filepath.with_suffix(f'.{VERSE_INDEX_FILE_EXTENSION}'), ref_index_dict )
+            vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Wrote {link_count:,} verse links to binary {filepath.with_suffix(f'.{VERSE_INDEX_FILE_EXTENSION}')}")
+            if SHARD_VERSE_INDEXES_FLAG:
+                book_count = write_verse_index_shards( filepath.with_suffix(''), ref_index_dict, HEADER_DICT, compact=COMPACT_JSON_FLAG,
+                                                        compression_formats=COMPRESSION_FORMATS if COMPRESS_JSON_FLAG else () )
+                vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Wrote {book_count} book verse ref index files and manifest into {filepath.with_suffix('')}/")
         if GlyssenData_index_dict:
             filepath = GlyssenData_OUTPUT_FOLDERPATH.joinpath(f'{subType}_{dict_name.title()}_GlyssenData_index.json')
             vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Exporting {len(GlyssenData_index_dict):,} GlyssenData index entries to {filepath}…")
-            with open( filepath, 'wt', encoding='utf-8' ) as outputFile:
-                json.dump( HEADER_DICT | GlyssenData_index_dict, outputFile, ensure_ascii=False, indent=2 )
-
+            export_file_list.append( (filepath, GlyssenData_index_dict) )
+
+    filepath = GlyssenData_OUTPUT_FOLDERPATH.joinpath(f'{subType}_Verse_speakers_index.json')
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Exporting {len(verse_speakers):,} verse speaker index entries to {filepath}…")
+    export_file_list.append( (filepath, { '__COLUMN_HEADERS__':VERSE_SPEAKER_FIELD_NAMES }
+                                        | { render_verse_key(verseKey):speakers for verseKey,speakers in verse_speakers.items() }) )
+    filepath = GlyssenData_OUTPUT_FOLDERPATH.joinpath(f'{subType}_Narrator_overrides_index.json')
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Exporting narrator overrides for {len(narrator_override_index)} books to {filepath}…")
+    export_file_list.append( (filepath, { BBB:range_index.values for BBB,range_index in narrator_override_index.items() }) )
+    filepath = GlyssenData_OUTPUT_FOLDERPATH.joinpath(f'{subType}_Style_speakers_index.json')
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Exporting {len(style_character_mappings)} style speaker index entries to {filepath}…")
+    export_file_list.append( (filepath, { marker:{ 'character':style_speakers[marker][0], 'paragraph':style_speakers[marker][1] }
+                                                for marker in style_character_mappings }) )
+
+    write_JSON_files( export_file_list, HEADER_DICT, compact=COMPACT_JSON_FLAG,
+                        compression_formats=COMPRESSION_FORMATS if COMPRESS_JSON_FLAG else () )
+    if EXPORT_SQLITE_FLAG:
+        filepath = GlyssenData_OUTPUT_FOLDERPATH.joinpath(f'{subType}_GlyssenData.{SQLITE_FILE_EXTENSION}')
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Also exporting {subType} tables and verse indexes to {filepath}…")
+        export_SQLite_database( filepath, HEADER_DICT, [(dict_name,the_dict) for dict_name,the_dict in DB_LIST if the_dict], verse_index_list,
+                                SQLITE_SEARCH_KEYS, SQLITE_INDEXED_COLUMN_NAMES, search_table_names=SQLITE_SEARCH_TABLE_NAMES, default=render_packed_references_for_JSON )
     return True
 # end of loadGlyssenData.export_verse_index()
 
@@ -839,6 +1132,8 @@ if __name__ == '__main__':
 
     # Configure basic Bible Organisational System (BOS) set-up
     parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    parser.add_argument( '--resume-from', dest='resume_from', choices=RESUMABLE_STAGE_NAMES, help="resume from the checkpoint saved before this stage of a previous run" )
+    parser.add_argument( '--rebuild', action='store_true', dest='rebuild', default=False, help="rebuild even if the build manifest shows nothing has changed" )
     BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
 
     main()
@@ -42,21 +42,33 @@ Module to load and process exported Tyndale House (Cambridge)
 """
 from gettext import gettext as _
 from collections import defaultdict
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Iterator, Union, Callable, NamedTuple
 from pathlib import Path
 from datetime import date
 import os
+import time
+import sys
 import logging
-import json
+import re
 
 import BibleOrgSysGlobals
 from BibleOrgSysGlobals import fnPrint, vPrint, dPrint
-
-
-LAST_MODIFIED_DATE = '2022-08-10' # by RJH
+from FGidAllocator import FGidAllocator
+from BuildManifest import BuildManifest
+from JSONWriter import COMPRESSION_FORMATS, write_JSON_files, display_compression_report
+from XMLWriter import write_XML_file
+from DerivedFileWriter import display_write_report
+from VerseIndexFile import VERSE_INDEX_FILE_EXTENSION, write_verse_index_file, write_verse_index_shards
+from SQLiteExporter import SQLITE_FILE_EXTENSION, export_SQLite_database
+from StageCheckpoints import STAGE_NAMES, RESUMABLE_STAGE_NAMES, run_stages
+from VerseSet import VerseSet
+from BibleReferences import convert_references, render_verse_key, render_packed_references_for_JSON
+
+
+LAST_MODIFIED_DATE = '2026-10-17' # by RJH
 SHORT_PROGRAM_NAME = "loadTIPNR"
 PROGRAM_NAME = "Load Translators Individualised Proper Names file"
-PROGRAM_VERSION = '0.55'
+PROGRAM_VERSION = '0.79'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False
@@ -64,6 +76,19 @@ DEBUGGING_THIS_MODULE = False
 SOURCE_DATA_LAST_DOWNLOADED_DATE_STRING = '2022-07-20'
 
 PREFIX_OUR_IDS_FLAG = True
+COMPACT_JSON_FLAG = False # Write the JSON files without indentation or spaces (smaller and quicker, see JSONWriter.py)
+COMPRESS_JSON_FLAG = False # Also write gzip and xz compressed copies of the JSON files (see JSONWriter.py)
+EXPORT_JSON_LINES_FLAG = False # Also export the normalised tables as JSON Lines (one entry per line, see JSONWriter.py)
+EXPORT_SQLITE_FLAG = False # Also export the normalised tables and verse indexes into an SQLite database (see SQLiteExporter.py)
+SHARD_VERSE_INDEXES_FLAG = False # Also split each verse reference index into a JSON file for each book plus a manifest (see VerseIndexFile.py)
+SAVE_CHECKPOINTS_FLAG = True # Pickle our in-memory state before each pipeline stage so can use --resume-from (see StageCheckpoints.py)
+USE_BUILD_MANIFEST_FLAG = True # Skip the run if the loader, inputs, and outputs are unchanged since the last run (see BuildManifest.py)
+PACK_VERSE_REFERENCES_FLAG = False # Store verse reference lists as array('I') of packed verse keys (rendered back to strings on export)
+STORE_VERSE_SETS_FLAG = False # Store combined verse reference lists as (sorted, de-duplicated) VerseSets (rendered back to strings on export)
+
+SQLITE_SEARCH_KEYS = { 'names':('name','unifiedNameTIPNR','uniqueNameTIPNR','sourceWord'), 'translations':('translations',),
+                        'descriptions':('description','summaryDescription') } # Entry keys for the full-text search columns (see SQLiteExporter.py)
+SQLITE_INDEXED_COLUMN_NAMES = ('name', 'unifiedNameTIPNR')
 
 
 
@@ -85,54 +110,77 @@ TIPNR_OUTPUT_FOLDERPATH = TIPNR_INPUT_FOLDERPATH.joinpath( 'derivedFiles/' )
 TIPNR_XML_OUTPUT_FILENAME = 'TIPNR.xml'
 TIPNR_XML_OUTPUT_FILEPATH = TIPNR_OUTPUT_FOLDERPATH.joinpath(TIPNR_XML_OUTPUT_FILENAME)
 
-# NOTE: USFM books codes at https://ubsicap.github.io/usfm/master/identification/books.html
-#           are all UPPERCASE but TIPNR uses a Title-case form
-Uuu_BOOK_ID_MAP = {
-            1: 'Gen', 2: 'Exo', 3: 'Lev', 4: 'Num', 5: 'Deu',
-            6: 'Jos', 7: 'Jdg', 8: 'Rut', 9: '1Sa', 10: '2Sa',
-            11: '1Ki', 12: '2Ki', 13: '1Ch', 14: '2Ch', 15: 'Ezr', 16: 'Neh', 17: 'Est', 18: 'Job',
-            19: 'Psa', 20: 'Pro', 21: 'Ecc', 22: 'Sng', 23: 'Isa', 24: 'Jer', 25: 'Lam',
-            26: 'Ezk', 27: 'Dan', 28: 'Hos', 29: 'Jol', 30: 'Amo', 31: 'Oba',
-            32: 'Jon', 33: 'Mic', 34: 'Nam', 35: 'Hab', 36: 'Zep', 37: 'Hag', 38: 'Zec', 39: 'Mal',
-            40: 'Mat', 41: 'Mrk', 42: 'Luk', 43: 'Jhn', 44: 'Act',
-            45: 'Rom', 46: '1Co', 47: '2Co', 48: 'Gal', 49: 'Eph', 50: 'Php', 51: 'Col', 52: '1Th', 53: '2Th', 54: '1Ti', 55: '2Ti', 56: 'Tit', 57: 'Phm',
-            58: 'Heb', 59: 'Jas', 60: '1Pe', 61: '2Pe', 62: '1Jn', 63: '2Jn', 64: '3Jn', 65: 'Jud', 66: 'Rev'}
-assert len(Uuu_BOOK_ID_MAP) == 66
-BOS_BOOK_ID_MAP = {
-            1: 'GEN', 2: 'EXO', 3: 'LEV', 4: 'NUM', 5: 'DEU',
-            6: 'JOS', 7: 'JDG', 8: 'RUT', 9: 'SA1', 10: 'SA2',
-            11: 'KI1', 12: 'KI2', 13: 'CH1', 14: 'CH2', 15: 'EZR', 16: 'NEH', 17: 'EST', 18: 'JOB',
-            19: 'PSA', 20: 'PRO', 21: 'ECC', 22: 'SNG', 23: 'ISA', 24: 'JER', 25: 'LAM',
-            26: 'EZK', 27: 'DAN', 28: 'HOS', 29: 'JOL', 30: 'AMO', 31: 'OBA',
-            32: 'JNA', 33: 'MIC', 34: 'NAH', 35: 'HAB', 36: 'ZEP', 37: 'HAG', 38: 'ZEC', 39: 'MAL',
-            40: 'MAT', 41: 'MRK', 42: 'LUK', 43: 'JHN', 44: 'ACT',
-            45: 'ROM', 46: 'CO1', 47: 'CO2', 48: 'GAL', 49: 'EPH', 50: 'PHP', 51: 'COL', 52: 'TH1', 53: 'TH2', 54: '1TI', 55: '2TI', 56: 'TIT', 57: 'PHM',
-            58: 'HEB', 59: 'JAS', 60: 'PE1', 61: 'PE2', 62: 'JN1', 63: 'JN2', 64: 'JN3', 65: 'JDE', 66: 'REV'}
-assert len(BOS_BOOK_ID_MAP) == 66
-
-
-
-def main() -> None:
+
+
+
+def main() -> bool:
     """
+    Runs the full load/clean/FGids/normalise/export pipeline
+        (or the latter part of it if --resume-from was given).
+
+    Returns True if all of the stages succeeded.
     """
     BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
 
-    if load_TIPNR_data():
-        if clean_data():
-            rebuild_dictionaries('unifiedNameTIPNR')
-            export_JSON('raw')
-            export_xml('raw')
-            rebuild_dictionaries('FGid')
-            # if DEBUGGING_THIS_MODULE:
-            export_JSON('mid')
-            if normalise_data() and check_data():
-                rebuild_dictionaries('FGid')
-                export_JSON('normalised')
-                export_xml('normalised')
-                export_verse_index()
+    resume_stage_name = getattr( BibleOrgSysGlobals.commandLineArguments, 'resume_from', None )
+    # We don't use the build manifest when resuming because we haven't reread the inputs
+    build_manifest = get_build_manifest() if USE_BUILD_MANIFEST_FLAG and not resume_stage_name else None
+    if build_manifest is not None and not getattr( BibleOrgSysGlobals.commandLineArguments, 'rebuild', False ) \
+    and build_manifest.is_up_to_date():
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"\nNothing to do: {SHORT_PROGRAM_NAME} and its input and output files are unchanged since the last run." )
+        return True
+
+    if run_stages( sys.modules[__name__], resume_stage_name ):
+        if build_manifest is not None: build_manifest.save()
+        return True
+    return False
 # end of loadTIPNR.main
 
 
+def run_stage( stage_name:str ) -> bool:
+    """
+    Runs one stage of our pipeline (called by StageCheckpoints.run_stages).
+
+    Returns True if the stage succeeded.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"run_stage( {stage_name!r} )" )
+    assert stage_name in STAGE_NAMES
+    if stage_name == 'load':
+        return load_TIPNR_data()
+    if stage_name == 'clean':
+        if not clean_data(): return False
+        rebuild_dictionaries('unifiedNameTIPNR')
+        export_JSON('raw')
+        export_xml('raw')
+        return True
+    if stage_name == 'FGids':
+        rebuild_dictionaries('FGid')
+        # if DEBUGGING_THIS_MODULE:
+        export_JSON('mid')
+        return True
+    if stage_name == 'normalise':
+        return normalise_data() and check_data()
+    if stage_name == 'export':
+        rebuild_dictionaries('FGid')
+        export_JSON('normalised')
+        export_xml('normalised')
+        export_verse_index()
+        display_compression_report()
+        display_write_report()
+        return True
+# end of loadTIPNR.run_stage
+
+
+def get_build_manifest() -> BuildManifest:
+    """
+    Returns the build manifest for our input files and output folder.
+    """
+    return BuildManifest( sys.modules[__name__], [TIPNR_INPUT_FILEPATH], TIPNR_OUTPUT_FOLDERPATH )
+# end of loadTIPNR.get_build_manifest
+
+
+# The module globals that hold our in-memory state (pickled by StageCheckpoints)
+CHECKPOINT_STATE_NAMES = ('prefixed_our_IDs', 'xml_lines', 'people', 'places', 'others', 'allEntries')
 prefixed_our_IDs = False
 xml_lines = []
 people, places, others, allEntries = {}, {}, {}, {}
@@ -141,7 +189,14 @@ people, places, others, allEntries = {}, {}, {}, {}
 def load_TIPNR_data() -> bool:
     """
     This is quite quick.
+
+    We read the file as a stream of records (see read_TIPNR_records below)
+        so only one raw record is held in memory at a time.
+
+    The FGid allocators only live for the duration of this stage
+        so that running the pipeline again in the same process starts afresh.
     """
+    global prefixed_our_IDs
     fnPrint(DEBUGGING_THIS_MODULE, "load_TIPNR_data()")
     vPrint('Quiet', DEBUGGING_THIS_MODULE, f"\nFinding TIPNR TSV file starting at {TIPNR_INPUT_FILEPATH}…")
 
@@ -152,9 +207,116 @@ def load_TIPNR_data() -> bool:
         if try_filepath.startswith('../'*4): break
         vPrint('Quiet', DEBUGGING_THIS_MODULE, f"  Trying to find TIPNR TSV file at {try_filepath}…")
 
+    # Start afresh (in case we've already been run in this process)
+    prefixed_our_IDs = False
+    xml_lines.clear()
+    for dataDict in (people, places, others, allEntries):
+        dataDict.clear()
+    people_allocator, places_allocator, others_allocator = FGidAllocator('people'), FGidAllocator('places'), FGidAllocator('others')
+
     vPrint('Quiet', DEBUGGING_THIS_MODULE, f"  Loading TIPNR TSV file from {try_filepath}…")
+    record_counts = defaultdict(int)
+    for record in read_TIPNR_records(try_filepath):
+        record_counts[record.record_type] += 1
+        if isinstance(record, TIPNRPerson):
+            FGid, new_person = process_TIPNR_person(record, people_allocator)
+            assert FGid not in people
+            if FGid == 'Ben-Geber2':
+                logging.critical("Have duplicate person 'Ben-Geber@1Ki.4.13' (Ben-Geber2)")
+            else:
+                people[FGid] = new_person # We use FGid as the key to create the original dicts
+        elif isinstance(record, TIPNRPlace):
+            FGid, new_place = process_TIPNR_place(record, places_allocator)
+            assert FGid not in places
+            places[FGid] = new_place
+        elif isinstance(record, TIPNROther):
+            FGid, new_other = process_TIPNR_other(record, others_allocator)
+            assert FGid not in others
+            others[FGid] = new_other
+        else:
+            assert isinstance(record, TIPNRComment)
+            comment = ' '.join(field for field in record.line.split('\t') if field and field != '>')
+            if comment: xml_lines.append(comment) # Becomes an XML comment in export_xml()
+
+    vPrint('Quiet', DEBUGGING_THIS_MODULE, f"    {record_counts['person']:,} person, {record_counts['place']:,} place, and {record_counts['other']:,} other records loaded from TIPNR TSV.")
+    for allocator in (people_allocator, places_allocator, others_allocator):
+        allocator.report()
+    return True
+# end of loadTIPNR.load_TIPNR_data()
+
+
+class TIPNRName(NamedTuple):
+    """
+    One of the name sub-rows of a TIPNR person, place, or other record
+        (the fields are the raw TSV strings).
+    """
+    significance: str
+    uniqueName: str # can be something like 'wielded|Adino@2Sa.23.8'
+    strongs: str
+    translations: str
+    STEPBibleFirstLink: str
+    allRefs: str
+
+class TIPNRPerson(NamedTuple):
+    """
+    A TIPNR person record (empty strings for missing fields).
+    """
+    record_type = 'person'
+    unifiedName: str # something like 'Aaron@Exo.4.14=H0175'
+    description: str
+    parents: str
+    siblings: str
+    partners: str
+    offspring: str
+    tribeNation: str
+    summaryDescription: str
+    names: List[TIPNRName]
+
+class TIPNRPlace(NamedTuple):
+    """
+    A TIPNR place record (empty strings for missing fields).
+    """
+    record_type = 'place'
+    unifiedName: str
+    openBibleName: str
+    founder: str
+    people: str
+    googleMapsURL: str
+    palopenMapsURL: str
+    geographicalArea: str
+    comment: str
+    names: List[TIPNRName]
+
+class TIPNROther(NamedTuple):
+    """
+    A TIPNR other record (empty strings for missing fields).
+    """
+    record_type = 'other'
+    unifiedName: str # might not have a uStrongs part, e.g., 'Herodian@Mat.22.16'
+    description: str
+    names: List[TIPNRName]
+
+class TIPNRComment(NamedTuple):
+    """
+    An (unrecognised) TIPNR line outside of the records.
+    """
+    record_type = 'comment'
+    line: str
+
+
+def read_TIPNR_records(filepath) -> Iterator[Union[TIPNRPerson,TIPNRPlace,TIPNROther,TIPNRComment]]:
+    """
+    A generator which reads the TIPNR TSV file line by line
+        and yields each record as it is completed.
+
+    Person, place, and other records include a names list of TIPNRName sub-rows.
+    Any other lines are yielded as TIPNRComment records.
+
+    The heading records (which just give the field names) are not yielded.
+    """
+    fnPrint(DEBUGGING_THIS_MODULE, f"read_TIPNR_records( {filepath} )")
     in_data = in_annotatedExamples = False
-    with open(try_filepath, 'rt', encoding='utf-8') as text_file:
+    with open(filepath, 'rt', encoding='utf-8') as text_file:
         for j, line in enumerate(text_file):
             line = line.rstrip('\n')
             # if in_annotatedExamples:
@@ -165,16 +327,12 @@ def load_TIPNR_data() -> bool:
             #     in_annotatedExamples = True
             if line.startswith('$=====') or line.startswith('\t'):
                 if in_data == 'Person2':
-                    if raw_person['UnifiedName'] != 'UnifiedName=uStrong': # heading fields
-                        process_and_add_person(raw_person)
-                    in_data = False
-                elif in_data == 'Place2':
-                    if raw_place['UnifiedName'] != 'UniqueName=uStrong': # heading fields
-                        process_and_add_place(raw_place)
+                    if record.unifiedName != 'UnifiedName=uStrong': # heading fields
+                        yield record
                     in_data = False
-                elif in_data == 'Other2':
-                    if raw_other['UnifiedName'] != 'UniqueName=uStrong': # heading fields
-                        process_and_add_other(raw_other)
+                elif in_data in ('Place2','Other2'):
+                    if record.unifiedName != 'UniqueName=uStrong': # heading fields
+                        yield record
                     in_data = False
                 # elif in_data == 'PersonNotes':
                 #     del people[raw_other[raw_other['UnifiedName'].split('@')[0]]] # Assumes it has no suffix
@@ -192,18 +350,16 @@ def load_TIPNR_data() -> bool:
             if in_data == 'Person1':
                 columns = line.split('\t')
                 assert len(columns) == 13
-                raw_person['UnifiedName'], raw_person['Description'], raw_person['Parents'], siblings, \
+                unifiedName, description, parents, siblings, \
                     partners, offspring, tribeNation, \
-                    raw_person['SummaryDescription'], _1,_2,_3,_4,_5 = columns
-                assert raw_person['UnifiedName']
-                assert raw_person['Description']
-                assert raw_person['Parents']
-                if siblings: raw_person['Siblings'] = siblings
-                if partners: raw_person['Partners'] = partners
-                if offspring: raw_person['Offspring'] = offspring
-                if tribeNation and tribeNation!='>': raw_person['Tribe/Nation'] = tribeNation
+                    summaryDescription, _1,_2,_3,_4,_5 = columns
+                assert unifiedName
+                assert description
+                assert parents
+                if tribeNation == '>': tribeNation = ''
                 assert not _1 or _2 or _3 or _4 or _5
-                raw_person['Names'] = []
+                record = TIPNRPerson(unifiedName, description, parents, siblings, partners, offspring,
+                                        tribeNation, summaryDescription, names=[])
                 in_data = 'Person2'
             elif in_data == 'Person2':
                 if in_annotatedExamples and line.startswith('NOTES:'):
@@ -211,11 +367,9 @@ def load_TIPNR_data() -> bool:
                 else:
                     columns = line.split('\t')
                     assert len(columns) == 13
-                    this = {}
-                    this['Significance'], this['UniqueName'], this['Strongs'], this['Translations'], \
-                        this['STEPBibleFirstLink'], this['AllRefs'], _1,_2,_3,_4,_5,_6,_7 = columns
+                    _1,_2,_3,_4,_5,_6,_7 = columns[6:]
                     assert not _1 or _2 or _3 or _4 or _5 or _6 or _7
-                    raw_person['Names'].append(this)
+                    record.names.append(TIPNRName(*columns[:6]))
             # elif in_data == 'PersonNotes':
             #     columns = line.split('\t')
             #     assert len(columns) == 13
@@ -226,21 +380,15 @@ def load_TIPNR_data() -> bool:
             elif in_data == 'Place1':
                 columns = line.split('\t')
                 assert len(columns) == 13
-                raw_place['UnifiedName'], openBibleName, founder, people_, \
+                unifiedName, openBibleName, founder, people_, \
                     googleMapsURL, palopenMapsURL, geographicalArea, \
                     _1,_2,_3,_4,_5,_6 = columns
-                assert raw_place['UnifiedName']
-                if openBibleName: raw_place['OpenBibleName'] = openBibleName
-                if founder: raw_place['Founder'] = founder
-                if people_: raw_place['People'] = people_
-                if googleMapsURL: raw_place['GoogleMapsURL'] = googleMapsURL
-                if palopenMapsURL: raw_place['PalopenMapsURL'] = palopenMapsURL
-                if geographicalArea and geographicalArea != '>':
-                    raw_place['GeographicalArea'] = geographicalArea
-                if _1 and _1.startswith('#'):
-                    raw_place['Comment'] = _1[1:]
+                assert unifiedName
+                if geographicalArea == '>': geographicalArea = ''
+                comment = _1[1:] if _1.startswith('#') else ''
                 assert not _2 or _3 or _4 or _5 or _6
-                raw_place['Names'] = []
+                record = TIPNRPlace(unifiedName, openBibleName, founder, people_, googleMapsURL, palopenMapsURL,
+                                        geographicalArea, comment, names=[])
                 in_data = 'Place2'
             elif in_data == 'Place2':
                 if in_annotatedExamples and line.startswith('NOTES:'):
@@ -248,12 +396,10 @@ def load_TIPNR_data() -> bool:
                 else:
                     columns = line.split('\t')
                     assert len(columns) == 13
-                    this = {}
-                    this['Significance'], this['UniqueName'], this['Strongs'], this['Translations'], \
-                        this['STEPBibleFirstLink'], this['AllRefs'], _1,_2,_3,_4,_5,_6,_7 = columns
-                    if (_1 or _2 or _3 or _4 or _5 or _6 or _7) and raw_place['UnifiedName'] != 'UniqueName=uStrong':
-                        logging.critical(f"Losing {raw_place['UnifiedName']} place column: {_1=} {_2=} {_3=} {_4=} {_5=} {_6=} {_7=}")
-                    raw_place['Names'].append(this)
+                    _1,_2,_3,_4,_5,_6,_7 = columns[6:]
+                    if (_1 or _2 or _3 or _4 or _5 or _6 or _7) and record.unifiedName != 'UniqueName=uStrong':
+                        logging.critical(f"Losing {record.unifiedName} place column: {_1=} {_2=} {_3=} {_4=} {_5=} {_6=} {_7=}")
+                    record.names.append(TIPNRName(*columns[:6]))
             # elif in_data == 'PlaceNotes':
             #     columns = line.split('\t')
             #     assert len(columns) == 13
@@ -264,10 +410,10 @@ def load_TIPNR_data() -> bool:
             elif in_data == 'Other1':
                 columns = line.split('\t')
                 assert len(columns) == 13
-                raw_other['UnifiedName'], raw_other['Description'], \
+                unifiedName, description, \
                     _1,_2,_3,_4,_5,_6,_7,_8,_9,_10,_11 = columns
                 assert not _1 or _2 or _3 or _4 or _5 or _6 or _7 or _8 or _9 or _10 or _11
-                raw_other['Names'] = []
+                record = TIPNROther(unifiedName, description, names=[])
                 in_data = 'Other2'
             elif in_data == 'Other2':
                 if in_annotatedExamples and line.startswith('NOTES:'):
@@ -275,11 +421,9 @@ def load_TIPNR_data() -> bool:
                 else:
                     columns = line.split('\t')
                     assert len(columns) == 13
-                    this = {}
-                    this['Significance'], this['UniqueName'], this['Strongs'], this['Translations'], \
-                        this['STEPBibleFirstLink'], this['AllRefs'], _1,_2,_3,_4,_5,_6,_7 = columns
+                    _1,_2,_3,_4,_5,_6,_7 = columns[6:]
                     assert not _1 or _2 or _3 or _4 or _5 or _6 or _7
-                    raw_other['Names'].append(this)
+                    record.names.append(TIPNRName(*columns[:6]))
             # elif in_data == 'OtherNotes':
             #     columns = line.split('\t')
             #     assert len(columns) == 13
@@ -289,648 +433,173 @@ def load_TIPNR_data() -> bool:
             #     except KeyError: raw_other['Notes'] = columns[0]
             elif line == '$========== PERSON(s)\t\t\t\t\t\t\t\t\t\t\t\t':
                 in_data = 'Person1'
-                raw_person = {}
             elif line == '$========== PLACE\t\t\t\t\t\t\t\t\t\t\t\t':
                 in_data = 'Place1'
-                raw_place = {}
             elif line == '$========== OTHER\t\t\t\t\t\t\t\t\t\t\t\t':
                 in_data = 'Other1'
-                raw_other = {}
             else:
-                xml_lines.append(f"<-- {line} -->")
+                yield TIPNRComment(line)
 
-    vPrint('Quiet', DEBUGGING_THIS_MODULE, f"    {j:,} lines loaded from TIPNR TSV.")
-    return True
-# end of loadTIPNR.load_TIPNR_data()
+# end of loadTIPNR.read_TIPNR_records()
 
 
-def process_and_add_person( raw_data: dict) -> bool:
+def process_TIPNR_person( record:TIPNRPerson, allocator:FGidAllocator ) -> Tuple[str,dict]:
     """
+    Converts a person record into our person dict
+        and returns the FGid (from the allocator) along with it.
+
     We don't append a numerical suffix for the first entry we find.
     However, if the same name is used for another person, we append suffixes starting with 2.
     So might end up with "Fred, Fred2, Fred3" here.
     (Later we will convert that to "Fred1, Fred2, Fred3"
         and if Fred3 is the most well-known one, to "Fred1, Fred2, Fred".)
     """
-    # fnPrint(DEBUGGING_THIS_MODULE, f"\nprocess_and_add_person( {raw_data} )")
+    # fnPrint(DEBUGGING_THIS_MODULE, f"\nprocess_TIPNR_person( {record} )")
     new_person = {}
 
-    # UnifiedName is something like 'Aaron@Exo.4.14=H0175'
-    # UniqueName can be something like 'wielded|Adino@2Sa.23.8'
-    unifiedName, uStrongs = raw_data['UnifiedName'].split('=')
-    del raw_data['UnifiedName']
+    unifiedName, uStrongs = record.unifiedName.split('=')
     name = unifiedName.split('@')[0]
-    if name not in people:
-        FGid = name
-    else:
-        for suffix in range(2,30): # see Azariah (19x) and Maaseiah (20x) and Shemaiah (26x) and Zechariah (29x)
-            if f'{name}{suffix}' not in people:
-                FGid = f'{name}{suffix}'
-                break
-        else: unable_to_create_unique_person_id
+    FGid = allocator.allocate( name )
     new_person['FGid'] = FGid
     new_person['name'] = name
     new_person['unifiedNameTIPNR'] = unifiedName
-    # if unifiedName != uniqueName:
-    #     dPrint('Normal', DEBUGGING_THIS_MODULE, f"  Person '{FGid}' {unifiedName=} vs {uniqueName=}")
-    #     new_person['uniqueNameTIPNR'] = uniqueName
     new_person['uStrongs'] = uStrongs
 
-    if raw_data['Description']:
-        new_person['description'] = raw_data['Description']
-    del raw_data['Description']
-    if raw_data['SummaryDescription']:
-        new_person['summaryDescription'] = raw_data['SummaryDescription'][1:] if raw_data['SummaryDescription'].startswith('#') else raw_data['SummaryDescription']
-    del raw_data['SummaryDescription']
-    if raw_data['Parents']:
-        if raw_data['Parents'] == '=+': pass
-        elif ' + ' in raw_data['Parents']:
-            new_person['father'], new_person['mother'] = raw_data['Parents'].split(' + ')
-        elif raw_data['Parents'].startswith('=+ '):
-            new_person['mother'] = raw_data['Parents'][3:]
-        elif raw_data['Parents'].endswith(' +'):
-            new_person['father'] = raw_data['Parents'][:-2]
-        elif raw_data['Parents'] == '#ERROR!': # original spreadsheet error!!!
+    if record.description:
+        new_person['description'] = record.description
+    if record.summaryDescription:
+        new_person['summaryDescription'] = record.summaryDescription[1:] if record.summaryDescription.startswith('#') else record.summaryDescription
+    if record.parents:
+        if record.parents == '=+': pass
+        elif ' + ' in record.parents:
+            new_person['father'], new_person['mother'] = record.parents.split(' + ')
+        elif record.parents.startswith('=+ '):
+            new_person['mother'] = record.parents[3:]
+        elif record.parents.endswith(' +'):
+            new_person['father'] = record.parents[:-2]
+        elif record.parents == '#ERROR!': # original spreadsheet error!!!
             logging.critical(f"Ignoring spreadsheet #ERROR! for {unifiedName} parents.")
         else: not_done
-    del raw_data['Parents']
-    if 'Siblings' in raw_data:
-        assert raw_data['Siblings']
-        new_person['siblings'] = raw_data['Siblings'].split(', ')
-        del raw_data['Siblings']
-    if 'Partners' in raw_data:
-        assert raw_data['Partners']
-        new_person['partners'] = raw_data['Partners'].split(', ')
-        del raw_data['Partners']
-    if 'Offspring' in raw_data:
-        assert raw_data['Offspring']
-        new_person['offspring'] = raw_data['Offspring'].split(', ')
-        del raw_data['Offspring']
-    if 'Tribe/Nation' in raw_data:
-        assert raw_data['Tribe/Nation']
-        new_person['tribe/nation'] = raw_data['Tribe/Nation']
-        del raw_data['Tribe/Nation']
-
-    for raw_name_data in raw_data['Names']:
-        # dPrint('Normal', DEBUGGING_THIS_MODULE, f"  Person {raw_name_data=}")
+    if record.siblings:
+        new_person['siblings'] = record.siblings.split(', ')
+    if record.partners:
+        new_person['partners'] = record.partners.split(', ')
+    if record.offspring:
+        new_person['offspring'] = record.offspring.split(', ')
+    if record.tribeNation:
+        new_person['tribe/nation'] = record.tribeNation
+
+    for name_record in record.names:
         if 'names' not in new_person:
             new_person['names'] = []
-        new_person_name = {}
-
-        if raw_name_data['Significance']:
-            new_person_name['significance'] = raw_name_data['Significance']
-        del raw_name_data['Significance']
-        if raw_name_data['UniqueName']:
-            new_person_name['uniqueNameTIPNR'] = raw_name_data['UniqueName']
-        del raw_name_data['UniqueName']
-
-        if raw_name_data['Strongs']:
-            if '+' in raw_name_data['Strongs']: # it's a multi-word name like Bath-shua
-                word1Info, word2Info = raw_name_data['Strongs'].split('+')
-                dStrongs1, rest1 = word1Info.split('«')
-                eStrongs1, sourceWord1 = rest1.split('=')
-                dStrongs2, rest2 = word2Info.split('«')
-                eStrongs2, sourceWord2 = rest2.split('=')
-                new_person_name['dStrongs'] = [dStrongs1, dStrongs2]
-                new_person_name['eStrongs'] = [eStrongs1, eStrongs2]
-                new_person_name['sourceWord'] = [sourceWord1, sourceWord2]
-            elif '«' in raw_name_data['Strongs']: # normal case -- a single word with three parts
-                new_person_name['dStrongs'], rest = raw_name_data['Strongs'].split('«')
-                new_person_name['eStrongs'], new_person_name['sourceWord'] = rest.split('=', 1) # Might be two equals / two words
-            else: # special case -- a single word with two parts
-                bits = raw_name_data['Strongs'].split('=')
-                if bits[0]: new_person_name['dStrongs'] = bits[0] # or is it eStrongs? or both???
-                if bits[1]: new_person_name['sourceWord'] = bits[1] # What does '.' mean???
-        del raw_name_data['Strongs']
-
-        translations = {}
-        if raw_name_data['Translations'] and raw_name_data['Translations'] != '[ ]':
-            raw_name_data['Translations'] = raw_name_data['Translations'].replace('JKV','KJV').replace('  ',' ') # Fix apparent error and double-space on Hanochite
-            if raw_name_data['Translations'] == 'Joda (Var, KJV= Juda)':
-                translations['ESV'] = translations['NIV'] = 'Joda (variant)'
-                translations['Variant'] = 'Joda'
-                translations['KJB'] = 'Juda'
-            elif raw_name_data['Translations'].endswith(' (=Var, KJV)'):
-                name = raw_name_data['Translations'][:-12]
-                translations['ESV'] = translations['NIV'] = f'{name} (variant)'
-                translations['KJB'] = name
-            elif ' (=Qere, KJV= ' in raw_name_data['Translations'] and 'NIV' not in raw_name_data['Translations'] and 'ESV' not in raw_name_data['Translations']:
-                assert raw_name_data['Translations'].endswith(')')
-                qere, translations['KJB'] = raw_name_data['Translations'][:-1].split(' (=Qere, KJV= ')
-                translations['ESV'] = translations['NIV'] = translations['Qere'] = qere
-            elif raw_name_data['Translations'] == 'Moses (=LXX; KJV= Manasseh)':
-                translations['ESV'] = translations['NIV'] = translations['LXX'] = 'Moses'
-                translations['KJB'] = 'Manasseh'
-            elif ' (Var, KJV, NIV= ' in raw_name_data['Translations']:
-                assert raw_name_data['Translations'].endswith(')')
-                translations['ESV'], other = raw_name_data['Translations'][:-1].split(' (Var, KJV, NIV= ')
-                translations['variant'] = translations['KJB'] = translations['NIV'] = other
-            elif 'Ketiv' in raw_name_data['Translations']:
-                if raw_name_data['Translations'] == 'Birzaith (=Qere. Ketiv= Birzoth; KJV= Birzavith)':
-                    translations['ESV'] = translations['ESV'] = 'Birzaith'
-                    translations['Ketiv'] = 'Birzoth'
-                    translations['KJB'] = 'Birzavith'
-            elif 'ESV' not in raw_name_data['Translations'] and 'NIV' not in raw_name_data['Translations'] and 'KJV' not in raw_name_data['Translations']:
-                if 'Qere' not in raw_name_data['Translations']: # The following two asserts fail on 'Ammihud (=Qere)'
-                    assert '(' not in raw_name_data['Translations'] and ')' not in raw_name_data['Translations']
-                    # assert ' ' not in raw_name_data['Translations'] # Fails on 'Canaanite woman'
-                translations['ESV'] = translations['NIV'] = translations['KJB'] = raw_name_data['Translations']
-            elif 'ESV' not in raw_name_data['Translations']:
-                assert '(' in raw_name_data['Translations'] and ')' in raw_name_data['Translations']
-                if 'KJV' not in raw_name_data['Translations']: # must be NIV
-                    try: translations['ESV'], rest = raw_name_data['Translations'].split(' (NIV= ')
-                    except ValueError: # missing space ???
-                        translations['ESV'], rest = raw_name_data['Translations'].split(' (NIV=')
-                    translations['KJB'] = translations['ESV']
-                    assert rest.endswith(')')
-                    translations['NIV'] = rest[:-1]
-                elif 'NIV' not in raw_name_data['Translations']: # must be KJV
-                    try: translations['ESV'], rest = raw_name_data['Translations'].split(' (KJV= ')
-                    except ValueError: # missing space ???
-                        try: translations['ESV'], rest = raw_name_data['Translations'].split('(KJV= ')
-                        except ValueError: # missing space ???
-                            translations['ESV'], rest = raw_name_data['Translations'].split('(KJV=')
-                    translations['NIV'] = translations['ESV']
-                    assert rest.endswith(')')
-                    translations['KJB'] = rest[:-1]
-                else: # must be both
-                    if '(KJV, NIV=' in raw_name_data['Translations']:
-                        translations['ESV'], rest = raw_name_data['Translations'].split(' (KJV, NIV= ')
-                        assert rest.endswith(')')
-                        translations['KJB'] = translations['NIV'] = rest[:-1]
-                    elif raw_name_data['Translations'].index('KJV') < raw_name_data['Translations'].index('NIV'):
-                        try: translations['ESV'], rest = raw_name_data['Translations'].split(' (KJV= ')
-                        except ValueError: # missing space ???
-                            try: translations['ESV'], rest = raw_name_data['Translations'].split(' (KJV=')
-                            except ValueError: # missing space ???
-                                translations['ESV'], rest = raw_name_data['Translations'].split('(KJV=')
-                        assert rest.endswith(')')
-                        try: translations['KJB'], translations['NIV'] = rest[:-1].split('; NIV= ')
-                        except ValueError: # missing space ???
-                            try: translations['KJB'], translations['NIV'] = rest[:-1].split('; NIV=')
-                            except ValueError: translations['KJB'], translations['NIV'] = rest[:-1].split(', NIV=')
-                    else: # NIV is listed first this time!
-                        translations['ESV'], rest = raw_name_data['Translations'].split(' (NIV= ')
-                        assert rest.endswith(')')
-                        translations['NIV'], translations['KJV'] = rest[:-1].split('; KJV= ')
-            else: # must have 'ESV' -- why???
-                if raw_name_data['Translations'] == 'Ammi/-nadib (ESV= my kinsman, a prince; NIV= royal of my people)':
-                    translations['ESV'] = 'Ammi-nadib (my kinsman, a prince)'
-                    translations['NIV'] = 'Ammi-nadib (royal of my people)'
-                    translations['KJB'] = 'Ammi-nadib'
-                elif raw_name_data['Translations'] == 'Rapha (KJV, ESV= "giant")':
-                    translations['ESV'] = translations['KJB'] = '"giant"'
-                    translations['NIV'] = 'Rapha'
-                elif raw_name_data['Translations'] == 'Raphaite (KJV, ESV= "giant")':
-                    translations['ESV'] = translations['KJB'] = '"giant"'
-                    translations['NIV'] = 'Raphaite'
-                elif raw_name_data['Translations'] == 'Misgab (ESV= fortress; NIV= stronghold)':
-                    translations['ESV'] = '"fortress"'
-                    translations['NIV'] = '"stronghold"'
-                    translations['KJB'] = 'Misgab'
-                elif raw_name_data['Translations'].endswith(' (ESV, NIV= [ ])'):
-                    translations['KJB'] = raw_name_data['Translations'][:-16]
-                    translations['ESV'] = translations['NIV'] = ''
-                else: not_done_yet
-        if translations: new_person_name['translations'] = translations
-        del raw_name_data['Translations']
-
-        if raw_name_data['STEPBibleFirstLink']:
-            new_person_name['STEPBibleFirstLink'] = raw_name_data['STEPBibleFirstLink']
-        del raw_name_data['STEPBibleFirstLink']
-        if raw_name_data['AllRefs']:
-            new_person_name['individualVerseReferences'] = split_refs(raw_name_data['AllRefs'])
-        del raw_name_data['AllRefs']
-        assert not raw_name_data, f"Why do we have person left-over {raw_name_data=}?"
+        new_person_name = process_TIPNR_name( name_record, record.record_type )
         if new_person_name:
             new_person['names'].append(new_person_name)
-    del raw_data['Names']
-
-    if 'Notes' in raw_data:
-        assert raw_data['Notes']
-        new_person['notes'] = raw_data['Notes']
-        del raw_data['Notes']
 
-    assert not raw_data, f"Why do we have person left-over {raw_data=}?"
+    # dPrint('Quiet', DEBUGGING_THIS_MODULE, f"\n{FGid} {new_person=}")
+    return FGid, new_person
+# end of loadTIPNR.process_TIPNR_person()
 
-    assert FGid not in people
-    if FGid == 'Ben-Geber2':
-        logging.critical("Have duplicate person 'Ben-Geber@1Ki.4.13' (Ben-Geber2)")
-    else:
-        people[FGid] = new_person # We use FGid as the key to create the original dicts
-    # dPrint('Quiet', DEBUGGING_THIS_MODULE, f"\n{len(people)} {new_person=}")
-    return True
-
-def process_and_add_place( raw_data: dict) -> bool:
+def process_TIPNR_place( record:TIPNRPlace, allocator:FGidAllocator ) -> Tuple[str,dict]:
     """
+    Converts a place record into our place dict
+        and returns the FGid (from the allocator) along with it.
     """
-    # fnPrint(DEBUGGING_THIS_MODULE, f"\nprocess_and_add_place( {raw_data} )")
+    # fnPrint(DEBUGGING_THIS_MODULE, f"\nprocess_TIPNR_place( {record} )")
     new_place = {}
 
-    # UnifiedName is something like 'Aaron@Exo.4.14=H0175'
-    # UniqueName can be something like 'wielded|Adino@2Sa.23.8'
-    unifiedName, uStrongs = raw_data['UnifiedName'].split('=')
-    del raw_data['UnifiedName']
+    unifiedName, uStrongs = record.unifiedName.split('=')
     name = unifiedName.split('@')[0]
-    if name not in places:
-        FGid = name
-    else:
-        for suffix in range(2,9):
-            if f'{name}{suffix}' not in places:
-                FGid = f'{name}{suffix}'
-                break
-        else: unable_to_create_unique_place_id
+    FGid = allocator.allocate( name )
     new_place['FGid'] = FGid
     new_place['name'] = name
     new_place['unifiedNameTIPNR'] = unifiedName
-    # if unifiedName != uniqueName:
-    #     dPrint('Normal', DEBUGGING_THIS_MODULE, f"  Place '{FGid}' {unifiedName=} vs {uniqueName=}")
-    #     new_place['uniqueNameTIPNR'] = uniqueName
     new_place['uStrongs'] = uStrongs
 
-    if 'OpenBibleName' in raw_data:
-        assert raw_data['OpenBibleName']
-        new_place['OpenBibleName'] = raw_data['OpenBibleName']
-        del raw_data['OpenBibleName']
-    if 'Founder' in raw_data:
-        assert raw_data['Founder']
-        new_place['founder'] = raw_data['Founder']
-        del raw_data['Founder']
-    if 'People' in raw_data:
-        assert raw_data['People']
-        new_place['people'] = raw_data['People']
-        del raw_data['People']
-    if 'GoogleMapsURL' in raw_data:
-        assert raw_data['GoogleMapsURL']
-        new_place['GoogleMapsURL'] = raw_data['GoogleMapsURL']
-        del raw_data['GoogleMapsURL']
-    if 'PalopenMapsURL' in raw_data:
-        assert raw_data['PalopenMapsURL']
-        new_place['PalopenMapsURL'] = raw_data['PalopenMapsURL']
-        del raw_data['PalopenMapsURL']
-    if 'GeographicalArea' in raw_data:
-        assert raw_data['GeographicalArea']
-        new_place['geographicalArea'] = raw_data['GeographicalArea']
-        del raw_data['GeographicalArea']
-
-    for raw_name_data in raw_data['Names']:
-        # dPrint('Normal', DEBUGGING_THIS_MODULE, f"  Place {raw_name_data=}")
+    if record.openBibleName:
+        new_place['OpenBibleName'] = record.openBibleName
+    if record.founder:
+        new_place['founder'] = record.founder
+    if record.people:
+        new_place['people'] = record.people
+    if record.googleMapsURL:
+        new_place['GoogleMapsURL'] = record.googleMapsURL
+    if record.palopenMapsURL:
+        new_place['PalopenMapsURL'] = record.palopenMapsURL
+    if record.geographicalArea:
+        new_place['geographicalArea'] = record.geographicalArea
+
+    for name_record in record.names:
         if 'names' not in new_place:
             new_place['names'] = []
-        new_place_name = {}
-
-        if raw_name_data['Significance']:
-            new_place_name['significance'] = raw_name_data['Significance']
-        del raw_name_data['Significance']
-        if raw_name_data['UniqueName']:
-            new_place_name['uniqueNameTIPNR'] = raw_name_data['UniqueName']
-        del raw_name_data['UniqueName']
-
-        if raw_name_data['Strongs']:
-            if raw_name_data['Strongs'].endswith('+'):
-                raw_name_data['Strongs'] = raw_name_data['Strongs'][:-1] # Fix apparent errors
-            if '+' in raw_name_data['Strongs']: # it's a multi-word name like Achor_Valley
-                try:
-                    word1Info, word2Info = raw_name_data['Strongs'].split('+')
-                    dStrongs1, rest1 = word1Info.split('«')
-                    eStrongs1, sourceWord1 = rest1.split('=')
-                    dStrongs2, rest2 = word2Info.split('«')
-                    eStrongs2, sourceWord2 = rest2.split('=')
-                    new_place_name['dStrongs'] = [dStrongs1, dStrongs2]
-                    new_place_name['eStrongs'] = [eStrongs1, eStrongs2]
-                    new_place_name['sourceWord'] = [sourceWord1, sourceWord2]
-                except ValueError:
-                    word1Info, word2Info, word3Info = raw_name_data['Strongs'].split('+')
-                    if '«' in word1Info:
-                        dStrongs1, rest1 = word1Info.split('«')
-                        eStrongs1, sourceWord1 = rest1.split('=')
-                    else:
-                        eStrongs1, sourceWord1 = word1Info.split('=')
-                        dStrongs1 = eStrongs1
-                    dStrongs2, rest2 = word2Info.split('«')
-                    eStrongs2, sourceWord2 = rest2.split('=')
-                    dStrongs3, rest3 = word3Info.split('«')
-                    eStrongs3, sourceWord3 = rest3.split('=')
-                    new_place_name['dStrongs'] = [dStrongs1, dStrongs2, dStrongs3]
-                    new_place_name['eStrongs'] = [eStrongs1, eStrongs2, eStrongs3]
-                    new_place_name['sourceWord'] = [sourceWord1, sourceWord2, sourceWord3]
-            elif '«' in raw_name_data['Strongs']: # normal case -- a single word with three parts
-                new_place_name['dStrongs'], rest = raw_name_data['Strongs'].split('«')
-                new_place_name['eStrongs'], new_place_name['sourceWord'] = rest.split('=')
-            else: # normal case -- a single word with three parts
-                bits = raw_name_data['Strongs'].split('=')
-                if bits[0]: new_place_name['dStrongs'] = bits[0] # or is it eStrongs? or both???
-                if bits[1]: new_place_name['sourceWord'] = bits[1] # What does '.' mean???
-        del raw_name_data['Strongs']
-
-        translations = {}
-        if raw_name_data['Translations'] and raw_name_data['Translations'] != '[ ]':
-            if raw_name_data['Translations'] == 'Put (KJV=Phut': # Fix missing closing parenthesis
-                raw_name_data['Translations'] = 'Put (KJV=Phut)'
-            if raw_name_data['Translations'] == 'Achshaph NIV= Akshaph)':
-                translations['ESV'] = translations['KJB'] = 'Achshaph'
-                translations['NIV'] = 'Akshaph'
-            elif raw_name_data['Translations'] == 'city (=Ketiv. Qere, KJV, NIV= Ai)':
-                translations['ESV'] = translations['Ketiv'] = '"city"'
-                translations['Qere'] = translations['KJB'] = translations['NIV'] = 'Ai'
-            elif raw_name_data['Translations'] == 'Bajith (ESV, NIV= temple)':
-                translations['KJB'] = 'Bajith'
-                translations['ESV'] = translations['NIV'] = '"temple"'
-            elif raw_name_data['Translations'] == 'Beth-merchak (ESV= the last house; KJV= a place that was far off; NIV= the edge of the city)':
-                translations['ESV'] = '"the last house"'
-                translations['NIV'] = '"the edge of the city"'
-                translations['KJB'] = '"a place that was far off"'
-            elif raw_name_data['Translations'] == 'Chephar/-ammoni (=Ketiv. Qere= Chephar-ammonah; KJV= Chephar-haammonai; NIV= Kephar Ammoni)':
-                translations['ESV'] = 'Chephar-ammoni'
-                translations['Qere'] = 'Chephar-ammonah'
-                translations['NIV'] = 'Kephar Ammoni'
-                translations['KJB'] = 'Chephar-haammonai'
-            elif ' (Var, KJV= ' in raw_name_data['Translations'] and 'NIV' not in raw_name_data['Translations'] and 'ESV' not in raw_name_data['Translations']:
-                assert raw_name_data['Translations'].endswith(')')
-                esv, kjv = raw_name_data['Translations'].split(' (Var, KJV= ')
-                translations['ESV'] = translations['NIV'] = esv
-                translations['variant'] = translations['KJB'] = kjv
-            elif ' (=Qere, KJV= ' in raw_name_data['Translations'] and 'NIV' not in raw_name_data['Translations'] and 'ESV' not in raw_name_data['Translations']:
-                assert raw_name_data['Translations'].endswith(')')
-                qere, translations['KJB'] = raw_name_data['Translations'][:-1].split(' (=Qere, KJV= ')
-                translations['ESV'] = translations['NIV'] = translations['Qere'] = qere
-            elif raw_name_data['Translations'].endswith(' (ESV, NIV= [ ])'):
-                translations['KJB'] = raw_name_data['Translations'][:-16]
-                translations['ESV'] = translations['NIV'] = ''
-            elif raw_name_data['Translations'] == 'Geruth/ Chimham (=Qere. Ketiv= Geruth like.them; KJV= habitation of Chimham; NIV= Geruth Kimham)':
-                translations['ESV'] = 'Geruth Chimham'
-                translations['Ketiv'] = 'Geruth like them'
-                translations['NIV'] = 'Geruth Kimham'
-                translations['KJB'] = 'habitation of Chimham'
-            elif raw_name_data['Translations'] == 'Great( Sea) (=Qere. Ketiv= border; KJV= the great sea; NIV= Mediterranean Sea)':
-                translations['ESV'] = translations['Qere'] = 'Great (Sea)'
-                translations['Ketiv'] = '"border"'
-                translations['KJB'] = 'the great sea'
-                translations['NIV'] = 'Mediterranean Sea'
-            elif raw_name_data['Translations'] == 'Jaan (ESV= Dan they went)': # not totally sure what this means
-                translations['ESV'] = 'Dan they went'
-                translations['KJB'] = translations['NIV'] = 'Jaan'
-            elif ' (=Ketiv. Qere, KJV= ' in raw_name_data['Translations'] and 'ESV' not in raw_name_data['Translations']:
-                assert raw_name_data['Translations'].endswith(')')
-                ketiv, qere = raw_name_data['Translations'][:-1].split(' (=Ketiv. Qere, KJV= ')
-                translations['ESV'] = translations['NIV'] = translations['Ketiv'] = ketiv
-                translations['KJB'] = translations['Qere'] = qere
-            elif raw_name_data['Translations'] == 'Tamar (=Ketiv. Qere, KJV, NIV= Tadmor)':
-                translations['ESV'] = translations['Ketiv'] = 'Tamar'
-                translations['KJB'] = translations['NIV'] = translations['Ketiv'] = 'Tadmor'
-            elif raw_name_data['Translations'] == 'Zaanannim (=Qere. Ketiv, KJV= Zaanaim)':
-                translations['ESV'] = translations['NIV'] = 'Zaanannim'
-                translations['KJB'] = translations['Ketiv'] = 'Zaanaim'
-            elif raw_name_data['Translations'] == 'Zaphon (KJV, ESV= north)':
-                translations['KJB'] = translations['ESV'] = '"north"'
-                translations['NIV'] = 'Zaphon'
-            elif 'ESV' not in raw_name_data['Translations'] and 'NIV' not in raw_name_data['Translations'] and 'KJV' not in raw_name_data['Translations']:
-                if 'Ketiv' not in raw_name_data['Translations']: # The following two asserts fail on 'Abana (=Ketiv)'
-                    # assert '(' not in raw_name_data['Translations'] and ')' not in raw_name_data['Translations'] # Fails on '(Mount )Baalah'
-                    # assert ' ' not in raw_name_data['Translations'] # Fails on 'Valley of Achor'
-                    raw_name_data['Translations'] = raw_name_data['Translations'].replace('(Mount )Baalah','(Mount) Baalah')
-                translations['ESV'] = translations['NIV'] = translations['KJB'] = raw_name_data['Translations']
-            elif 'ESV' not in raw_name_data['Translations']:
-                assert '(' in raw_name_data['Translations'] and ')' in raw_name_data['Translations']
-                if 'KJV' not in raw_name_data['Translations']: # must be NIV
-                    try: translations['ESV'], rest = raw_name_data['Translations'].split(' (NIV= ')
-                    except ValueError: # missing space ???
-                        translations['ESV'], rest = raw_name_data['Translations'].split(' (NIV=')
-                    translations['KJB'] = translations['ESV']
-                    assert rest.endswith(')')
-                    translations['NIV'] = rest[:-1]
-                elif 'NIV' not in raw_name_data['Translations']: # must be KJV
-                    try: translations['ESV'], rest = raw_name_data['Translations'].split(' (KJV= ')
-                    except ValueError: # missing space ???
-                        try: translations['ESV'], rest = raw_name_data['Translations'].split('(KJV= ')
-                        except ValueError: # missing space ???
-                            translations['ESV'], rest = raw_name_data['Translations'].split('(KJV=')
-                    translations['NIV'] = translations['ESV']
-                    assert rest.endswith(')')
-                    translations['KJB'] = rest[:-1]
-                else: # must be both
-                    if '(KJV, NIV=' in raw_name_data['Translations']:
-                        assert raw_name_data['Translations'].endswith(')')
-                        try: translations['ESV'], rest = raw_name_data['Translations'][:-1].split(' (KJV, NIV= ')
-                        except ValueError: # missing space ???
-                            translations['ESV'], rest = raw_name_data['Translations'][:-1].split(' (KJV, NIV=')
-                        translations['KJB'] = translations['NIV'] = rest[:-1]
-                    else:
-                        assert raw_name_data['Translations'].endswith(')')
-                        try: translations['ESV'], rest = raw_name_data['Translations'][:-1].split(' (KJV= ')
-                        except ValueError: # missing space ???
-                            translations['ESV'], rest = raw_name_data['Translations'][:-1].split(' (KJV=')
-                        try: translations['KJB'], translations['NIV'] = rest.split('; NIV= ')
-                        except ValueError: # missing space ???
-                            try: translations['KJB'], translations['NIV'] = rest.split('; NIV=')
-                            except ValueError: translations['KJB'], translations['NIV'] = rest.split(', NIV=')
-            # else: # must have 'ESV' -- why???
-            #     if raw_name_data['Translations'] == 'Ammi/-nadib (ESV= my kinsman, a prince; NIV= royal of my people)':
-            #         translations['ESV'] = 'Ammi-nadib (my kinsman, a prince)'
-            #         translations['NIV'] = 'Ammi-nadib (royal of my people)'
-            #         translations['KJB'] = 'Ammi-nadib'
-            #     elif raw_name_data['Translations'] == 'Rapha (KJV, ESV= "giant")':
-            #         translations['ESV'] = translations['KJB'] = '"giant"'
-            #         translations['NIV'] = 'Rapha'
-            #     elif raw_name_data['Translations'] == 'Misgab (ESV= fortress; NIV= stronghold)':
-            #         translations['ESV'] = '"fortress"'
-            #         translations['NIV'] = '"stronghold"'
-            #         translations['KJB'] = 'Misgab'
-            else: not_done_yet
-        if translations: new_place_name['translations'] = translations
-        del raw_name_data['Translations']
-
-        if raw_name_data['STEPBibleFirstLink']:
-            new_place_name['STEPBibleFirstLink'] = raw_name_data['STEPBibleFirstLink']
-        del raw_name_data['STEPBibleFirstLink']
-        if raw_name_data['AllRefs']:
-            new_place_name['individualVerseReferences'] = split_refs(raw_name_data['AllRefs'])
-        del raw_name_data['AllRefs']
-        assert not raw_name_data, f"Why do we have place left-over {raw_name_data=}?"
+        new_place_name = process_TIPNR_name( name_record, record.record_type )
         if new_place_name:
             new_place['names'].append(new_place_name)
-    del raw_data['Names']
-
-    if 'Comment' in raw_data:
-        assert raw_data['Comment']
-        new_place['comment'] = raw_data['Comment']
-        del raw_data['Comment']
-    if 'Notes' in raw_data:
-        assert raw_data['Notes']
-        new_place['notes'] = raw_data['Notes']
-        del raw_data['Notes']
-
-    assert not raw_data, f"Why do we have place left-over {raw_data=}?"
-
-    assert FGid not in places
-    places[FGid] = new_place # We use FGid as the key to create the original dicts
-    # dPrint('Quiet', DEBUGGING_THIS_MODULE, f"\n{len(places)} {new_place=}")
-    return True
 
-def process_and_add_other( raw_data: dict) -> bool:
+    if record.comment:
+        new_place['comment'] = record.comment
+
+    # dPrint('Quiet', DEBUGGING_THIS_MODULE, f"\n{FGid} {new_place=}")
+    return FGid, new_place
+# end of loadTIPNR.process_TIPNR_place()
+
+def process_TIPNR_other( record:TIPNROther, allocator:FGidAllocator ) -> Tuple[str,dict]:
     """
+    Converts an other record into our other dict
+        and returns the FGid (from the allocator) along with it.
     """
-    # fnPrint(DEBUGGING_THIS_MODULE, f"\nprocess_and_add_other( {raw_data} )")
+    # fnPrint(DEBUGGING_THIS_MODULE, f"\nprocess_TIPNR_other( {record} )")
     new_other = {}
 
-    # UnifiedName is something like 'Aaron@Exo.4.14=H0175'
-    # UniqueName can be something like 'wielded|Adino@2Sa.23.8'
-    if '=' in raw_data['UnifiedName']:
-        unifiedName, uStrongs = raw_data['UnifiedName'].split('=')
-    else: unifiedName = raw_data['UnifiedName'] # e.g., 'Herodian@Mat.22.16'
-    del raw_data['UnifiedName']
+    unifiedName, hasStrongs, uStrongs = record.unifiedName.partition('=')
     name = unifiedName.split('@')[0]
-    if name not in others:
-        FGid = name
-    else:
-        for suffix in range(2,9): # see
-            if f'{name}{suffix}' not in others:
-                FGid = f'{name}{suffix}'
-                break
-        else: unable_to_create_unique_other_id
+    FGid = allocator.allocate( name )
     new_other['FGid'] = FGid
     new_other['name'] = name
     new_other['unifiedNameTIPNR'] = unifiedName
-    # if unifiedName != uniqueName:
-    #     dPrint('Normal', DEBUGGING_THIS_MODULE, f"  Other '{FGid}' {unifiedName=} vs {uniqueName=}")
-    #     new_other['uniqueNameTIPNR'] = uniqueName
-    try:
+    if hasStrongs: # not always, e.g., 'Herodian@Mat.22.16'
         new_other['uStrongs'] = uStrongs
-    except UnboundLocalError: pass # no uStrongs, i.e., no '=' in first field
 
-    if raw_data['Description']:
-        new_other['description'] = raw_data['Description']
-    del raw_data['Description']
+    if record.description:
+        new_other['description'] = record.description
 
-    for raw_name_data in raw_data['Names']:
-        # dPrint('Normal', DEBUGGING_THIS_MODULE, f"  Person {raw_name_data=}")
+    for name_record in record.names:
         if 'names' not in new_other:
             new_other['names'] = []
-        new_other_name = {}
-
-        if raw_name_data['Significance']:
-            new_other_name['significance'] = raw_name_data['Significance']
-        del raw_name_data['Significance']
-        if raw_name_data['UniqueName']:
-            new_other_name['uniqueNameTIPNR'] = raw_name_data['UniqueName']
-        del raw_name_data['UniqueName']
-
-        if raw_name_data['Strongs']:
-            if raw_name_data['Strongs'] == 'G1673«G1673=Ἑλληνικός=Ἑλληνικός': # 'Greek'
-                new_other_name['dStrongs'] = new_other_name['eStrongs'] = 'G1673'
-                new_other_name['sourceWord'] = 'Ἑλληνικός'
-            elif '+' in raw_name_data['Strongs']: # it's a multi-word name like El-berith
-                word1Info, word2Info = raw_name_data['Strongs'].split('+')
-                dStrongs1, rest1 = word1Info.split('«')
-                eStrongs1, sourceWord1 = rest1.split('=', 1) # Might be two equals / two words
-                dStrongs2, rest2 = word2Info.split('«')
-                eStrongs2, sourceWord2 = rest2.split('=')
-                new_other_name['dStrongs'] = [dStrongs1, dStrongs2]
-                new_other_name['eStrongs'] = [eStrongs1, eStrongs2]
-                new_other_name['sourceWord'] = [sourceWord1, sourceWord2]
-            elif '«' in raw_name_data['Strongs']: # normal case -- a single word with three parts
-                new_other_name['dStrongs'], rest = raw_name_data['Strongs'].split('«')
-                new_other_name['eStrongs'], new_other_name['sourceWord'] = rest.split('=', 1) # Might be two equals / two words
-            else: # special case -- a single word with two parts
-                halt
-                bits = raw_name_data['Strongs'].split('=')
-                if bits[0]: new_other_name['dStrongs'] = bits[0] # or is it eStrongs? or both???
-                if bits[1]: new_other_name['sourceWord'] = bits[1] # What does '.' mean???
-        del raw_name_data['Strongs']
-
-        translations = {}
-        if raw_name_data['Translations'] and raw_name_data['Translations'] != '[ ]':
-            if 'ESV' not in raw_name_data['Translations'] and 'NIV' not in raw_name_data['Translations'] and 'KJV' not in raw_name_data['Translations']:
-                if 'Ketiv' not in raw_name_data['Translations']: # The following two asserts fail on 'Abana (=Ketiv)'
-                    # assert '(' not in raw_name_data['Translations'] and ')' not in raw_name_data['Translations'] # Fails on '(Mount )Baalah'
-                    # assert ' ' not in raw_name_data['Translations'] # Fails on 'Valley of Achor'
-                    raw_name_data['Translations'] = raw_name_data['Translations'].replace('(Mount )Baalah','(Mount) Baalah')
-                translations['ESV'] = translations['NIV'] = translations['KJB'] = raw_name_data['Translations']
-            elif 'ESV' not in raw_name_data['Translations']:
-                assert '(' in raw_name_data['Translations'] and ')' in raw_name_data['Translations']
-                if 'KJV' not in raw_name_data['Translations']: # must be NIV
-                    try: translations['ESV'], rest = raw_name_data['Translations'].split(' (NIV= ')
-                    except ValueError: # missing space ???
-                        translations['ESV'], rest = raw_name_data['Translations'].split(' (NIV=')
-                    translations['KJB'] = translations['ESV']
-                    assert rest.endswith(')')
-                    translations['NIV'] = rest[:-1]
-                elif 'NIV' not in raw_name_data['Translations']: # must be KJV
-                    try: translations['ESV'], rest = raw_name_data['Translations'].split(' (KJV= ')
-                    except ValueError: # missing space ???
-                        try: translations['ESV'], rest = raw_name_data['Translations'].split('(KJV= ')
-                        except ValueError: # missing space ???
-                            translations['ESV'], rest = raw_name_data['Translations'].split('(KJV=')
-                    translations['NIV'] = translations['ESV']
-                    assert rest.endswith(')')
-                    translations['KJB'] = rest[:-1]
-                else: # must be both
-                    if '(KJV, NIV=' in raw_name_data['Translations']:
-                        translations['ESV'], rest = raw_name_data['Translations'].split(' (KJV, NIV= ')
-                        assert rest.endswith(')')
-                        translations['KJB'] = translations['NIV'] = rest[:-1]
-                    else:
-                        try: translations['ESV'], rest = raw_name_data['Translations'].split(' (KJV= ')
-                        except ValueError: # missing space ???
-                            translations['ESV'], rest = raw_name_data['Translations'].split(' (KJV=')
-                        assert rest.endswith(')')
-                        try: translations['KJB'], translations['NIV'] = rest[:-1].split('; NIV= ')
-                        except ValueError: # missing space ???
-                            try: translations['KJB'], translations['NIV'] = rest[:-1].split('; NIV=')
-                            except ValueError: translations['KJB'], translations['NIV'] = rest[:-1].split(', NIV=')
-            else: # must have 'ESV' -- why???
-
-                if raw_name_data['Translations'] == 'Gentiles (ESV, NIV= nations)':
-                    translations['ESV'] = translations['NIV'] = '"nations"'
-                    translations['KJB'] = 'Gentiles'
-                elif raw_name_data['Translations'] == 'Gentiles (ESV, NIV= pagans)':
-                    translations['ESV'] = translations['NIV'] = '"pagans"'
-                    translations['KJB'] = 'Gentiles'
-                elif raw_name_data['Translations'] == 'Gentiles (ESV, NIV= people)':
-                    translations['ESV'] = translations['NIV'] = '"people"'
-                    translations['KJB'] = 'Gentiles'
-                elif raw_name_data['Translations'] == 'Gentiles (ESV, NIV= peoples)':
-                    translations['ESV'] = translations['NIV'] = '"peoples"'
-                    translations['KJB'] = 'Gentiles'
-                elif raw_name_data['Translations'] == 'Gentiles (ESV= peoples; KJV= heathen)':
-                    translations['NIV'] = 'Gentiles'
-                    translations['ESV'] = '"peoples"'
-                    translations['KJB'] = '"heathen"'
-                elif raw_name_data['Translations'] == 'Gentiles (ESV= nations)':
-                    translations['NIV'] = translations['KJB'] = 'Gentiles'
-                    translations['ESV'] = '"nations"'
-                elif raw_name_data['Translations'] == 'Peor (ESV, NIV= Baal of Peor)':
-                    translations['ESV'] = translations['NIV'] = 'Baal of Peor'
-                    translations['KJB'] = 'Peor'
-                elif raw_name_data['Translations'].endswith(' (ESV, NIV= [ ])'):
-                    translations['KJB'] = raw_name_data['Translations'][:-16]
-                    translations['ESV'] = translations['NIV'] = ''
-                else: not_done_yet
-        if translations: new_other_name['translations'] = translations
-        del raw_name_data['Translations']
-
-        if raw_name_data['STEPBibleFirstLink']:
-            new_other_name['STEPBibleFirstLink'] = raw_name_data['STEPBibleFirstLink']
-        del raw_name_data['STEPBibleFirstLink']
-        if raw_name_data['AllRefs']:
-            new_other_name['individualVerseReferences'] = split_refs(raw_name_data['AllRefs'])
-        del raw_name_data['AllRefs']
-        assert not raw_name_data, f"Why do we have other left-over {raw_name_data=}?"
+        new_other_name = process_TIPNR_name( name_record, record.record_type )
         if new_other_name:
             new_other['names'].append(new_other_name)
-    del raw_data['Names']
 
-    if 'Notes' in raw_data:
-        assert raw_data['Notes']
-        new_other['notes'] = raw_data['Notes']
-        del raw_data['Notes']
+    # dPrint('Quiet', DEBUGGING_THIS_MODULE, f"\n{FGid} {new_other=}")
+    return FGid, new_other
+# end of loadTIPNR.process_TIPNR_other()
+
+def process_TIPNR_name( name_record:TIPNRName, record_type:str ) -> dict:
+    """
+    Converts one of the name sub-rows of a person, place, or other record into our name dict.
+    """
+    new_name = {}
 
-    assert not raw_data, f"Why do we have other left-over {raw_data=}?"
+    if name_record.significance:
+        new_name['significance'] = name_record.significance
+    if name_record.uniqueName:
+        new_name['uniqueNameTIPNR'] = name_record.uniqueName
 
-    assert FGid not in others
-    others[FGid] = new_other # We use FGid as the key to create the original dicts
-    # dPrint('Quiet', DEBUGGING_THIS_MODULE, f"\n{len(others)} {new_other=}")
-    return True
+    if name_record.strongs:
+        dStrongs, eStrongs, sourceWord = decode_TIPNR_strongs( name_record.strongs )
+        if dStrongs: new_name['dStrongs'] = dStrongs
+        if eStrongs: new_name['eStrongs'] = eStrongs
+        if sourceWord: new_name['sourceWord'] = sourceWord
+
+    translations = parse_TIPNR_translations( name_record.translations, record_type )
+    if translations: new_name['translations'] = translations
+
+    if name_record.STEPBibleFirstLink:
+        new_name['STEPBibleFirstLink'] = name_record.STEPBibleFirstLink
+    if name_record.allRefs:
+        new_name['individualVerseReferences'] = split_refs(name_record.allRefs)
+    return new_name
+# end of loadTIPNR.process_TIPNR_name()
 
 
 def split_refs(ref_string:str) -> List[str]:
@@ -947,6 +616,217 @@ def split_refs(ref_string:str) -> List[str]:
     return ref_string.split(';')
 
 
+def decode_TIPNR_strongs(strongs_string:str) -> Tuple[Union[str,List[str],None],Union[str,List[str],None],Union[str,List[str],None]]:
+    """
+    Decode a TIPNR Strongs field like 'H5911«H5911=עָכוֹר+H6010G«H6010=עֵ֫מֶק'
+        into a (dStrongs, eStrongs, sourceWord) tuple.
+
+    Each '+'-joined word is either 'dStrongs«eStrongs=sourceWord' or just 'dStrongs=sourceWord'.
+    For a single word, the tuple contains strings (or None for missing parts),
+        but for a multi-word name (like Achor_Valley) it contains lists with one entry per word
+        (using the dStrongs for any missing eStrongs so that the lists stay aligned).
+
+    The source words are passed through unchanged (including any leading space,
+        and any second '=' word like 'Ἕλλην=Ἕλλην'), as they always have been.
+    """
+    if strongs_string == 'G1673«G1673=Ἑλληνικός=Ἑλληνικός': # 'Greek' -- the only special case
+        return 'G1673', 'G1673', 'Ἑλληνικός'
+    wordInfos = strongs_string.rstrip('+').split('+') # Some fields have an apparently erroneous final plus sign
+    dStrongsList, eStrongsList, sourceWordList = [], [], []
+    for wordInfo in wordInfos:
+        codes, _, sourceWord = wordInfo.partition('=') # Might be two equals / two words
+        dStrongs, _, eStrongs = codes.partition('«')
+        if len(wordInfos) == 1: # normal case -- a single word
+            return dStrongs or None, eStrongs or None, sourceWord or None
+        dStrongsList.append( dStrongs )
+        eStrongsList.append( eStrongs or dStrongs )
+        sourceWordList.append( sourceWord )
+    return dStrongsList, eStrongsList, sourceWordList
+# end of loadTIPNR.decode_TIPNR_strongs()
+
+
+# Special-cased TIPNR Translations field strings (mostly editorial decisions about quoting, etc.)
+TRANSLATIONS_LITERALS:Dict[str,Dict[str,str]] = {
+    # Person names
+    'Joda (Var, KJV= Juda)': {'ESV':'Joda (variant)', 'NIV':'Joda (variant)', 'Variant':'Joda', 'KJB':'Juda'},
+    'Moses (=LXX; KJV= Manasseh)': {'ESV':'Moses', 'NIV':'Moses', 'LXX':'Moses', 'KJB':'Manasseh'},
+    'Birzaith (=Qere. Ketiv= Birzoth; KJV= Birzavith)': {'ESV':'Birzaith', 'Ketiv':'Birzoth', 'KJB':'Birzavith'},
+    'Ammi/-nadib (ESV= my kinsman, a prince; NIV= royal of my people)': {'ESV':'Ammi-nadib (my kinsman, a prince)', 'NIV':'Ammi-nadib (royal of my people)', 'KJB':'Ammi-nadib'},
+    'Rapha (KJV, ESV= "giant")': {'ESV':'"giant"', 'KJB':'"giant"', 'NIV':'Rapha'},
+    'Raphaite (KJV, ESV= "giant")': {'ESV':'"giant"', 'KJB':'"giant"', 'NIV':'Raphaite'},
+    'Misgab (ESV= fortress; NIV= stronghold)': {'ESV':'"fortress"', 'NIV':'"stronghold"', 'KJB':'Misgab'},
+    # Place names
+    'Achshaph NIV= Akshaph)': {'ESV':'Achshaph', 'KJB':'Achshaph', 'NIV':'Akshaph'},
+    'city (=Ketiv. Qere, KJV, NIV= Ai)': {'ESV':'"city"', 'Ketiv':'"city"', 'Qere':'Ai', 'KJB':'Ai', 'NIV':'Ai'},
+    'Bajith (ESV, NIV= temple)': {'KJB':'Bajith', 'ESV':'"temple"', 'NIV':'"temple"'},
+    'Beth-merchak (ESV= the last house; KJV= a place that was far off; NIV= the edge of the city)': {'ESV':'"the last house"', 'NIV':'"the edge of the city"', 'KJB':'"a place that was far off"'},
+    'Chephar/-ammoni (=Ketiv. Qere= Chephar-ammonah; KJV= Chephar-haammonai; NIV= Kephar Ammoni)': {'ESV':'Chephar-ammoni', 'Qere':'Chephar-ammonah', 'NIV':'Kephar Ammoni', 'KJB':'Chephar-haammonai'},
+    'Geruth/ Chimham (=Qere. Ketiv= Geruth like.them; KJV= habitation of Chimham; NIV= Geruth Kimham)': {'ESV':'Geruth Chimham', 'Ketiv':'Geruth like them', 'NIV':'Geruth Kimham', 'KJB':'habitation of Chimham'},
+    'Great( Sea) (=Qere. Ketiv= border; KJV= the great sea; NIV= Mediterranean Sea)': {'ESV':'Great (Sea)', 'Qere':'Great (Sea)', 'Ketiv':'"border"', 'KJB':'the great sea', 'NIV':'Mediterranean Sea'},
+    'Jaan (ESV= Dan they went)': {'ESV':'Dan they went', 'KJB':'Jaan', 'NIV':'Jaan'}, # not totally sure what this means
+    'Tamar (=Ketiv. Qere, KJV, NIV= Tadmor)': {'ESV':'Tamar', 'Ketiv':'Tadmor', 'KJB':'Tadmor', 'NIV':'Tadmor'}, # Legacy quirk (as in LEGACY_QUIRKS below): this has always given the Qere as the Ketiv (and no Qere)
+    'Zaanannim (=Qere. Ketiv, KJV= Zaanaim)': {'ESV':'Zaanannim', 'NIV':'Zaanannim', 'KJB':'Zaanaim', 'Ketiv':'Zaanaim'},
+    'Zaphon (KJV, ESV= north)': {'KJB':'"north"', 'ESV':'"north"', 'NIV':'Zaphon'},
+    # Other names
+    'Gentiles (ESV, NIV= nations)': {'ESV':'"nations"', 'NIV':'"nations"', 'KJB':'Gentiles'},
+    'Gentiles (ESV, NIV= pagans)': {'ESV':'"pagans"', 'NIV':'"pagans"', 'KJB':'Gentiles'},
+    'Gentiles (ESV, NIV= people)': {'ESV':'"people"', 'NIV':'"people"', 'KJB':'Gentiles'},
+    'Gentiles (ESV, NIV= peoples)': {'ESV':'"peoples"', 'NIV':'"peoples"', 'KJB':'Gentiles'},
+    'Gentiles (ESV= peoples; KJV= heathen)': {'NIV':'Gentiles', 'ESV':'"peoples"', 'KJB':'"heathen"'},
+    'Gentiles (ESV= nations)': {'NIV':'Gentiles', 'KJB':'Gentiles', 'ESV':'"nations"'},
+    'Peor (ESV, NIV= Baal of Peor)': {'ESV':'Baal of Peor', 'NIV':'Baal of Peor', 'KJB':'Peor'},
+    }
+# Fixes for apparent typos in the TIPNR Translations field
+TRANSLATIONS_CORRECTIONS:Dict[str,str] = {
+    'Put (KJV=Phut': 'Put (KJV=Phut)', # missing closing parenthesis
+    '(Mount )Baalah': '(Mount) Baalah',
+    }
+# Known mistakes in the original if/elif chains which we still reproduce (for now)
+#   so that the entry keys, and hence the best known names and FGids, don't change.
+#   Setting one to False gives the corrected output instead.
+LEGACY_QUIRKS:Dict[str,bool] = {
+    # Person names with a Ketiv reading (other than in TRANSLATIONS_LITERALS) get no translations at all,
+    #   e.g., 'Abishai (=Qere. Ketiv= Abshai)' gives {}
+    #   (but before turning this off, we need forms for notes like '(=Qere. Ketiv= Jeuel; KJV= Jehiel)')
+    'person_Ketiv_gives_no_translations': True,
+    # 'Judas (KJV=Juda)' (with no space after the '=') gives ESV and NIV 'Judas ' (with a trailing space)
+    'KJV_name_keeps_space': True,
+    # 'Abijam (NIV= Abijah; KJV= Abia)' gives a 'KJV' key (rather than 'KJB')
+    'NIV_KJV_gives_KJV_key': True,
+    # Places like 'Harod (KJV, NIV=Harodite)' lose the last letter of the KJB and NIV names, i.e., 'Harodit'
+    'place_KJV_NIV_loses_last_letter': True,
+    # 'Colossae (Var, KJV= Colosse)' gives variant and KJB 'Colosse)' (with the closing parenthesis)
+    'Var_KJV_keeps_parenthesis': True,
+    # The '(Var, KJV= …)' and '(Var, KJV, NIV= …)' forms give a 'variant' key (rather than 'Variant')
+    'Var_gives_lowercase_variant_key': True,
+    }
+
+
+def make_KJV_translations(name:str, notes_match:re.Match, record_type:str) -> Dict[str,str]:
+    """
+    Make the translations dict for a Translations field like 'Iezer (KJV= Jeezer)'.
+    """
+    if notes_match[1] and not notes_match[2] and LEGACY_QUIRKS['KJV_name_keeps_space']:
+        name = f'{name} '
+    return {'ESV':name, 'NIV':name, 'KJB':notes_match[3]}
+
+def make_NIV_KJV_translations(name:str, notes_match:re.Match, record_type:str) -> Dict[str,str]:
+    """
+    Make the translations dict for a Translations field like 'Abijam (NIV= Abijah; KJV= Abia)'.
+    """
+    return {'ESV':name, 'NIV':notes_match[1], 'KJV' if LEGACY_QUIRKS['NIV_KJV_gives_KJV_key'] else 'KJB':notes_match[2]}
+
+def make_KJV_NIV_translations(name:str, notes_match:re.Match, record_type:str) -> Dict[str,str]:
+    """
+    Make the translations dict for a Translations field like 'Adami/-nekeb (KJV, NIV= Adami Nekeb)'.
+    """
+    KJV_NIV_name = notes_match[1]
+    if record_type == 'place' and LEGACY_QUIRKS['place_KJV_NIV_loses_last_letter']:
+        KJV_NIV_name = KJV_NIV_name[:-1]
+    return {'ESV':name, 'KJB':KJV_NIV_name, 'NIV':KJV_NIV_name}
+
+def make_Var_KJV_NIV_translations(name:str, notes_match:re.Match, record_type:str) -> Dict[str,str]:
+    """
+    Make the translations dict for a Translations field like 'Name (Var, KJV, NIV= Other name)'.
+    """
+    return {'ESV':name, 'variant' if LEGACY_QUIRKS['Var_gives_lowercase_variant_key'] else 'Variant':notes_match[1],
+            'KJB':notes_match[1], 'NIV':notes_match[1]}
+
+def make_Var_KJV_translations(name:str, notes_match:re.Match, record_type:str) -> Dict[str,str]:
+    """
+    Make the translations dict for a Translations field like 'Colossae (Var, KJV= Colosse)'.
+    """
+    variant_name = f'{notes_match[1]})' if LEGACY_QUIRKS['Var_KJV_keeps_parenthesis'] else notes_match[1]
+    return {'ESV':name, 'NIV':name, 'variant' if LEGACY_QUIRKS['Var_gives_lowercase_variant_key'] else 'Variant':variant_name,
+            'KJB':variant_name}
+
+# The annotated forms of the TIPNR Translations field, i.e., 'name (notes)',
+#   keyed by the marker just after the opening parenthesis of the notes.
+#   Each marker has the forms which start with it (tried in order),
+#   with a substring that the field must also contain (which is much quicker to check than the regex),
+#   a regex for the notes (from any space before the parenthesis to the end of the field),
+#   and a function to make the translations dict from the name, the notes match, and the record type.
+#   (The dict orders are as the original if/elif chains gave them.)
+TRANSLATIONS_FORMS:Dict[str,List[Tuple[str,re.Pattern,Callable]]] = {
+    'KJV=': [
+        ( 'NIV=', re.compile( r'(?: \(KJV= ?|\(KJV=)(.*?)(?:; NIV= ?|, NIV=)(.*)\)' ),
+            lambda name,notes_match,record_type: {'ESV':name, 'KJB':notes_match[1], 'NIV':notes_match[2]} ),
+        ( '', re.compile( r'( ?)\(KJV=( ?)(.*)\)' ), make_KJV_translations ),
+        ],
+    'NIV=': [
+        ( '; KJV= ', re.compile( r' \(NIV= (.*?); KJV= (.*)\)' ), make_NIV_KJV_translations ),
+        ( '', re.compile( r' \(NIV= ?(.*)\)' ),
+            lambda name,notes_match,record_type: {'ESV':name, 'KJB':name, 'NIV':notes_match[1]} ),
+        ],
+    'KJV, NIV=': [ ( '', re.compile( r' \(KJV, NIV= ?(.*)\)' ), make_KJV_NIV_translations ) ],
+    '=Var, KJV)': [
+        ( '', re.compile( r' \(=Var, KJV\)' ),
+            lambda name,notes_match,record_type: {'ESV':f'{name} (variant)', 'NIV':f'{name} (variant)', 'KJB':name} ),
+        ],
+    '=Qere, KJV= ': [
+        ( '', re.compile( r' \(=Qere, KJV= (.+)\)' ),
+            lambda name,notes_match,record_type: {'KJB':notes_match[1], 'ESV':name, 'NIV':name, 'Qere':name} ),
+        ],
+    'Var, KJV, NIV= ': [ ( '', re.compile( r' \(Var, KJV, NIV= (.+)\)' ), make_Var_KJV_NIV_translations ) ],
+    'Var, KJV= ': [ ( '', re.compile( r' \(Var, KJV= (.+)\)' ), make_Var_KJV_translations ) ],
+    'ESV, NIV= [ ])': [
+        ( '', re.compile( r' \(ESV, NIV= \[ \]\)' ),
+            lambda name,notes_match,record_type: {'KJB':name, 'ESV':'', 'NIV':''} ),
+        ],
+    '=Ketiv. Qere, KJV= ': [
+        ( '', re.compile( r' \(=Ketiv\. Qere, KJV= (.+)\)' ),
+            lambda name,notes_match,record_type: {'ESV':name, 'NIV':name, 'Ketiv':name, 'KJB':notes_match[1], 'Qere':notes_match[1]} ),
+        ],
+    }
+# Finds the opening parenthesis of the notes (and the marker after it) in one search
+TRANSLATIONS_NOTES_RE = re.compile( r'\((' + '|'.join( re.escape(marker) for marker in TRANSLATIONS_FORMS ) + ')' )
+
+
+def parse_TIPNR_translations(translations_string:str, record_type:str) -> Dict[str,str]:
+    """
+    Convert a TIPNR Translations field like 'Erech (KJV= Archevite; NIV= Uruk)'
+        into a dict like {'ESV':'Erech', 'KJB':'Archevite', 'NIV':'Uruk'}.
+
+    The name before the parenthesised notes is the ESV (and default NIV and KJB) form,
+        and the notes give any differing NIV/KJV forms and any Qere/Ketiv/Variant readings.
+
+    record_type is 'person', 'place', or 'other'.
+    This gives exactly what the three original if/elif chains gave
+        (so that the entry keys and hence the best known names and FGids don't change),
+        including their known mistakes (see LEGACY_QUIRKS above).
+    A field without any ESV/NIV/KJV notes, e.g., 'Golan (=Qere. Ketiv= Galon)', is used as it is.
+
+    Returns an empty dict for an empty (or '[ ]') field.
+    Raises a ValueError if the field can't be parsed.
+    """
+    if not translations_string or translations_string == '[ ]':
+        return {}
+    if record_type == 'person': translations_string = translations_string.replace('JKV','KJV').replace('  ',' ') # Fix apparent error and double-space on Hanochite
+    translations_string = TRANSLATIONS_CORRECTIONS.get(translations_string, translations_string)
+    if record_type == 'person' and 'Ketiv' in translations_string and LEGACY_QUIRKS['person_Ketiv_gives_no_translations']:
+        return TRANSLATIONS_LITERALS.get(translations_string, {}).copy()
+    if '=' not in translations_string: # by far the most common case -- all translations are the same
+        return {'ESV':translations_string, 'NIV':translations_string, 'KJB':translations_string}
+    literal_translations = TRANSLATIONS_LITERALS.get(translations_string)
+    if literal_translations is not None:
+        return literal_translations.copy()
+
+    marker_match = TRANSLATIONS_NOTES_RE.search(translations_string)
+    if marker_match:
+        notes_start = marker_match.start()
+        if translations_string[notes_start-1:notes_start] == ' ': notes_start -= 1
+        name = translations_string[:notes_start]
+        for form_substring, notes_regex, make_translations in TRANSLATIONS_FORMS[marker_match[1]]:
+            if form_substring in translations_string:
+                notes_match = notes_regex.fullmatch(translations_string, notes_start)
+                if notes_match:
+                    return make_translations(name, notes_match, record_type)
+    elif 'ESV' not in translations_string and 'NIV' not in translations_string and 'KJV' not in translations_string:
+        return {'ESV':translations_string, 'NIV':translations_string, 'KJB':translations_string}
+    raise ValueError(f"Unable to parse TIPNR translations {translations_string!r}")
+# end of loadTIPNR.parse_TIPNR_translations()
+
+
 def clean_data() -> bool:
     """
     Many data entry errors and inconsistencies are already discovered/fixed in the parsing code.
@@ -1202,39 +1082,29 @@ def adjust_Bible_references(dataName:str, dataDict:dict) -> bool:
     vPrint('Normal', DEBUGGING_THIS_MODULE, f"    Adjusting all verse references for {dataName}…")
     for dict_entry in dataDict.values():
         for name_data in dict_entry['names']:
-            for j,ref_string in enumerate(name_data['individualVerseReferences']):
-                name_data['individualVerseReferences'][j] = adjust_Bible_reference(ref_string)
+            name_data['individualVerseReferences'] = convert_references( name_data['individualVerseReferences'], 'Uuu', packed=PACK_VERSE_REFERENCES_FLAG or STORE_VERSE_SETS_FLAG )
         if 'combinedIndividualVerseReferences' in dict_entry:
-            for j,ref_string in enumerate(dict_entry['combinedIndividualVerseReferences']):
-                dict_entry['combinedIndividualVerseReferences'][j] = adjust_Bible_reference(ref_string)
+            dict_entry['combinedIndividualVerseReferences'] = VerseSet( convert_references( dict_entry['combinedIndividualVerseReferences'], 'Uuu', packed=True ) ) \
+                    if STORE_VERSE_SETS_FLAG else \
+                convert_references( dict_entry['combinedIndividualVerseReferences'], 'Uuu', packed=PACK_VERSE_REFERENCES_FLAG )
 
     return True
 # end of loadTIPNR.adjust_Bible_references()
 
 
-def adjust_Bible_reference(ref:str) -> str:
-    """
-    Change a Bible reference like '1Co.1.14' to 'CO1_1:14'
+def get_references_count(dict_entry:dict) -> int:
     """
-    assert len(ref) >= 7 # Uuu.c.v
-    assert ';' not in ref
-    assert ':' not in ref
-    assert ' ' not in ref
-    assert ref.count('.') == 2
-    adjRef = ref.replace('.','_',1).replace('.',':',1)
+    Returns the count that ensure_best_known_name() compares for a person/place/other entry:
+        the number of verse references of all the names if it has combined verse references,
+        else the number of fields in its only name dict (as it's always been).
 
-    pre = post = ''
-    if adjRef[0] in '([' and adjRef[-1] in '])':
-        pre = adjRef[0]
-        post = adjRef[-1]
-        adjRef = adjRef[1:-1]
-
-    Uuu = adjRef[:3]
-    ix = list(Uuu_BOOK_ID_MAP.values()).index(Uuu) + 1
-    adjRef = f'{pre}{BOS_BOOK_ID_MAP[ix]}{adjRef[3:]}{post}'
-    # print(f"Converted '{ref}' to '{adjRef}'")
-    return adjRef
-# end of loadTIPNR.adjust_Bible_reference
+    The combined count is summed from the individual name lists (which are never de-duplicated)
+        so that it's the same whether or not STORE_VERSE_SETS_FLAG is set.
+    """
+    if 'combinedIndividualVerseReferences' in dict_entry:
+        return sum( len(name_data['individualVerseReferences']) for name_data in dict_entry['names'] )
+    return len( dict_entry['names'][0] )
+# end of loadTIPNR.get_references_count()
 
 
 def ensure_best_known_name(dataName:str, dataDict:dict) -> bool:
@@ -1255,16 +1125,12 @@ def ensure_best_known_name(dataName:str, dataDict:dict) -> bool:
         if old_id.endswith('2') and not old_id[-2].isdigit():
             # dPrint('Info', DEBUGGING_THIS_MODULE, f"      {entry}")
             base_id = old_id[:-1]
-            references_count = len( dataDict[base_id]['combinedIndividualVerseReferences']
-                                        if 'combinedIndividualVerseReferences' in dataDict[base_id]
-                                        else dataDict[base_id]['names'][0] )
+            references_count = get_references_count( dataDict[base_id] )
             references_counts = { base_id: references_count }
             max_count, num_maxes, second_highest = references_count, 1, 0
             for suffix in range(2,30):
                 suffixed_entry = f'{base_id}{suffix}'
-                try: references_count = len( dataDict[suffixed_entry]['combinedIndividualVerseReferences']
-                                                if 'combinedIndividualVerseReferences' in dataDict[suffixed_entry]
-                                                else dataDict[suffixed_entry]['names'][0] )
+                try: references_count = get_references_count( dataDict[suffixed_entry] )
                 except KeyError: break # Gone too far
                 references_counts[suffixed_entry] = references_count
                 if references_count == max_count:
@@ -1432,26 +1298,42 @@ def export_JSON(subType:str) -> bool:
     """
     assert subType
     vPrint('Quiet', DEBUGGING_THIS_MODULE, f"\nExporting {subType} JSON TIPNR files…")
+    export_file_list = []
 
     for dict_name,the_dict in (('people',people), ('places',places), ('others',others), ('all',allEntries)):
         if the_dict:
             filepath = TIPNR_OUTPUT_FOLDERPATH.joinpath(f'{subType}_{dict_name.title()}.json')
             vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Exporting {len(the_dict):,} {dict_name} to {filepath}…")
-            with open( filepath, 'wt', encoding='utf-8' ) as outputFile:
-                # WARNING: The following code would convert any int keys to str !!!
-                json.dump( HEADER_DICT | the_dict, outputFile, ensure_ascii=False, indent=2 )
-
+            # WARNING: The following code would convert any int keys to str !!!
+            export_file_list.append( (filepath, the_dict) )
+
+    write_JSON_files( export_file_list, HEADER_DICT, compact=COMPACT_JSON_FLAG, default=render_packed_references_for_JSON,
+                        compression_formats=COMPRESSION_FORMATS if COMPRESS_JSON_FLAG else () )
+    if EXPORT_JSON_LINES_FLAG and subType == 'normalised':
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Also exporting {len(export_file_list)} {subType} tables as JSON Lines…")
+        write_JSON_files( [(filepath.with_suffix('.jsonl'), the_dict) for filepath,the_dict in export_file_list], HEADER_DICT,
+                            default=render_packed_references_for_JSON, compression_formats=COMPRESSION_FORMATS if COMPRESS_JSON_FLAG else (),
+                            json_lines=True )
     return True
 # end of loadTIPNR.export_JSON()
 
 
 def export_xml(subType:str) -> bool:
     """
+    Export the dictionaries as a single XML file
+        (starting with the comment lines from the TIPNR file, which include its licence).
+
+    The entries are written one at a time (see XMLWriter.py) rather than building the whole XML document in memory.
     """
     assert subType
     vPrint('Quiet', DEBUGGING_THIS_MODULE, f"\nExporting {subType} XML TIPNR file…")
 
-    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  NOT Wrote {len(xml_lines):,} XML lines.")
+    start_time = time.time()
+    filepath = TIPNR_XML_OUTPUT_FILEPATH if subType == 'normalised' \
+                else TIPNR_OUTPUT_FOLDERPATH.joinpath(f'{subType}_{TIPNR_XML_OUTPUT_FILENAME}')
+    entry_count = write_XML_file( filepath, 'TIPNR', HEADER_DICT, [('people',people), ('places',places), ('others',others)], comment_lines=xml_lines,
+                                    default=render_packed_references_for_JSON )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Wrote {entry_count:,} entries to {filepath} in {time.time()-start_time:.2f}s.")
     return True
 # end of loadTIPNR.export_xml()
 
@@ -1459,9 +1341,12 @@ def export_xml(subType:str) -> bool:
 def export_verse_index() -> bool:
     """
     Pivot the data to determine which names exist in each verse,
-        and save this in JSON.
+        and save this in JSON and in a memory-mappable binary format (see VerseIndexFile.py)
+        (and optionally in an SQLite database along with the normalised tables).
     """
     vPrint('Quiet', DEBUGGING_THIS_MODULE, f"\nCalculating and exporting index files…")
+    export_file_list = []
+    verse_index_list = [] # For the SQLite database
     subType = 'normalised'
     for dict_name,the_dict in (('people',people), ('places',places), ('others',others), ('all',allEntries)):
         ref_index_dict = defaultdict(list)
@@ -1486,27 +1371,44 @@ def export_verse_index() -> bool:
                     else: TIPNR_index_dict[uniqueNameTIPNR] = FGid
 
         # Save the dicts as JSON files
+        if PACK_VERSE_REFERENCES_FLAG or STORE_VERSE_SETS_FLAG: # our keys are packed integers so convert them back to strings
+            ref_index_dict = { render_verse_key(verseKey):FGids for verseKey,FGids in ref_index_dict.items() }
+        if dict_name != 'all': verse_index_list.append( (dict_name, ref_index_dict) )
         if ref_index_dict:
             filepath = TIPNR_OUTPUT_FOLDERPATH.joinpath(f'{subType}_{dict_name.title()}_verseRef_index.json')
             vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Exporting {len(ref_index_dict):,} verse ref index entries to {filepath}…")
-            with open( filepath, 'wt', encoding='utf-8' ) as outputFile:
-                json.dump( HEADER_DICT | ref_index_dict, outputFile, ensure_ascii=False, indent=2 )
+            export_file_list.append( (filepath, ref_index_dict) )
+            link_count = write_verse_index_file( filepath.with_suffix(f'.{VERSE_INDEX_FILE_EXTENSION}'), ref_index_dict )
+            vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Wrote {link_count:,} verse links to binary {filepath.with_suffix(f'.{VERSE_INDEX_FILE_EXTENSION}')}")
+            if SHARD_VERSE_INDEXES_FLAG:
+                book_count = write_verse_index_shards( filepath.with_suffix(''), ref_index_dict, HEADER_DICT, compact=COMPACT_JSON_FLAG,
+                                                        compression_formats=COMPRESSION_FORMATS if COMPRESS_JSON_FLAG else () )
+                vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Wrote {book_count} book verse ref index files and manifest into {filepath.with_suffix('')}/")
         if TIPNR_index_dict:
             filepath = TIPNR_OUTPUT_FOLDERPATH.joinpath(f'{subType}_{dict_name.title()}_TIPNR_index.json')
             vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Exporting {len(TIPNR_index_dict):,} TIPNR index entries to {filepath}…")
-            with open( filepath, 'wt', encoding='utf-8' ) as outputFile:
-                json.dump( HEADER_DICT | TIPNR_index_dict, outputFile, ensure_ascii=False, indent=2 )
-
+            export_file_list.append( (filepath, TIPNR_index_dict) )
+
+    write_JSON_files( export_file_list, HEADER_DICT, compact=COMPACT_JSON_FLAG,
+                        compression_formats=COMPRESSION_FORMATS if COMPRESS_JSON_FLAG else () )
+    if EXPORT_SQLITE_FLAG:
+        filepath = TIPNR_OUTPUT_FOLDERPATH.joinpath(f'{subType}_TIPNR.{SQLITE_FILE_EXTENSION}')
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Also exporting {subType} tables and verse indexes to {filepath}…")
+        export_SQLite_database( filepath, HEADER_DICT, [(dict_name,the_dict) for dict_name,the_dict in (('people',people), ('places',places), ('others',others)) if the_dict], verse_index_list,
+                                SQLITE_SEARCH_KEYS, SQLITE_INDEXED_COLUMN_NAMES, default=render_packed_references_for_JSON )
     return True
 # end of loadTIPNR.export_verse_index()
 
 
 if __name__ == '__main__':
+
     # from multiprocessing import freeze_support
     # freeze_support() # Multiprocessing support for frozen Windows executables
 
     # Configure basic Bible Organisational System (BOS) set-up
     parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    parser.add_argument( '--resume-from', dest='resume_from', choices=RESUMABLE_STAGE_NAMES, help="resume from the checkpoint saved before this stage of a previous run" )
+    parser.add_argument( '--rebuild', action='store_true', dest='rebuild', default=False, help="rebuild even if the build manifest shows nothing has changed" )
     BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
 
     main()
@@ -48,17 +48,28 @@ from typing import Dict, List, Tuple
 from pathlib import Path
 from datetime import date
 import os
+import time
+import sys
 import logging
-import json
 
 import BibleOrgSysGlobals
 from BibleOrgSysGlobals import fnPrint, vPrint, dPrint
-
-
-LAST_MODIFIED_DATE = '2022-08-11' # by RJH
+from FGidAllocator import FGidAllocator
+from BuildManifest import BuildManifest
+from JSONWriter import COMPRESSION_FORMATS, write_JSON_files, display_compression_report
+from XMLWriter import write_XML_file
+from DerivedFileWriter import display_write_report
+from VerseIndexFile import VERSE_INDEX_FILE_EXTENSION, write_verse_index_file, write_verse_index_shards
+from SQLiteExporter import SQLITE_FILE_EXTENSION, export_SQLite_database
+from StageCheckpoints import STAGE_NAMES, RESUMABLE_STAGE_NAMES, run_stages
+from VerseSet import VerseSet
+from BibleReferences import convert_references, render_verse_key, render_packed_references_for_JSON
+
+
+LAST_MODIFIED_DATE = '2026-10-16' # by RJH
 SHORT_PROGRAM_NAME = "loadTheographicBibleData"
 PROGRAM_NAME = "Load Viz.Bible Theographic Bible Data exported CSV tables"
-PROGRAM_VERSION = '0.23'
+PROGRAM_VERSION = '0.39'
 PROGRAM_NAME_VERSION = f'{SHORT_PROGRAM_NAME} v{PROGRAM_VERSION}'
 
 DEBUGGING_THIS_MODULE = False
@@ -67,6 +78,19 @@ DEBUGGING_THIS_MODULE = False
 SOURCE_DATA_LAST_DOWNLOADED_DATE_STRING = '2022-07-24'
 
 PREFIX_OUR_IDS_FLAG = True
+COMPACT_JSON_FLAG = False # Write the JSON files without indentation or spaces (smaller and quicker, see JSONWriter.py)
+COMPRESS_JSON_FLAG = False # Also write gzip and xz compressed copies of the JSON files (see JSONWriter.py)
+EXPORT_JSON_LINES_FLAG = False # Also export the normalised tables as JSON Lines (one entry per line, see JSONWriter.py)
+EXPORT_SQLITE_FLAG = False # Also export the normalised tables and verse indexes into an SQLite database (see SQLiteExporter.py)
+SHARD_VERSE_INDEXES_FLAG = False # Also split each verse reference index into a JSON file for each book plus a manifest (see VerseIndexFile.py)
+SAVE_CHECKPOINTS_FLAG = True # Pickle our in-memory state before each pipeline stage so can use --resume-from (see StageCheckpoints.py)
+USE_BUILD_MANIFEST_FLAG = True # Skip the run if the loader, inputs, and outputs are unchanged since the last run (see BuildManifest.py)
+PACK_VERSE_REFERENCES_FLAG = False # Store verse reference lists as array('I') of packed verse keys (rendered back to strings on export)
+STORE_VERSE_SETS_FLAG = False # Store verse lists as (sorted, de-duplicated) VerseSets (rendered back to strings on export)
+
+SQLITE_SEARCH_KEYS = { 'names':('name','displayTitle','kjvName','esvName','alsoCalled','aliases','groupName','title'),
+                        'descriptions':('dictText','comment') } # Entry keys for the full-text search columns (see SQLiteExporter.py)
+SQLITE_INDEXED_COLUMN_NAMES = ('name', 'displayTitle', 'TBDPersonLookup', 'TBDPlaceLookup')
 
 # Create a header to go in the data files
 HEADER_DICT = { '__HEADERS__':
@@ -85,29 +109,6 @@ TheographicBibleData_XML_OUTPUT_FILENAME = 'TheographicBibleData.xml'
 TheographicBibleData_XML_OUTPUT_FILEPATH = TheographicBibleData_OUTPUT_FOLDERPATH.joinpath(TheographicBibleData_XML_OUTPUT_FILENAME)
 
 
-OSIS_BOOK_ID_MAP = {
-            1: 'Gen', 2: 'Exod', 3: 'Lev', 4: 'Num', 5: 'Deut',
-            6: 'Josh', 7: 'Judg', 8: 'Ruth', 9: '1Sam', 10: '2Sam',
-            11: '1Kgs', 12: '2Kgs', 13: '1Chr', 14: '2Chr', 15: 'Ezra', 16: 'Neh', 17: 'Esth', 18: 'Job',
-            19: 'Ps', 20: 'Prov', 21: 'Eccl', 22: 'Song', 23: 'Isa', 24: 'Jer', 25: 'Lam',
-            26: 'Ezek', 27: 'Dan', 28: 'Hos', 29: 'Joel', 30: 'Amos', 31: 'Obad',
-            32: 'Jonah', 33: 'Mic', 34: 'Nah', 35: 'Hab', 36: 'Zeph', 37: 'Hag', 38: 'Zech', 39: 'Mal',
-            40: 'Matt', 41: 'Mark', 42: 'Luke', 43: 'John', 44: 'Acts',
-            45: 'Rom', 46: '1Cor', 47: '2Cor', 48: 'Gal', 49: 'Eph', 50: 'Phil', 51: 'Col',
-            52: '1Thess', 53: '2Thess', 54: '1Tim', 55: '2Tim', 56: 'Titus', 57: 'Phlm',
-            58: 'Heb', 59: 'Jas', 60: '1Pet', 61: '2Pet', 62: '1John', 63: '2John', 64: '3John', 65: 'Jude', 66: 'Rev'}
-assert len(OSIS_BOOK_ID_MAP) == 66
-BOS_BOOK_ID_MAP = {
-            1: 'GEN', 2: 'EXO', 3: 'LEV', 4: 'NUM', 5: 'DEU',
-            6: 'JOS', 7: 'JDG', 8: 'RUT', 9: 'SA1', 10: 'SA2',
-            11: 'KI1', 12: 'KI2', 13: 'CH1', 14: 'CH2', 15: 'EZR', 16: 'NEH', 17: 'EST', 18: 'JOB',
-            19: 'PSA', 20: 'PRO', 21: 'ECC', 22: 'SNG', 23: 'ISA', 24: 'JER', 25: 'LAM',
-            26: 'EZK', 27: 'DAN', 28: 'HOS', 29: 'JOL', 30: 'AMO', 31: 'OBA',
-            32: 'JNA', 33: 'MIC', 34: 'NAH', 35: 'HAB', 36: 'ZEP', 37: 'HAG', 38: 'ZEC', 39: 'MAL',
-            40: 'MAT', 41: 'MRK', 42: 'LUK', 43: 'JHN', 44: 'ACT',
-            45: 'ROM', 46: 'CO1', 47: 'CO2', 48: 'GAL', 49: 'EPH', 50: 'PHP', 51: 'COL', 52: 'TH1', 53: 'TH2', 54: '1TI', 55: '2TI', 56: 'TIT', 57: 'PHM',
-            58: 'HEB', 59: 'JAS', 60: 'PE1', 61: 'PE2', 62: 'JN1', 63: 'JN2', 64: 'JN3', 65: 'JDE', 66: 'REV'}
-assert len(BOS_BOOK_ID_MAP) == 66
 
 # IDs are prefixed with these letters before being combined together into allDicts
 PREFIX_MAP = { 'people':'P',
@@ -124,27 +125,76 @@ COLUMN_NAME_REPLACEMENT_MAP = {'personLookup':'TBDPersonLookup', 'personID':'TBD
 
 
 
-def main() -> None:
+def main() -> bool:
     """
+    Runs the full load/clean/FGids/normalise/export pipeline
+        (or the latter part of it if --resume-from was given).
+
+    Returns True if all of the stages succeeded.
     """
     BibleOrgSysGlobals.introduceProgram( __name__, PROGRAM_NAME_VERSION, LAST_MODIFIED_DATE )
 
-    if load_all_TheographicBibleData_data():
-        # if clean_data():
-            export_JSON('raw')
-            # export_xml('raw')
-            if add_FGids():
-                rebuild_dictionaries('FGid')
-                # if DEBUGGING_THIS_MODULE:
-                export_JSON('mid')
-                if normalise_data() and check_data():
-                    rebuild_dictionaries('FGid')
-                    export_JSON('normalised')
-                    export_xml('normalised')
-                    export_verse_index()
+    resume_stage_name = getattr( BibleOrgSysGlobals.commandLineArguments, 'resume_from', None )
+    # We don't use the build manifest when resuming because we haven't reread the inputs
+    build_manifest = get_build_manifest() if USE_BUILD_MANIFEST_FLAG and not resume_stage_name else None
+    if build_manifest is not None and not getattr( BibleOrgSysGlobals.commandLineArguments, 'rebuild', False ) \
+    and build_manifest.is_up_to_date():
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"\nNothing to do: {SHORT_PROGRAM_NAME} and its input and output files are unchanged since the last run." )
+        return True
+
+    if run_stages( sys.modules[__name__], resume_stage_name ):
+        if build_manifest is not None: build_manifest.save()
+        return True
+    return False
 # end of loadTheographicBibleData.main
 
 
+def run_stage( stage_name:str ) -> bool:
+    """
+    Runs one stage of our pipeline (called by StageCheckpoints.run_stages).
+
+    Returns True if the stage succeeded.
+    """
+    fnPrint( DEBUGGING_THIS_MODULE, f"run_stage( {stage_name!r} )" )
+    assert stage_name in STAGE_NAMES
+    if stage_name == 'load':
+        return load_all_TheographicBibleData_data()
+    if stage_name == 'clean':
+        # if not clean_data(): return False
+        export_JSON('raw')
+        # export_xml('raw')
+        return True
+    if stage_name == 'FGids':
+        if not add_FGids(): return False
+        rebuild_dictionaries('FGid')
+        # if DEBUGGING_THIS_MODULE:
+        export_JSON('mid')
+        return True
+    if stage_name == 'normalise':
+        return normalise_data() and check_data()
+    if stage_name == 'export':
+        rebuild_dictionaries('FGid')
+        export_JSON('normalised')
+        export_xml('normalised')
+        export_verse_index()
+        display_compression_report()
+        display_write_report()
+        return True
+# end of loadTheographicBibleData.run_stage
+
+
+def get_build_manifest() -> BuildManifest:
+    """
+    Returns the build manifest for our input files and output folder.
+    """
+    return BuildManifest( sys.modules[__name__], [TheographicBibleData_INPUT_FOLDERPATH.joinpath(get_CSV_filename(name)) for name,_db in DB_LIST], TheographicBibleData_OUTPUT_FOLDERPATH )
+# end of loadTheographicBibleData.get_build_manifest
+
+
+# The module globals that hold our in-memory state (pickled by StageCheckpoints)
+CHECKPOINT_STATE_NAMES = ('prefixed_our_IDs', 'books', 'chapters', 'verses', 'people', 'peopleGroups', 'places',
+                            'periods', 'events', 'easton', 'allEntries',
+                            'people_map', 'peopleGroups_map', 'places_map', 'events_map')
 prefixed_our_IDs = False
 books, chapters, verses = {}, {}, {}
 people, peopleGroups, places = {}, {}, {}
@@ -179,6 +229,14 @@ def load_all_TheographicBibleData_data() -> bool:
 # end of loadTheographicBibleData.load_all_TheographicBibleData_data()
 
 
+def get_CSV_filename( which:str ) -> str:
+    """
+    Returns the filename of the exported Airtable CSV file for the given table.
+    """
+    return f'{which.lower() if which=="Easton" else which}-Grid view.csv'
+# end of loadTheographicBibleData.get_CSV_filename
+
+
 def load_individual_TheographicBibleData_CSV_file(which:str) -> Tuple[List[str],List[Dict[str,str]]]:
     """
     We use the DictReader package for this.
@@ -188,7 +246,7 @@ def load_individual_TheographicBibleData_CSV_file(which:str) -> Tuple[List[str],
     """
     fnPrint(DEBUGGING_THIS_MODULE, "load_individual_TheographicBibleData_CSV_file()")
 
-    csv_filename = f'{which.lower() if which=="Easton" else which}-Grid view.csv'
+    csv_filename = get_CSV_filename( which )
     try_filepath = TheographicBibleData_INPUT_FOLDERPATH.joinpath(csv_filename)
     tries = 1
     while not os.access(try_filepath, os.R_OK):
@@ -276,7 +334,7 @@ def add_FGids() -> bool:
                                 for item in column_header_list]
 
         new_data_dict = {}
-        name_list = []
+        allocator = FGidAllocator( dict_name )
         for j1,entry_dict in enumerate(data_row_list):
             # dPrint('Info', DEBUGGING_THIS_MODULE, f"{dict_name} {j1} {len(entry_dict)}")
             new_entry_dict = {}
@@ -288,18 +346,10 @@ def add_FGids() -> bool:
                     FGid = entry_value # Default to the first field/column in the original table
                     if dict_name == 'people':
                         assert entry_key == 'TBDPersonLookup' # but we won't use that
-                        FGid = entry_dict['name'].replace(' ','_')
-                        assert FGid
-                        name_list.append(FGid)
-                        if name_list.count(FGid) > 1:
-                            FGid = f'{FGid}{name_list.count(FGid)}'
+                        FGid = allocator.allocate( entry_dict['name'].replace(' ','_') )
                     elif dict_name == 'places':
                         assert entry_key == 'TBDPlaceLookup' # but we won't use that
-                        FGid = entry_dict['kjvName'].replace(' ','_')
-                        assert FGid
-                        name_list.append(FGid)
-                        if name_list.count(FGid) > 1:
-                            FGid = f'{FGid}{name_list.count(FGid)}'
+                        FGid = allocator.allocate( entry_dict['kjvName'].replace(' ','_') )
                     elif entry_key == 'osisRef': # in Chapters, Verses
                         FGid = FGid.replace('.', '_', 1).replace('.', ':', 1) # There'll be nothing for the second replace to do in Chapters
                     elif entry_key in ('dictLookup','title','groupName'): # in Easton and Events and PeopleGroups
@@ -312,6 +362,7 @@ def add_FGids() -> bool:
         del the_dict['dataList']
         the_dict['__COLUMN_HEADERS__'] = column_header_list # which has been updated
         the_dict['dataDict'] = new_data_dict
+        if allocator: allocator.report() # Only people and places use the allocator
     # vPrint('Quiet', DEBUGGING_THIS_MODULE, f"{db_count:,} tables loaded from TheographicBibleData CSV files.")
     return True
 # end of loadTheographicBibleData.add_FGids()
@@ -532,44 +583,13 @@ def adjust_Bible_references(dataName:str, dataDict:dict) -> bool:
         # dPrint( 'Normal', DEBUGGING_THIS_MODULE, f"{value}")
         if key == '__COLUMN_HEADERS__':
             continue
-        # for name_data in value['names']:
-        #     for j,ref_string in enumerate(name_data['individualVerseReferences']):
-        #         name_data['individualVerseReferences'][j] = adjust_Bible_reference(ref_string)
         if 'verses' in value:
-            for j,ref_string in enumerate(value['verses']):
-                # dPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"{j} {ref_string=}")
-                value['verses'][j] = adjust_Bible_reference(ref_string)
+            value['verses'] = VerseSet( convert_references( value['verses'], 'OSIS', packed=True ) ) if STORE_VERSE_SETS_FLAG \
+                        else convert_references( value['verses'], 'OSIS', packed=PACK_VERSE_REFERENCES_FLAG )
 
     return True
 # end of loadTheographicBibleData.adjust_Bible_references()
 
-def adjust_Bible_reference(ref:str) -> str:
-    """
-    Change an OSIS Bible reference like '2Chr.1.14' to 'CH2_1:14'
-    """
-    assert len(ref) >= 6 # Uu.c.v
-    assert ';' not in ref
-    assert ':' not in ref
-    assert ' ' not in ref
-    assert ref.count('.') == 2
-    adjRef = ref.replace('.','_',1).replace('.',':',1)
-
-    pre = post = ''
-    # if adjRef[0] in '([' and adjRef[-1] in '])':
-    #     pre = adjRef[0]
-    #     post = adjRef[-1]
-    #     adjRef = adjRef[1:-1]
-
-    osisBookCode, rest = adjRef.split('_')
-    c, v = rest.split( ':' )
-    assert c.isdigit()
-    assert v.isdigit()
-
-    ix = list(OSIS_BOOK_ID_MAP.values()).index(osisBookCode) + 1
-    adjRef = f'{pre}{BOS_BOOK_ID_MAP[ix]}_{rest}{post}'
-    # print(f"Converted '{ref}' to '{adjRef}'")
-    return adjRef
-# end of loadTheographicBibleData.adjust_Bible_reference
 
 
 def ensure_best_known_name(dataName:str, dataDict:dict) -> bool:
@@ -788,6 +808,7 @@ def export_JSON(subType:str) -> bool:
     """
     assert subType
     vPrint('Quiet', DEBUGGING_THIS_MODULE, f"\nExporting {subType} JSON TheographicBibleData files…")
+    export_file_list = []
 
     for dict_name,the_dict in ALL_DB_LIST:
         if the_dict:
@@ -799,21 +820,35 @@ def export_JSON(subType:str) -> bool:
             else: data_length = len(the_dict) - 1
             filepath = TheographicBibleData_OUTPUT_FOLDERPATH.joinpath(f'{subType}_{dict_name.title()}.json')
             vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Exporting {data_length:,} {dict_name} to {filepath}…")
-            with open( filepath, 'wt', encoding='utf-8' ) as outputFile:
-                # WARNING: The following code would convert any int keys to str !!!
-                json.dump( HEADER_DICT | the_dict, outputFile, ensure_ascii=False, indent=2 )
-
+            # WARNING: The following code would convert any int keys to str !!!
+            export_file_list.append( (filepath, the_dict) )
+
+    write_JSON_files( export_file_list, HEADER_DICT, compact=COMPACT_JSON_FLAG, default=render_packed_references_for_JSON,
+                        compression_formats=COMPRESSION_FORMATS if COMPRESS_JSON_FLAG else () )
+    if EXPORT_JSON_LINES_FLAG and subType == 'normalised':
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Also exporting {len(export_file_list)} {subType} tables as JSON Lines…")
+        write_JSON_files( [(filepath.with_suffix('.jsonl'), the_dict) for filepath,the_dict in export_file_list], HEADER_DICT,
+                            default=render_packed_references_for_JSON, compression_formats=COMPRESSION_FORMATS if COMPRESS_JSON_FLAG else (),
+                            json_lines=True )
     return True
 # end of loadTheographicBibleData.export_JSON()
 
 
 def export_xml(subType:str) -> bool:
     """
+    Export the dictionaries as a single XML file.
+
+    The entries are written one at a time (see XMLWriter.py) rather than building the whole XML document in memory.
     """
     assert subType
     vPrint('Quiet', DEBUGGING_THIS_MODULE, f"\nExporting {subType} XML TheographicBibleData file…")
 
-    # vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  NOT Wrote {len(xml_lines):,} XML lines.")
+    start_time = time.time()
+    filepath = TheographicBibleData_XML_OUTPUT_FILEPATH if subType == 'normalised' \
+                else TheographicBibleData_OUTPUT_FOLDERPATH.joinpath(f'{subType}_{TheographicBibleData_XML_OUTPUT_FILENAME}')
+    entry_count = write_XML_file( filepath, 'TheographicBibleData', HEADER_DICT, [(dict_name,the_dict) for dict_name,the_dict in DB_LIST if the_dict],
+                                    default=render_packed_references_for_JSON )
+    vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Wrote {entry_count:,} entries to {filepath} in {time.time()-start_time:.2f}s.")
     return True
 # end of loadTheographicBibleData.export_xml()
 
@@ -821,9 +856,12 @@ def export_xml(subType:str) -> bool:
 def export_verse_index() -> bool:
     """
     Pivot the data to determine which names exist in each verse,
-        and save this in JSON.
+        and save this in JSON and in a memory-mappable binary format (see VerseIndexFile.py)
+        (and optionally in an SQLite database along with the normalised tables).
     """
     vPrint('Quiet', DEBUGGING_THIS_MODULE, f"\nCalculating and exporting index files…")
+    export_file_list = []
+    verse_index_list = [] # For the SQLite database
     subType = 'normalised'
     for dict_name,the_dict in ALL_DB_LIST:
         keyName = 'TBDPersonLookup' if dict_name=='people' else 'groupName' if dict_name=='peopleGroups' else 'TBDPlaceLookup' if dict_name=='places' else None
@@ -853,17 +891,31 @@ def export_verse_index() -> bool:
             #         else: TheographicBibleData_index_dict[uniqueNameTheographicBibleData] = FGid
 
         # Save the dicts as JSON files
+        if PACK_VERSE_REFERENCES_FLAG or STORE_VERSE_SETS_FLAG: # our keys are packed integers so convert them back to strings
+            ref_index_dict = { render_verse_key(verseKey):FGids for verseKey,FGids in ref_index_dict.items() }
+        if dict_name != 'all': verse_index_list.append( (dict_name, ref_index_dict) )
         if ref_index_dict:
             filepath = TheographicBibleData_OUTPUT_FOLDERPATH.joinpath(f'{subType}_{dict_name.title()}_verseRef_index.json')
             vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Exporting {len(ref_index_dict):,} verse ref index entries to {filepath}…")
-            with open( filepath, 'wt', encoding='utf-8' ) as outputFile:
-                json.dump( HEADER_DICT | ref_index_dict, outputFile, ensure_ascii=False, indent=2 )
+            export_file_list.append( (filepath, ref_index_dict) )
+            link_count = write_verse_index_file( filepath.with_suffix(f'.{VERSE_INDEX_FILE_EXTENSION}'), ref_index_dict )
+            vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Wrote {link_count:,} verse links to binary {filepath.with_suffix(f'.{VERSE_INDEX_FILE_EXTENSION}')}")
+            if SHARD_VERSE_INDEXES_FLAG:
+                book_count = write_verse_index_shards( filepath.with_suffix(''), ref_index_dict, HEADER_DICT, compact=COMPACT_JSON_FLAG,
+                                                        compression_formats=COMPRESSION_FORMATS if COMPRESS_JSON_FLAG else () )
+                vPrint( 'Normal', DEBUGGING_THIS_MODULE, f"  Wrote {book_count} book verse ref index files and manifest into {filepath.with_suffix('')}/")
         if TheographicBibleData_index_dict:
             filepath = TheographicBibleData_OUTPUT_FOLDERPATH.joinpath(f'{subType}_{dict_name.title()}_TheographicBibleData_index.json')
             vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Exporting {len(TheographicBibleData_index_dict):,} TheographicBibleData index entries to {filepath}…")
-            with open( filepath, 'wt', encoding='utf-8' ) as outputFile:
-                json.dump( HEADER_DICT | TheographicBibleData_index_dict, outputFile, ensure_ascii=False, indent=2 )
-
+            export_file_list.append( (filepath, TheographicBibleData_index_dict) )
+
+    write_JSON_files( export_file_list, HEADER_DICT, compact=COMPACT_JSON_FLAG,
+                        compression_formats=COMPRESSION_FORMATS if COMPRESS_JSON_FLAG else () )
+    if EXPORT_SQLITE_FLAG:
+        filepath = TheographicBibleData_OUTPUT_FOLDERPATH.joinpath(f'{subType}_TheographicBibleData.{SQLITE_FILE_EXTENSION}')
+        vPrint( 'Quiet', DEBUGGING_THIS_MODULE, f"  Also exporting {subType} tables and verse indexes to {filepath}…")
+        export_SQLite_database( filepath, HEADER_DICT, [(dict_name,the_dict) for dict_name,the_dict in DB_LIST if the_dict], verse_index_list,
+                                SQLITE_SEARCH_KEYS, SQLITE_INDEXED_COLUMN_NAMES, default=render_packed_references_for_JSON )
     return True
 # end of loadTheographicBibleData.export_verse_index()
 
@@ -874,6 +926,8 @@ if __name__ == '__main__':
 
     # Configure basic Bible Organisational System (BOS) set-up
     parser = BibleOrgSysGlobals.setup( SHORT_PROGRAM_NAME, PROGRAM_VERSION, LAST_MODIFIED_DATE )
+    parser.add_argument( '--resume-from', dest='resume_from', choices=RESUMABLE_STAGE_NAMES, help="resume from the checkpoint saved before this stage of a previous run" )
+    parser.add_argument( '--rebuild', action='store_true', dest='rebuild', default=False, help="rebuild even if the build manifest shows nothing has changed" )
     BibleOrgSysGlobals.addStandardOptionsAndProcess( parser )
 
     main()